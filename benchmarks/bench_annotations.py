@@ -0,0 +1,145 @@
+"""Benchmarks of annotation conversions and midi loading"""
+
+import numpy as np
+
+from mirdata import annotations, io
+
+from .common import MAESTRO_MIDI
+
+
+def _times(n_frames, hop=0.01):
+    return np.arange(n_frames) * hop
+
+
+def _note_data(n_notes, seed=0):
+    rng = np.random.RandomState(seed)
+    starts = np.sort(rng.uniform(0, 0.25 * n_notes, n_notes))
+    durations = rng.uniform(0.05, 2.0, n_notes)
+    intervals = np.stack([starts, starts + durations], axis=1)
+    pitches = rng.uniform(40, 1000, n_notes)
+    confidence = rng.uniform(0, 1, n_notes)
+    return annotations.NoteData(intervals, "s", pitches, "hz", confidence, "likelihood")
+
+
+def _multif0_data(n_frames, max_voices=4, seed=0):
+    rng = np.random.RandomState(seed)
+    times = _times(n_frames)
+    n_voices = rng.randint(0, max_voices + 1, n_frames)
+    frequency_list = [list(rng.uniform(40, 1000, n)) for n in n_voices]
+    confidence_list = [list(rng.uniform(0, 1, n)) for n in n_voices]
+    return annotations.MultiF0Data(
+        times, "s", frequency_list, "hz", confidence_list, "likelihood"
+    )
+
+
+def _f0_data(n_frames, seed=0):
+    rng = np.random.RandomState(seed)
+    times = _times(n_frames)
+    frequencies = rng.uniform(40, 1000, n_frames)
+    voicing = rng.uniform(0, 1, n_frames)
+    return annotations.F0Data(times, "s", frequencies, "hz", voicing, "likelihood")
+
+
+# log-spaced frequency bins, 3 bins per semitone between 32.7 and 2093 Hz
+FREQUENCY_SCALE = 32.7 * 2.0 ** (np.arange(216) / 36.0)
+
+
+class NoteDataSuite(object):
+    """Converting note annotations to time-frequency representations"""
+
+    # the unvectorized implementations take several seconds per call
+    timeout = 600
+    params = [500, 5000]
+    param_names = ["n_notes"]
+
+    def setup(self, n_notes):
+        self.notes = _note_data(n_notes)
+        self.other_notes = _note_data(n_notes, seed=1)
+        self.frame_times = _times(int(np.ceil(self.notes.intervals.max() / 0.01)) + 1)
+
+    def time_to_sparse_index(self, n_notes):
+        self.notes.to_sparse_index(
+            self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood"
+        )
+
+    def time_to_matrix(self, n_notes):
+        self.notes.to_matrix(self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood")
+
+    def time_to_multif0(self, n_notes):
+        self.notes.to_multif0(0.01, "s")
+
+    def time_add(self, n_notes):
+        self.notes + self.other_notes
+
+
+class MultiF0DataSuite(object):
+    """Resampling, combining and converting multif0 annotations"""
+
+    params = [1000, 30000]
+    param_names = ["n_frames"]
+
+    def setup(self, n_frames):
+        self.multif0 = _multif0_data(n_frames)
+        self.other_multif0 = _multif0_data(n_frames, seed=1)
+        self.times_new = _times(n_frames // 2, hop=0.02)
+        self.frame_times = _times(n_frames)
+
+    def time_resample(self, n_frames):
+        self.multif0.resample(self.times_new, "s")
+
+    def time_add(self, n_frames):
+        self.multif0 + self.other_multif0
+
+    def time_to_sparse_index(self, n_frames):
+        self.multif0.to_sparse_index(
+            self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood"
+        )
+
+    def time_to_matrix(self, n_frames):
+        self.multif0.to_matrix(
+            self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood"
+        )
+
+    def peakmem_to_matrix(self, n_frames):
+        self.multif0.to_matrix(
+            self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood"
+        )
+
+
+class F0DataSuite(object):
+    """Resampling and converting f0 annotations"""
+
+    params = [1000, 30000]
+    param_names = ["n_frames"]
+
+    def setup(self, n_frames):
+        self.f0 = _f0_data(n_frames)
+        self.times_new = _times(n_frames // 2, hop=0.02)
+        self.frame_times = _times(n_frames)
+
+    def time_resample(self, n_frames):
+        self.f0.resample(self.times_new, "s")
+
+    def time_to_matrix(self, n_frames):
+        self.f0.to_matrix(self.frame_times, "s", FREQUENCY_SCALE, "hz", "likelihood")
+
+    def time_to_multif0(self, n_frames):
+        self.f0.to_multif0()
+
+
+class MidiSuite(object):
+    """Loading annotations from midi files"""
+
+    # the unvectorized implementations take several seconds per call
+    timeout = 600
+    params = [False, True]
+    param_names = ["pitch_bend"]
+
+    def setup(self, pitch_bend):
+        self.midi = io.load_midi(MAESTRO_MIDI)
+
+    def time_load_multif0_from_midi(self, pitch_bend):
+        io.load_multif0_from_midi(midi=self.midi, pitch_bend=pitch_bend)
+
+    def time_load_multif0_from_midi_file(self, pitch_bend):
+        io.load_multif0_from_midi(MAESTRO_MIDI, pitch_bend=pitch_bend)
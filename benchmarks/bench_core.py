@@ -0,0 +1,149 @@
+"""Benchmarks of index loading, track creation, validation and mixing"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from mirdata import core
+
+from .common import (
+    BEATLES_INDEX,
+    beatles_dataset,
+    copy_beatles_home,
+    write_synthetic_index,
+)
+
+
+class IndexSuite(object):
+    """Loading an index and creating its tracks"""
+
+    params = [1000, 20000]
+    param_names = ["n_tracks"]
+
+    def setup(self, n_tracks):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.dataset = beatles_dataset(
+            self.tmp_dir,
+            write_synthetic_index(
+                BEATLES_INDEX, n_tracks, os.path.join(self.tmp_dir, "index.json")
+            ),
+        )
+        self.binary_dataset = beatles_dataset(
+            self.tmp_dir,
+            write_synthetic_index(
+                BEATLES_INDEX, n_tracks, os.path.join(self.tmp_dir, "binary.json")
+            ),
+        )
+        self.binary_dataset.build_binary_index()
+        self.track_ids = self.dataset.track_ids
+
+    def teardown(self, n_tracks):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_index_json(self, n_tracks):
+        self.dataset.__dict__.pop("_index", None)
+        self.dataset._index
+
+    def time_index_binary(self, n_tracks):
+        self.binary_dataset.__dict__.pop("_index", None)
+        self.binary_dataset._index
+
+    def time_load_tracks(self, n_tracks):
+        self.dataset.load_tracks()
+
+    def time_load_tracks_lazy(self, n_tracks):
+        tracks = self.dataset.load_tracks(lazy=True)
+        for track_id in self.track_ids[:100]:
+            tracks[track_id]
+
+    def time_track(self, n_tracks):
+        for track_id in self.track_ids[:100]:
+            self.dataset.track(track_id)
+
+    def peakmem_load_tracks(self, n_tracks):
+        self.dataset.load_tracks()
+
+
+class ValidateSuite(object):
+    """Validating the files of a dataset"""
+
+    params = ["full", "exists"]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        self.tmp_dir = tempfile.mkdtemp()
+        data_home = copy_beatles_home(self.tmp_dir)
+        index_path = write_synthetic_index(
+            BEATLES_INDEX, 200, os.path.join(self.tmp_dir, "index.json")
+        )
+        self.dataset = beatles_dataset(data_home, index_path)
+
+    def teardown(self, mode):
+        shutil.rmtree(self.tmp_dir)
+
+    def time_validate(self, mode):
+        self.dataset.validate(verbose=False, mode=mode, full=True)
+
+    def time_validate_cached(self, mode):
+        # checksums are cached after the first validation
+        self.dataset.validate(
+            verbose=False,
+            mode=mode,
+            checksum_cache=os.path.join(self.tmp_dir, "checksums"),
+        )
+
+
+# audio of the synthetic tracks, generated once so that only mixing is timed
+_AUDIO = {}
+
+
+class _SyntheticTrack(core.Track):
+    def __init__(
+        self, track_id, data_home="foo", dataset_name="foo", index=None, metadata=None
+    ):
+        self.track_id = track_id
+        self._track_paths = {}
+
+    @property
+    def audio(self):
+        return _AUDIO[self.track_id], 44100
+
+
+class _SyntheticMultiTrack(core.MultiTrack):
+    @property
+    def track_audio_property(self):
+        return "audio"
+
+
+class MultiTrackSuite(object):
+    """Mixing the tracks of a multitrack"""
+
+    params = [[4, 16], [True, False]]
+    param_names = ["n_tracks", "enforce_length"]
+
+    def setup(self, n_tracks, enforce_length):
+        rng = np.random.RandomState(0)
+        track_ids = ["track_{}".format(i) for i in range(n_tracks)]
+        for i, track_id in enumerate(track_ids):
+            # 10 seconds of stereo audio, of unequal lengths if padding is benchmarked
+            n_samples = 441000 - (0 if enforce_length else 100 * i)
+            _AUDIO[track_id] = rng.uniform(-1, 1, (2, n_samples))
+        index = {"multitracks": {"mtrack": {"tracks": track_ids}}}
+        self.mtrack = _SyntheticMultiTrack(
+            "mtrack", "foo", "foo", index, _SyntheticTrack, lambda: None
+        )
+        self.track_ids = track_ids
+
+    def time_get_target(self, n_tracks, enforce_length):
+        self.mtrack.get_target(self.track_ids, enforce_length=enforce_length)
+
+    def time_get_target_weighted(self, n_tracks, enforce_length):
+        weights = np.linspace(0.5, 1.0, len(self.track_ids))
+        self.mtrack.get_target(
+            self.track_ids,
+            weights=weights,
+            average=False,
+            enforce_length=enforce_length,
+        )
@@ -0,0 +1,16 @@
+"""Benchmarks of import time, each measured in a fresh interpreter"""
+
+
+def timeraw_import_mirdata():
+    return "import mirdata"
+
+
+def timeraw_import_io():
+    return "import mirdata.io"
+
+
+def timeraw_initialize():
+    return """
+import mirdata
+mirdata.initialize("beatles")
+"""
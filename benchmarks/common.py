@@ -0,0 +1,92 @@
+"""Shared helpers for the mirdata benchmarks
+
+Benchmarks read the sample indexes and test resources from the repository's
+``tests`` folder, so they can run against an installed mirdata (as asv does)
+without downloading any dataset.
+
+"""
+
+import json
+import os
+import shutil
+
+from mirdata import core
+from mirdata.datasets import beatles
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_INDEXES = os.path.join(REPO_DIR, "tests", "indexes")
+TEST_RESOURCES = os.path.join(REPO_DIR, "tests", "resources")
+
+BEATLES_INDEX = os.path.join(TEST_INDEXES, "beatles_index_1.2_sample.json")
+BEATLES_HOME = os.path.join(TEST_RESOURCES, "mir_datasets", "beatles")
+MAESTRO_MIDI = os.path.join(
+    TEST_RESOURCES,
+    "mir_datasets",
+    "maestro",
+    "2018",
+    "MIDI-Unprocessed_Chamber3_MID--AUDIO_10_R3_2018_wav--1.midi",
+)
+
+
+def write_synthetic_index(sample_index_path, n_tracks, index_path):
+    """Write an index with n_tracks tracks by repeating a sample index's tracks
+
+    Track ids are made unique, file paths are kept, so the tracks of the
+    synthetic index point to the sample's test resources.
+
+    Args:
+        sample_index_path (str): path to a sample index
+        n_tracks (int): number of tracks in the synthetic index
+        index_path (str): path where the synthetic index is written
+
+    Returns:
+        str: index_path
+
+    """
+    with open(sample_index_path) as fhandle:
+        sample_index = json.load(fhandle)
+
+    entries = list(sample_index["tracks"].items())
+    tracks = {}
+    for i in range(n_tracks):
+        track_id, entry = entries[i % len(entries)]
+        tracks["{}-{}".format(track_id, i)] = entry
+
+    index = dict(sample_index)
+    index["tracks"] = tracks
+    with open(index_path, "w") as fhandle:
+        json.dump(index, fhandle)
+    return index_path
+
+
+def beatles_dataset(data_home, index_path):
+    """Beatles dataset reading its index from an arbitrary path
+
+    Args:
+        data_home (str): path to the dataset's files
+        index_path (str): path to the index
+
+    Returns:
+        beatles.Dataset: the dataset
+
+    """
+    dataset = beatles.Dataset(data_home, version="test")
+    dataset._index_data = core.Index(os.path.basename(index_path))
+    dataset._index_data.indexes_dir = os.path.dirname(index_path)
+    dataset.index_path = index_path
+    return dataset
+
+
+def copy_beatles_home(tmp_dir):
+    """Copy the beatles test resources, so benchmarks may write to data_home
+
+    Args:
+        tmp_dir (str): directory where the resources are copied
+
+    Returns:
+        str: path to the copied data_home
+
+    """
+    data_home = os.path.join(tmp_dir, "beatles")
+    shutil.copytree(BEATLES_HOME, data_home)
+    return data_home
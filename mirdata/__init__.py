@@ -1,15 +1,73 @@
 import importlib
-import os
-import pkgutil
 
 from .version import version as __version__
 
 
+# static registry of the modules in mirdata/datasets, so that listing datasets
+# doesn't scan the filesystem. Keep sorted, and add new loaders here.
 DATASETS = [
-    d.name
-    for d in pkgutil.iter_modules(
-        [os.path.dirname(os.path.abspath(__file__)) + "/datasets"]
-    )
+    "acousticbrainz_genre",
+    "baf",
+    "ballroom",
+    "beatles",
+    "beatport_key",
+    "billboard",
+    "brid",
+    "candombe",
+    "cante100",
+    "cipi",
+    "compmusic_carnatic_rhythm",
+    "compmusic_carnatic_varnam",
+    "compmusic_hindustani_rhythm",
+    "compmusic_indian_tonic",
+    "compmusic_jingju_acappella",
+    "compmusic_otmm_makam",
+    "compmusic_raga",
+    "cuidado",
+    "da_tacos",
+    "dagstuhl_choirset",
+    "dali",
+    "egfxset",
+    "filosax",
+    "fma_keys",
+    "four_way_tabla",
+    "freesound_one_shot_percussive_sounds",
+    "giantsteps_key",
+    "giantsteps_tempo",
+    "good_sounds",
+    "groove_midi",
+    "gtzan_genre",
+    "guitarset",
+    "hainsworth",
+    "haydn_op20",
+    "idmt_smt_audio_effects",
+    "ikala",
+    "irmas",
+    "jtd",
+    "maestro",
+    "mdb_stem_synth",
+    "medley_solos_db",
+    "medleydb_melody",
+    "medleydb_pitch",
+    "mridangam_stroke",
+    "mtg_jamendo_autotagging_moodtheme",
+    "openmic2018",
+    "orchset",
+    "phenicx_anechoic",
+    "queen",
+    "rwc_classical",
+    "rwc_jazz",
+    "rwc_popular",
+    "salami",
+    "saraga_carnatic",
+    "saraga_hindustani",
+    "scms",
+    "simac",
+    "slakh",
+    "tinysol",
+    "tonality_classicaldb",
+    "tonas",
+    "vocadito",
 ]
 
 
@@ -41,7 +99,7 @@ def list_dataset_versions(dataset_name):
     )
 
 
-def initialize(dataset_name, data_home=None, version="default"):
+def initialize(dataset_name, data_home=None, version="default", cache_dir=None):
     """Load a mirdata dataset by name
 
     Example:
@@ -61,6 +119,8 @@ def initialize(dataset_name, data_home=None, version="default"):
             uses the default location.
         version (str or None): which version of the dataset to load.
             If None, the default version is loaded.
+        cache_dir (str or None): if not None, parsed annotations are cached in
+            this directory and reused across processes.
 
     Returns:
         Dataset: a mirdata.core.Dataset object
@@ -71,4 +131,7 @@ def initialize(dataset_name, data_home=None, version="default"):
 
     module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
 
-    return module.Dataset(data_home=data_home, version=version)
+    dataset = module.Dataset(data_home=data_home, version=version)
+    if cache_dir is not None:
+        dataset.set_annotation_cache(cache_dir)
+    return dataset
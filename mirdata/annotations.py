@@ -1,13 +1,17 @@
 """mirdata annotation data types"""
 
+import itertools
 import logging
 import re
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import scipy
+
+from mirdata.lazy_import import lazy_import
+
+librosa = lazy_import("librosa")
+scipy = lazy_import("scipy")
 
 # Regex pattern needed to validate chords and keys
 KEY_MODE_PATTERN = r"^N|([A-G][b#]?)(:(major|minor|ionian|dorian|phrygian|lydian|mixolydian|aeolian|locrian))?$"
@@ -440,20 +444,21 @@ class F0Data(Annotation):
             MultiF0Data: data in multif0 format
 
         """
-        frequency_list = [[f] if f > 0 else [] for f in self.frequencies]
-        confidence_list = (
-            None
-            if self._confidence is None
-            else [
-                [c] if f > 0 else [] for c, f in zip(self._confidence, self.frequencies)
-            ]
-        )
-        return MultiF0Data(
+        # each voiced frame has a single value, unvoiced frames have none
+        voiced = self.frequencies > 0
+        offsets = np.zeros((len(voiced) + 1,), dtype=int)
+        np.cumsum(voiced, out=offsets[1:])
+        return MultiF0Data.from_arrays(
             self.times,
             self.time_unit,
-            frequency_list,
+            self.frequencies[voiced].astype(float),
+            offsets,
             self.frequency_unit,
-            confidence_list,
+            (
+                None
+                if self._confidence is None
+                else self._confidence[voiced].astype(float)
+            ),
             self.confidence_unit,
         )
 
@@ -474,14 +479,29 @@ class F0Data(Annotation):
 class MultiF0Data(Annotation):
     """MultiF0Data class
 
+    Frequencies and confidences are stored in a ragged, array-backed form: the
+    values of all frames are concatenated in ``frequency_values`` (and
+    ``confidence_values``), and the values of frame ``i`` are
+    ``frequency_values[offsets[i]:offsets[i + 1]]``. ``frequency_list`` and
+    ``confidence_list`` are lists of lists of the same values, built on first
+    access and rebuilt after ``frequency_values``, ``offsets`` or
+    ``confidence_values`` are reassigned. Changes made to these lists are not
+    written back to the arrays. Use ``MultiF0Data.from_arrays`` to create an
+    annotation directly from the ragged form.
+
     Attributes:
         times (np.ndarray): array of time stamps (as floats)
             with positive, strictly increasing values
         time_unit (str): time unit, one of TIME_UNITS
         frequency_list (list): list of lists of frequency values (as floats)
         frequency_unit (str): frequency unit, one of PITCH_UNITS
-        confidence_list (np.ndarray or None): list of lists of confidence values
+        confidence_list (list or None): list of lists of confidence values
         confidence_unit (str or None): confidence unit, one of AMPLITUDE_UNITS
+        frequency_values (np.ndarray): frequency values of all frames, concatenated
+        confidence_values (np.ndarray or None): confidence values of all frames,
+            concatenated
+        offsets (np.ndarray): array of len(times) + 1 indexes into
+            frequency_values, where frame i spans offsets[i]:offsets[i + 1]
 
     """
 
@@ -498,44 +518,178 @@ class MultiF0Data(Annotation):
         validate_array_like(frequency_list, list, list)
         validate_array_like(confidence_list, list, list, none_allowed=True)
         validate_lengths_equal([times, frequency_list, confidence_list])
+
+        dtype = None if frequency_unit in ["note_name", "pc"] else float
+        frequency_values, offsets = _flatten_ragged(frequency_list, dtype)
+        confidence_values = None
+        if confidence_list is not None:
+            confidence_values, confidence_offsets = _flatten_ragged(
+                confidence_list, float
+            )
+            if not np.array_equal(offsets, confidence_offsets):
+                raise ValueError(
+                    "frequency_list and confidence_list have frames of unequal length"
+                )
+
+        self._set_values(
+            times,
+            time_unit,
+            frequency_values,
+            offsets,
+            frequency_unit,
+            confidence_values,
+            confidence_unit,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        times,
+        time_unit,
+        frequency_values,
+        offsets,
+        frequency_unit,
+        confidence_values=None,
+        confidence_unit=None,
+    ):
+        """Create a MultiF0Data from its ragged, array-backed form
+
+        Args:
+            times (np.ndarray): array of time stamps (as floats)
+            time_unit (str): time unit, one of TIME_UNITS
+            frequency_values (np.ndarray): frequency values of all frames, concatenated
+            offsets (np.ndarray): array of len(times) + 1 indexes into
+                frequency_values, where frame i spans offsets[i]:offsets[i + 1]
+            frequency_unit (str): frequency unit, one of PITCH_UNITS
+            confidence_values (np.ndarray or None): confidence values of all
+                frames, concatenated
+            confidence_unit (str or None): confidence unit, one of AMPLITUDE_UNITS
+
+        Returns:
+            MultiF0Data: the annotation
+
+        """
+        validate_array_like(times, np.ndarray, float)
+        if frequency_unit in ["note_name", "pc"]:
+            validate_array_like(frequency_values, np.ndarray, None)
+        else:
+            validate_array_like(frequency_values, np.ndarray, float)
+        validate_array_like(confidence_values, np.ndarray, float, none_allowed=True)
+        validate_lengths_equal([frequency_values, confidence_values])
+        offsets = np.asarray(offsets, dtype=int)
+        if (
+            len(offsets) != len(times) + 1
+            or offsets[0] != 0
+            or offsets[-1] != len(frequency_values)
+            or np.any(np.diff(offsets) < 0)
+        ):
+            raise ValueError(
+                "offsets should be non-decreasing, of length len(times) + 1, "
+                + "and go from 0 to len(frequency_values)"
+            )
+
+        multif0 = cls.__new__(cls)
+        multif0._set_values(
+            times,
+            time_unit,
+            frequency_values,
+            offsets,
+            frequency_unit,
+            confidence_values,
+            confidence_unit,
+        )
+        return multif0
+
+    def _set_values(
+        self,
+        times,
+        time_unit,
+        frequency_values,
+        offsets,
+        frequency_unit,
+        confidence_values,
+        confidence_unit,
+    ):
         validate_times(times, time_unit)
         validate_uniform_times(times)
-        validate_pitches(frequency_list, frequency_unit)
-        validate_confidence(confidence_list, confidence_unit)
+        validate_pitches(frequency_values, frequency_unit)
+        validate_confidence(confidence_values, confidence_unit)
 
         self.times = times
         self.time_unit = time_unit
-        self.frequency_list = frequency_list
+        self.frequency_values = frequency_values
+        self.offsets = offsets
         self.frequency_unit = frequency_unit
-        self.confidence_list = confidence_list
+        self.confidence_values = confidence_values
         self.confidence_unit = confidence_unit
 
         self._remove_duplicates()
 
+    @property
+    def frequency_values(self):
+        return self._frequency_values
+
+    @frequency_values.setter
+    def frequency_values(self, frequency_values):
+        self._frequency_values = frequency_values
+        self._frequency_list = None
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    @offsets.setter
+    def offsets(self, offsets):
+        self._offsets = offsets
+        self._frequency_list = None
+        self._confidence_list = None
+
+    @property
+    def confidence_values(self):
+        return self._confidence_values
+
+    @confidence_values.setter
+    def confidence_values(self, confidence_values):
+        self._confidence_values = confidence_values
+        self._confidence_list = None
+
+    @property
+    def frequency_list(self):
+        if self._frequency_list is None:
+            self._frequency_list = _unflatten_ragged(
+                self.frequency_values, self.offsets
+            )
+        return self._frequency_list
+
+    @property
+    def confidence_list(self):
+        if self.confidence_values is None:
+            return None
+        if self._confidence_list is None:
+            self._confidence_list = _unflatten_ragged(
+                self.confidence_values, self.offsets
+            )
+        return self._confidence_list
+
     def _remove_duplicates(self):
-        new_frequency_list = []
-        new_confidence_list = []
-        confidence_list = (
-            [[0 for _ in flist] for flist in self.frequency_list]
-            if self.confidence_list is None
-            else self.confidence_list
-        )
-        for flist, clist in zip(self.frequency_list, confidence_list):
-            tmp_flist = []
-            tmp_clist = []
-            for f, c in zip(flist, clist):
-                if f in tmp_flist:
-                    continue
-                tmp_flist.append(f)
-                tmp_clist.append(c)
-
-            new_frequency_list.append(tmp_flist)
-            new_confidence_list.append(tmp_clist)
-
-        self.frequency_list = new_frequency_list
-        self.confidence_list = (
-            None if self.confidence_list is None else new_confidence_list
+        n_frames = len(self.offsets) - 1
+        frames = np.repeat(np.arange(n_frames), np.diff(self.offsets))
+        # sort by frame, then value, then position: the first value of each
+        # group of repeated values in a frame is kept
+        order = np.lexsort((np.arange(len(frames)), self.frequency_values, frames))
+        duplicate = np.zeros((len(frames),), dtype=bool)
+        duplicate[order[1:]] = (frames[order[1:]] == frames[order[:-1]]) & (
+            self.frequency_values[order[1:]] == self.frequency_values[order[:-1]]
         )
+        if not np.any(duplicate):
+            return
+
+        keep = ~duplicate
+        self.frequency_values = self.frequency_values[keep]
+        if self.confidence_values is not None:
+            self.confidence_values = self.confidence_values[keep]
+        self.offsets = np.zeros((n_frames + 1,), dtype=int)
+        np.cumsum(np.bincount(frames[keep], minlength=n_frames), out=self.offsets[1:])
 
     def __add__(self, other):
         if other is None:
@@ -559,43 +713,53 @@ class MultiF0Data(Annotation):
             this_data = self
             other_data = other_resamp
 
-        this_frequency_list = [[f for f in flist] for flist in this_data.frequency_list]
-        other_frequency_list = convert_pitch_units(
-            other_data.frequency_list, other.frequency_unit, self.frequency_unit
+        # the values of each frame of other_data are appended to this_data's
+        this_index, other_index, offsets = _ragged_concatenate(
+            this_data.offsets, other_data.offsets
+        )
+        frequency_values = _scatter(
+            offsets[-1],
+            this_index,
+            this_data.frequency_values,
+            other_index,
+            convert_pitch_units(
+                other_data.frequency_values, other.frequency_unit, self.frequency_unit
+            ),
         )
 
-        for i, flist in enumerate(other_frequency_list):
-            this_frequency_list[i].extend(flist)
-
-        this_has_confidence = this_data.confidence_list is not None
-        other_has_confidence = other_data.confidence_unit is not None
-        this_confidence_unit = this_data.confidence_unit
+        this_has_confidence = this_data.confidence_values is not None
+        other_has_confidence = other_data.confidence_values is not None
+        confidence_unit = this_data.confidence_unit
         if this_has_confidence and other_has_confidence:
-            this_confidence_list = [
-                [c for c in clist] for clist in this_data.confidence_list
-            ]
-            other_confidence_list = convert_amplitude_units(
-                other_data.confidence_list, other.confidence_unit, self.confidence_unit
+            confidence_values = _scatter(
+                offsets[-1],
+                this_index,
+                this_data.confidence_values,
+                other_index,
+                convert_amplitude_units(
+                    other_data.confidence_values,
+                    other.confidence_unit,
+                    self.confidence_unit,
+                ),
             )
-            for i, clist in enumerate(other_confidence_list):
-                this_confidence_list[i].extend(clist)
         elif not this_has_confidence and not other_has_confidence:
-            this_confidence_list = None
+            confidence_values = None
         else:
             logging.warning(
                 "Adding two MultiF0Data where one has confidence=None "
                 + "and the other does not. The sum will have confidence=None."
             )
-            this_confidence_list = None
-            this_confidence_unit = None
+            confidence_values = None
+            confidence_unit = None
 
-        return MultiF0Data(
+        return MultiF0Data.from_arrays(
             times,
             self.time_unit,
-            this_frequency_list,
+            frequency_values,
+            offsets,
             self.frequency_unit,
-            this_confidence_list,
-            this_confidence_unit,
+            confidence_values,
+            confidence_unit,
         )
 
     def resample(self, times_new, times_new_unit):
@@ -629,27 +793,24 @@ class MultiF0Data(Annotation):
             fill_value=n_times,
         )(times_new)
 
-        # create array of frequencies plus additional empty element at the end for
-        # target time stamps that are out of the interpolation range
-        freq_vals = self.frequency_list + [[]]
-
-        # map interpolated indices back to frequency values
-        frequencies_resampled = [freq_vals[i] for i in new_frequency_index.astype(int)]
-
-        if self.confidence_list is not None:
-            confidence_vals = self.confidence_list + [[]]
-            confidence_resampled = [
-                confidence_vals[i] for i in new_frequency_index.astype(int)
-            ]
-        else:
-            confidence_resampled = None
+        # add an empty frame at the end for target time stamps that are out
+        # of the interpolation range, and gather the values of each new frame
+        offsets = np.append(self.offsets, self.offsets[-1])
+        value_index, offsets_resampled = _ragged_take(
+            offsets, new_frequency_index.astype(int)
+        )
 
-        return MultiF0Data(
+        return MultiF0Data.from_arrays(
             times_new,
             times_new_unit,
-            frequencies_resampled,
+            self.frequency_values[value_index],
+            offsets_resampled,
             self.frequency_unit,
-            confidence_resampled,
+            (
+                None
+                if self.confidence_values is None
+                else self.confidence_values[value_index]
+            ),
             self.confidence_unit,
         )
 
@@ -678,27 +839,21 @@ class MultiF0Data(Annotation):
 
         """
         multif0dat = self.resample(time_scale, time_scale_unit)
-        time_indexes = np.arange(len(time_scale))
 
-        frequencies_flattened = convert_pitch_units(
-            np.array([f for f_list in multif0dat.frequency_list for f in f_list]),
-            self.frequency_unit,
-            frequency_scale_unit,
+        frequencies_flattened = np.array(
+            convert_pitch_units(
+                multif0dat.frequency_values, self.frequency_unit, frequency_scale_unit
+            ),
+            dtype=float,
         )
-        time_indexes_flattened = np.array(
-            [
-                t
-                for (t, f_list) in zip(time_indexes, multif0dat.frequency_list)
-                for f in f_list
-            ]
+        time_indexes_flattened = np.repeat(
+            np.arange(len(time_scale)), np.diff(multif0dat.offsets)
         )
-        if multif0dat.confidence_list is None:
+        if multif0dat.confidence_values is None:
             confidence_flattened = np.ones((len(time_indexes_flattened),))
             conf_unit = "binary"
         else:
-            confidence_flattened = np.array(
-                [c for c_list in multif0dat.confidence_list for c in c_list]
-            )
+            confidence_flattened = multif0dat.confidence_values
             conf_unit = self.confidence_unit
 
         # get frequency indexes in matrix
@@ -714,27 +869,13 @@ class MultiF0Data(Annotation):
         )
 
         # create sparse index
-        index = [
-            (t, f)
-            for t, f in zip(
-                time_indexes_flattened[nonzero_freqs], freq_indexes[nonzero_freqs]
-            )
-            if t != -1 and f != -1
-        ]
-        confidence_out = np.array(
-            [
-                c
-                for c, t, f in zip(
-                    confidence_flattened[nonzero_freqs],
-                    time_indexes_flattened[nonzero_freqs],
-                    freq_indexes[nonzero_freqs],
-                )
-                if t != -1 and f != -1
-            ]
-        )
+        keep = nonzero_freqs & (freq_indexes != -1)
+        index = np.stack([time_indexes_flattened[keep], freq_indexes[keep]], axis=1)
         return (
-            np.array(index),
-            convert_amplitude_units(confidence_out, conf_unit, amplitude_unit),
+            index,
+            convert_amplitude_units(
+                confidence_flattened[keep], conf_unit, amplitude_unit
+            ),
         )
 
     def to_matrix(
@@ -777,10 +918,10 @@ class MultiF0Data(Annotation):
             * frequency_list (list): list of np.array of frequency values in Hz
         """
         times = convert_time_units(self.times, self.time_unit, "s")
-        frequency_list = [
-            convert_pitch_units(np.array(flist), self.frequency_unit, "hz")
-            for flist in self.frequency_list
-        ]
+        frequencies = convert_pitch_units(
+            self.frequency_values, self.frequency_unit, "hz"
+        )
+        frequency_list = np.split(np.asarray(frequencies), self.offsets[1:-1])
         return times, frequency_list
 
 
@@ -937,32 +1078,31 @@ class NoteData(Annotation):
             np.log(freqs_hz)[:, np.newaxis], np.log(frequency_scale)[:, np.newaxis]
         )
         if onsets_only:
-            onset_index = []
-            confidences = []
-            for t0, f, c in zip(time_index_0, freq_indexes, confidence):
-                if t0 == -1 or f == -1:
-                    continue
-                onset_index.append([t0, f])
-                confidences.append(c)
-            return np.array(onset_index), np.array(confidences)
+            keep = (time_index_0 != -1) & (freq_indexes != -1)
+            return (
+                np.stack([time_index_0[keep], freq_indexes[keep]], axis=1),
+                confidence[keep],
+            )
 
         time_index_1 = closest_index(
             intervals[:, 1, np.newaxis], time_scale[:, np.newaxis]
         )
         max_idx = len(time_scale) - 1
-        sparse_index = []
-        confidences = []
-        for t0, t1, f, c in zip(time_index_0, time_index_1, freq_indexes, confidence):
-            if f == -1 or (t0 == -1 and t1 == -1):
-                continue
-
-            t_start = max([t0, 0])
-            t_end = (t1 if t1 != -1 else max_idx) + 1
-
-            sparse_index.extend([[t, f] for t in range(t_start, t_end)])
-            confidences.extend([c for _ in range(t_start, t_end)])
-
-        return np.array(sparse_index), np.array(confidences)
+        keep = (freq_indexes != -1) & ((time_index_0 != -1) | (time_index_1 != -1))
+        t_start = np.maximum(time_index_0[keep], 0)
+        t_end = np.where(time_index_1[keep] != -1, time_index_1[keep], max_idx) + 1
+        n_frames = np.maximum(t_end - t_start, 0)
+
+        # expand each note into one index per frame, without a python loop:
+        # frame k of a note is t_start + (k - position of the note's first frame)
+        note_offsets = np.cumsum(n_frames) - n_frames
+        times = np.repeat(t_start - note_offsets, n_frames) + np.arange(
+            np.sum(n_frames)
+        )
+        sparse_index = np.stack(
+            [times, np.repeat(freq_indexes[keep], n_frames)], axis=1
+        )
+        return sparse_index, np.repeat(confidence[keep], n_frames)
 
     def to_matrix(
         self,
@@ -972,7 +1112,8 @@ class NoteData(Annotation):
         frequency_scale_unit: str,
         amplitude_unit: str = "binary",
         onsets_only: bool = False,
-    ) -> np.ndarray:
+        sparse: bool = False,
+    ) -> Union[np.ndarray, "scipy.sparse.csr_matrix"]:
         """Convert f0 data to a matrix (piano roll) defined by a time and frequency scale
 
         Args:
@@ -982,9 +1123,11 @@ class NoteData(Annotation):
             frequency_scale_unit (str): units for frequency scale values, one of PITCH_UNITS
             onsets_only (bool, optional): If True, returns an onset piano roll.
                 Defaults to False.
+            sparse (bool, optional): If True, returns a scipy.sparse.csr_matrix
+                instead of a dense array. Defaults to False.
 
         Returns:
-            np.ndarray: 2D matrix of shape len(time_scale) x len(frequency_scale)
+            np.ndarray or scipy.sparse.csr_matrix: 2D matrix of shape len(time_scale) x len(frequency_scale)
         """
         index, voicing = self.to_sparse_index(
             time_scale,
@@ -994,7 +1137,10 @@ class NoteData(Annotation):
             amplitude_unit,
             onsets_only,
         )
-        matrix = np.zeros((len(time_scale), len(frequency_scale)))
+        shape = (len(time_scale), len(frequency_scale))
+        if sparse:
+            return sparse_matrix(index, voicing, shape)
+        matrix = np.zeros(shape)
         matrix[index[:, 0], index[:, 1]] = voicing
         return matrix
 
@@ -1026,30 +1172,30 @@ class NoteData(Annotation):
                 )
             )
         times = np.arange(0, max_time + time_hop, time_hop)
-        frequency_list: List[List[float]] = [[] for _ in times]
-        confidence_list: List[List[float]] = [[] for _ in times]
-        if self.confidence is not None:
-            for t0, t1, pch, conf in zip(
-                intervals[:, 0], intervals[:, 1], self.pitches, self.confidence
-            ):
-                for i in range(
-                    int(np.round(t0 / time_hop)), int(np.round(t1 / time_hop)) + 1
-                ):
-                    frequency_list[i].append(pch)
-                    confidence_list[i].append(conf)
-        else:
-            for t0, t1, pch in zip(intervals[:, 0], intervals[:, 1], self.pitches):
-                for i in range(
-                    int(np.round(t0 / time_hop)), int(np.round(t1 / time_hop)) + 1
-                ):
-                    frequency_list[i].append(pch)
 
-        return MultiF0Data(
+        # frame indexes spanned by each note, grouped by frame in note order
+        starts = np.round(intervals[:, 0] / time_hop).astype(int)
+        lengths = np.round(intervals[:, 1] / time_hop).astype(int) - starts + 1
+        note_index = np.repeat(np.arange(len(lengths)), lengths)
+        frame_index = (
+            np.arange(len(note_index))
+            - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            + starts[note_index]
+        )
+        order, offsets = _group_by_row(frame_index, len(times))
+        note_index = note_index[order]
+
+        return MultiF0Data.from_arrays(
             times,
             time_hop_unit,
-            frequency_list,
+            self.pitches[note_index],
+            offsets,
             self.pitch_unit,
-            None if self.confidence is None else confidence_list,
+            (
+                None
+                if self.confidence is None
+                else self.confidence[note_index].astype(float)
+            ),
             self.confidence_unit,
         )
 
@@ -1385,19 +1531,188 @@ def convert_amplitude_units(amplitude, amplitude_unit, target_amplitude_unit):
         )
 
 
+def _flatten_ragged(ragged_list, dtype=None):
+    """Convert a list of lists into its ragged, array-backed form
+
+    Args:
+        ragged_list (list): list of lists of values
+        dtype (type or None): dtype of the values array. If None, it is inferred
+
+    Returns:
+        * np.ndarray - the values of all lists, concatenated
+        * np.ndarray - array of len(ragged_list) + 1 offsets into the values
+
+    """
+    lengths = np.fromiter(
+        (len(values) for values in ragged_list), dtype=int, count=len(ragged_list)
+    )
+    offsets = np.zeros((len(lengths) + 1,), dtype=int)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.array(list(itertools.chain.from_iterable(ragged_list)), dtype=dtype)
+    if len(values) == 0:
+        values = np.zeros((0,), dtype=float if dtype is None else dtype)
+    return values, offsets
+
+
+def _unflatten_ragged(values, offsets):
+    """Convert a ragged, array-backed form into a list of lists
+
+    Args:
+        values (np.ndarray): the values of all lists, concatenated
+        offsets (np.ndarray): offsets of each list into the values
+
+    Returns:
+        list: list of lists of values
+
+    """
+    values = values.tolist()
+    return [
+        values[start:end]
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+
+
+def _ragged_take(offsets, rows):
+    """Select rows of a ragged array, given by its offsets
+
+    Args:
+        offsets (np.ndarray): offsets of each row into the values
+        rows (np.ndarray): indexes of the rows to select, possibly repeated
+
+    Returns:
+        * np.ndarray - indexes into the values of the selected rows' values
+        * np.ndarray - offsets of the selected rows into these values
+
+    """
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    new_offsets = np.zeros((len(rows) + 1,), dtype=int)
+    np.cumsum(lengths, out=new_offsets[1:])
+    value_index = np.repeat(starts - new_offsets[:-1], lengths) + np.arange(
+        new_offsets[-1]
+    )
+    return value_index, new_offsets
+
+
+def _ragged_concatenate(offsets_a, offsets_b):
+    """Concatenate two ragged arrays with the same number of rows, row by row
+
+    Args:
+        offsets_a (np.ndarray): offsets of the first ragged array
+        offsets_b (np.ndarray): offsets of the second ragged array
+
+    Returns:
+        * np.ndarray - position of each value of the first array in the result
+        * np.ndarray - position of each value of the second array in the result
+        * np.ndarray - offsets of the result
+
+    """
+    lengths_a = np.diff(offsets_a)
+    lengths_b = np.diff(offsets_b)
+    offsets = np.zeros((len(lengths_a) + 1,), dtype=int)
+    np.cumsum(lengths_a + lengths_b, out=offsets[1:])
+    index_a = np.repeat(offsets[:-1] - offsets_a[:-1], lengths_a) + np.arange(
+        offsets_a[-1]
+    )
+    index_b = np.repeat(
+        offsets[:-1] + lengths_a - offsets_b[:-1], lengths_b
+    ) + np.arange(offsets_b[-1])
+    return index_a, index_b, offsets
+
+
+def _group_by_row(rows, n_rows):
+    """Group values by row, into a ragged, array-backed form
+
+    Args:
+        rows (np.ndarray): row index of each value
+        n_rows (int): number of rows
+
+    Raises:
+        IndexError: if a row index is not smaller than n_rows
+
+    Returns:
+        * np.ndarray - indexes of the values, sorted by row. Values of the same
+          row keep their original order
+        * np.ndarray - array of n_rows + 1 offsets of each row into the sorted values
+
+    """
+    if len(rows) > 0 and np.max(rows) >= n_rows:
+        raise IndexError("Row index {} out of range".format(np.max(rows)))
+    offsets = np.zeros((n_rows + 1,), dtype=int)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=offsets[1:])
+    return np.argsort(rows, kind="stable"), offsets
+
+
+def _scatter(size, index_a, values_a, index_b, values_b):
+    values = np.empty((size,), dtype=np.result_type(values_a, values_b))
+    values[index_a] = values_a
+    values[index_b] = values_b
+    return values
+
+
+def sparse_matrix(sparse_index, values, shape):
+    """Build a sparse matrix from sparse indexes, as returned by ``to_sparse_index``
+
+    As when assigning to a dense matrix, if an index is repeated the last of its
+    values is kept.
+
+    Args:
+        sparse_index (np.ndarray): (n x 2) array of (row, column) indexes
+        values (np.ndarray): array of n values
+        shape (tuple): shape of the matrix
+
+    Returns:
+        scipy.sparse.csr_matrix: the matrix
+    """
+    sparse_index = np.asarray(sparse_index, dtype=int).reshape(-1, 2)
+    values = np.asarray(values, dtype=float)
+    flat_index = sparse_index[:, 0] * shape[1] + sparse_index[:, 1]
+    # position of the last occurrence of each index
+    _, last = np.unique(flat_index[::-1], return_index=True)
+    last = len(flat_index) - 1 - last
+    matrix = scipy.sparse.csr_matrix(
+        (values[last], (sparse_index[last, 0], sparse_index[last, 1])), shape=shape
+    )
+    matrix.eliminate_zeros()
+    return matrix
+
+
 def closest_index(input_array, target_array):
     """Get array of indices of target_array that are closest to the input_array
 
+    Values outside of the range of target_array get the index -1. If two
+    targets are equally close, the one with the lower index is returned.
+
     Args:
-        input_array (np.ndarray): (n x 2) array of input values
-        target_array (np.ndarray): (m x 2) array of target values)
+        input_array (np.ndarray): (n x 1) array of input values
+        target_array (np.ndarray): (m x 1) array of target values
 
     Returns:
-        np.ndarray: array of shape (n x 1) of indexes into target_array
+        np.ndarray: array of shape (n,) of indexes into target_array
     """
-    indexes = np.argmin(scipy.spatial.distance.cdist(input_array, target_array), axis=1)
-    indexes[input_array[:, 0] > np.max(target_array[:, 0])] = -1
-    indexes[input_array[:, 0] < np.min(target_array[:, 0])] = -1
+    values = np.asarray(input_array)[:, 0]
+    targets = np.asarray(target_array)[:, 0]
+    order = np.argsort(targets, kind="stable")
+    sorted_targets = targets[order]
+
+    if len(targets) == 1:
+        indexes = np.zeros(values.shape, dtype=int)
+    else:
+        # neighbours of each value in the sorted targets, in O(n log m)
+        right = np.clip(
+            np.searchsorted(sorted_targets, values), 1, len(sorted_targets) - 1
+        )
+        # among repeated targets, use the first one
+        left = np.searchsorted(sorted_targets, sorted_targets[right - 1])
+        left_distance = np.abs(values - sorted_targets[left])
+        right_distance = np.abs(sorted_targets[right] - values)
+        use_left = (left_distance < right_distance) | (
+            (left_distance == right_distance) & (order[left] < order[right])
+        )
+        indexes = order[np.where(use_left, left, right)]
+
+    indexes[values > sorted_targets[-1]] = -1
+    indexes[values < sorted_targets[0]] = -1
 
     return indexes
 
@@ -1453,7 +1768,11 @@ def validate_array_like(
             f"Array should have dtype {expected_dtype} but has {array_like.dtype}"
         )
 
-    if np.asarray(array_like, dtype=object).size == 0:
+    if isinstance(array_like, np.ndarray):
+        size = array_like.size
+    else:
+        size = np.asarray(array_like, dtype=object).size
+    if size == 0:
         raise ValueError("Object should not be empty, use None instead")
 
 
@@ -1561,33 +1880,35 @@ def validate_confidence(confidence, confidence_unit):
         return
 
     validate_unit(confidence_unit, AMPLITUDE_UNITS)
-    if isinstance(confidence[0], list):
-        confidence_flat = [c for subconf in confidence for c in subconf]
+    if len(confidence) > 0 and isinstance(confidence[0], list):
+        confidence_flat = np.array([c for subconf in confidence for c in subconf])
     else:
-        confidence_flat = confidence
+        confidence_flat = np.asarray(confidence)
 
     if confidence_unit == "likelihood" and (
-        any([c < 0 for c in confidence_flat]) or any([c > 1 for c in confidence_flat])
+        np.any(confidence_flat < 0) or np.any(confidence_flat > 1)
     ):
         raise ValueError(
             "confidence with unit 'likelihood' should be between 0 and 1. "
             + "Found values outside [0, 1]."
         )
 
-    if confidence_unit == "energy" and any([c < 0 for c in confidence_flat]):
+    if confidence_unit == "energy" and np.any(confidence_flat < 0):
         raise ValueError(
             "confidence with unit 'energy' should be nonnegative. "
             + "Found negative values."
         )
 
-    if confidence_unit == "binary" and any([c not in [0, 1] for c in confidence_flat]):
+    if confidence_unit == "binary" and np.any(
+        (confidence_flat != 0) & (confidence_flat != 1)
+    ):
         raise ValueError(
             "confidence with unit 'binary' should only have values of 0 or 1. "
             + "Found non-binary values."
         )
 
     if confidence_unit == "velocity" and (
-        any([c < 0 for c in confidence_flat]) or any([c > 127 for c in confidence_flat])
+        np.any(confidence_flat < 0) or np.any(confidence_flat > 127)
     ):
         raise ValueError(
             "confidence with unit 'velocity' should be between 0 and 127. "
@@ -1639,16 +1960,20 @@ def validate_pitches(pitches, pitch_unit):
 
     """
     validate_unit(pitch_unit, PITCH_UNITS)
-    if pitch_unit in ["hz", "midi"] and np.any(
-        [np.any(np.array(p) < 0) for p in pitches]
-    ):
+    if isinstance(pitches, np.ndarray) and pitches.dtype.kind in "iuf":
+        # numeric arrays are checked at once, rather than value by value
+        pitch_arrays = [pitches]
+    else:
+        pitch_arrays = [np.array(p) for p in pitches]
+
+    if pitch_unit in ["hz", "midi"] and np.any([np.any(p < 0) for p in pitch_arrays]):
         raise ValueError(
             "pitches should be positive numbers. "
             + "Unvoiced frames should be indicated using the confidence field, "
             + "rather than negative pitch values."
         )
 
-    if pitch_unit == "midi" and np.any([np.any(np.array(p) > 127) for p in pitches]):
+    if pitch_unit == "midi" and np.any([np.any(p > 127) for p in pitch_arrays]):
         raise ValueError("pitches in midi format cannot be larger than 127. ")
 
     if pitch_unit in ["pc", "note_name"]:
@@ -0,0 +1,294 @@
+"""Compact, memory-mapped on-disk format for mirdata indexes
+
+A binary index is produced once from a JSON index with ``write_binary_index``
+and is memory-mapped at load time with ``load_binary_index``. The ``tracks``
+and ``multitracks`` sections are exposed as read-only mappings which decode a
+single entry per lookup, so checking or fetching a track_id does not require
+building the whole index as Python objects. Because the file is mapped
+read-only, several processes (e.g. data loader workers) share one copy of it
+in the page cache.
+
+File layout (all integers little-endian)::
+
+    magic (8 bytes) | header length (uint64) | header (utf-8 json) | data
+
+For each section, the data block contains a ``\\x00``-separated blob of keys,
+a blob of json-encoded values, int64 offset tables into both blobs and an
+int64 open-addressing hash table mapping crc32(key) to an entry number.
+
+"""
+
+import collections.abc
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"MIRIDX\x00\x01"
+SECTIONS = ["tracks", "multitracks"]
+
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+
+def _pad(length):
+    return (-length) % _ALIGNMENT
+
+
+def _n_buckets(n_entries):
+    # keep the load factor of the hash table at or below 0.5
+    n_buckets = 1
+    while n_buckets < 2 * n_entries:
+        n_buckets *= 2
+    return n_buckets
+
+
+def _source_signature(json_path):
+    stat = os.stat(json_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _encode_section(section):
+    """Encode one index section into its data blocks
+
+    Args:
+        section (dict): mapping of ids to their index entries
+
+    Returns:
+        * dict - block name to bytes
+        * int - number of hash table buckets
+
+    """
+    keys = []
+    key_offsets = [0]
+    values = []
+    value_offsets = [0]
+    for key, value in section.items():
+        if "\x00" in key:
+            raise ValueError(
+                "Index keys may not contain null characters: {}".format(key)
+            )
+        key_bytes = key.encode("utf-8")
+        value_bytes = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        keys.append(key_bytes)
+        values.append(value_bytes)
+        # keys are separated by a null byte, which is skipped by the offsets
+        key_offsets.append(key_offsets[-1] + len(key_bytes) + 1)
+        value_offsets.append(value_offsets[-1] + len(value_bytes))
+
+    n_buckets = _n_buckets(len(keys))
+    mask = n_buckets - 1
+    buckets = np.full((n_buckets,), -1, dtype="<i8")
+    for entry, key_bytes in enumerate(keys):
+        slot = zlib.crc32(key_bytes) & mask
+        while buckets[slot] >= 0:
+            slot = (slot + 1) & mask
+        buckets[slot] = entry
+
+    blocks = {
+        "keys": b"\x00".join(keys),
+        "key_offsets": np.array(key_offsets, dtype="<i8").tobytes(),
+        "values": b"".join(values),
+        "value_offsets": np.array(value_offsets, dtype="<i8").tobytes(),
+        "buckets": buckets.tobytes(),
+    }
+    return blocks, n_buckets
+
+
+def write_binary_index(json_path, binary_path):
+    """Convert a JSON index into the binary index format
+
+    Args:
+        json_path (str): path to the JSON index
+        binary_path (str): path where the binary index is written
+
+    Returns:
+        str: binary_path
+
+    """
+    with open(json_path, encoding="utf-8") as fhandle:
+        index = json.load(fhandle)
+
+    header = {
+        "source": _source_signature(json_path),
+        "fields": {k: v for k, v in index.items() if k not in SECTIONS},
+        "sections": {},
+    }
+    chunks = []
+    position = 0
+    for name in SECTIONS:
+        if name not in index or index[name] is None:
+            continue
+        blocks, n_buckets = _encode_section(index[name])
+        descriptor = {"n_entries": len(index[name]), "n_buckets": n_buckets}
+        for block_name, block in blocks.items():
+            descriptor[block_name] = [position, len(block)]
+            chunks.append(block + b"\x00" * _pad(len(block)))
+            position += len(block) + _pad(len(block))
+        header["sections"][name] = descriptor
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * _pad(len(MAGIC) + _HEADER_LENGTH.size + len(header_bytes))
+
+    tmp_path = binary_path + ".tmp"
+    with open(tmp_path, "wb") as fhandle:
+        fhandle.write(MAGIC)
+        fhandle.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        fhandle.write(header_bytes)
+        for chunk in chunks:
+            fhandle.write(chunk)
+    os.replace(tmp_path, binary_path)
+    return binary_path
+
+
+def _read_header(fhandle):
+    magic = fhandle.read(len(MAGIC))
+    if magic != MAGIC:
+        raise IOError("{} is not a mirdata binary index".format(fhandle.name))
+    (header_length,) = _HEADER_LENGTH.unpack(fhandle.read(_HEADER_LENGTH.size))
+    header = json.loads(fhandle.read(header_length).decode("utf-8"))
+    return header, len(MAGIC) + _HEADER_LENGTH.size + header_length
+
+
+def is_binary_index_current(binary_path, json_path):
+    """Check if a binary index exists and was built from the current JSON index
+
+    If the JSON index does not exist, any existing binary index is considered
+    current.
+
+    Args:
+        binary_path (str): path to the binary index
+        json_path (str): path to the JSON index it was built from
+
+    Returns:
+        bool: True if the binary index can be used in place of the JSON index
+
+    """
+    if not os.path.exists(binary_path):
+        return False
+    try:
+        with open(binary_path, "rb") as fhandle:
+            header, _ = _read_header(fhandle)
+    except (IOError, ValueError, struct.error):
+        return False
+    if not os.path.exists(json_path):
+        return True
+    return header["source"] == _source_signature(json_path)
+
+
+class BinaryIndexSection(collections.abc.Mapping):
+    """Read-only mapping over one section (e.g. ``tracks``) of a binary index
+
+    Lookups hash the key and decode only the matching entry. Values are
+    decoded the same way ``json.load`` would decode them.
+
+    Args:
+        buffer (mmap.mmap): the memory-mapped binary index
+        data_start (int): byte offset of the data blocks in the file
+        descriptor (dict): the section's descriptor from the file header
+        binary_path (str): path to the binary index, used for pickling
+        name (str): the section's name, used for pickling
+
+    """
+
+    def __init__(self, buffer, data_start, descriptor, binary_path, name):
+        self._buffer = buffer
+        self._binary_path = binary_path
+        self._name = name
+        self._n_entries = descriptor["n_entries"]
+        self._keys_start = data_start + descriptor["keys"][0]
+        self._keys_length = descriptor["keys"][1]
+        self._values_start = data_start + descriptor["values"][0]
+        self._key_offsets = self._array(data_start, descriptor["key_offsets"])
+        self._value_offsets = self._array(data_start, descriptor["value_offsets"])
+        self._buckets = self._array(data_start, descriptor["buckets"])
+        self._mask = descriptor["n_buckets"] - 1
+
+    def _array(self, data_start, block):
+        offset, length = block
+        return np.frombuffer(
+            self._buffer, dtype="<i8", count=length // 8, offset=data_start + offset
+        )
+
+    def __reduce__(self):
+        # mmap objects can't be pickled: re-open the file in the new process
+        return (_load_section, (self._binary_path, self._name))
+
+    def _find(self, key):
+        if not isinstance(key, str):
+            return -1
+        key_bytes = key.encode("utf-8")
+        slot = zlib.crc32(key_bytes) & self._mask
+        while True:
+            entry = int(self._buckets[slot])
+            if entry < 0:
+                return entry
+            start = self._keys_start + int(self._key_offsets[entry])
+            length = int(self._key_offsets[entry + 1] - self._key_offsets[entry]) - 1
+            if (
+                length == len(key_bytes)
+                and self._buffer[start : start + length] == key_bytes
+            ):
+                return entry
+            slot = (slot + 1) & self._mask
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __getitem__(self, key):
+        entry = self._find(key)
+        if entry < 0:
+            raise KeyError(key)
+        start = self._values_start + int(self._value_offsets[entry])
+        end = self._values_start + int(self._value_offsets[entry + 1])
+        return json.loads(self._buffer[start:end])
+
+    def __len__(self):
+        return self._n_entries
+
+    def __iter__(self):
+        if self._n_entries == 0:
+            return iter([])
+        keys = self._buffer[self._keys_start : self._keys_start + self._keys_length]
+        return iter(keys.decode("utf-8").split("\x00"))
+
+    def __repr__(self):
+        return "BinaryIndexSection({}, {} entries)".format(self._name, len(self))
+
+
+def _open(binary_path):
+    with open(binary_path, "rb") as fhandle:
+        header, data_start = _read_header(fhandle)
+        buffer = mmap.mmap(fhandle.fileno(), 0, access=mmap.ACCESS_READ)
+    return header, data_start, buffer
+
+
+def _load_section(binary_path, name):
+    header, data_start, buffer = _open(binary_path)
+    return BinaryIndexSection(
+        buffer, data_start, header["sections"][name], binary_path, name
+    )
+
+
+def load_binary_index(binary_path):
+    """Memory-map a binary index
+
+    Args:
+        binary_path (str): path to the binary index
+
+    Returns:
+        dict: an index with the same keys as the JSON index it was built from,
+        where the ``tracks`` and ``multitracks`` sections are BinaryIndexSection
+        mappings
+
+    """
+    header, data_start, buffer = _open(binary_path)
+    index = dict(header["fields"])
+    for name, descriptor in header["sections"].items():
+        index[name] = BinaryIndexSection(
+            buffer, data_start, descriptor, binary_path, name
+        )
+    return index
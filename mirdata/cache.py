@@ -0,0 +1,288 @@
+"""Persistent, cross-process caches for mirdata
+
+The annotation cache stores parsed annotations (``mirdata.annotations`` objects)
+on disk, so that they are parsed once and reused by later processes. It is
+enabled per dataset with ``mirdata.initialize(..., cache_dir=...)`` or
+``Dataset.set_annotation_cache``.
+
+The audio cache stores decoded audio as ``.npy`` files, so that audio files are
+decoded (and resampled) once rather than on every access. It is shared by all
+loaders and enabled with ``mirdata.io.set_audio_cache``.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+import numpy as np
+
+from mirdata.version import version as mirdata_version
+
+
+def _is_annotation(value):
+    """Check if a value is an annotation, or a container of annotations
+
+    Args:
+        value (object): the value to check
+
+    Returns:
+        bool: True if value can be stored in the annotation cache
+
+    """
+    from mirdata import annotations
+
+    if isinstance(value, (annotations.Annotation, annotations.MultiAnnotator)):
+        return True
+    if isinstance(value, dict):
+        values = list(value.values())
+    elif isinstance(value, (list, tuple)):
+        values = list(value)
+    else:
+        return False
+    return (
+        len(values) > 0
+        and all(v is None or _is_annotation(v) for v in values)
+        and any(v is not None for v in values)
+    )
+
+
+class AnnotationCache(object):
+    """On-disk cache of parsed track annotations
+
+    Each entry stores one annotation property of one track (or multitrack) as
+    a pickle. Entries are keyed by the dataset, the track id, the property and
+    the track's index entry (its file paths and their index checksums), and are
+    invalidated when any of the track's files changes on disk (size or
+    modification time). The files of a track are stat-ed once per track
+    object, on the first cached access.
+
+    Attributes:
+        cache_dir (str): directory where cache entries are stored
+
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, item, name):
+        item_id, paths = _item_id_and_paths(item)
+        key = json.dumps(
+            [
+                mirdata_version,
+                item._dataset_name,
+                type(item).__module__,
+                type(item).__qualname__,
+                name,
+                item_id,
+                paths,
+            ],
+            sort_keys=True,
+        )
+        return os.path.join(
+            self.cache_dir,
+            item._dataset_name,
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pkl",
+        )
+
+    def _signature(self, item):
+        """Size and modification time of every local file of the item"""
+        _, paths = _item_id_and_paths(item)
+        signature = []
+        for key in sorted(paths.keys()):
+            if key == "tracks" or paths[key][0] is None:
+                continue
+            try:
+                stat = os.stat(os.path.join(item._data_home, paths[key][0]))
+                signature.append([key, stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                signature.append([key, None, None])
+        return signature
+
+    def get(self, item, name, compute):
+        """Get an annotation from the cache, computing and storing it on a miss
+
+        Args:
+            item (core.Track or core.MultiTrack): the track the annotation belongs to
+            name (str): the name of the annotation property
+            compute (function): function of no arguments computing the annotation
+
+        Returns:
+            object: the annotation
+
+        """
+        entry_path = self._entry_path(item, name)
+        signature = item._annotation_signature
+        if signature is None:
+            signature = self._signature(item)
+            item._annotation_signature = signature
+        if os.path.exists(entry_path):
+            try:
+                with open(entry_path, "rb") as fhandle:
+                    cached_signature, value = pickle.load(fhandle)
+                if cached_signature == signature:
+                    return value
+            except Exception:
+                logging.warning("Ignoring unreadable cache entry {}".format(entry_path))
+
+        value = compute()
+        if _is_annotation(value):
+            self._put(entry_path, signature, value)
+        return value
+
+    def _put(self, entry_path, signature, value):
+        tmp_path = "{}.{}.tmp".format(entry_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(tmp_path, "wb") as fhandle:
+                pickle.dump((signature, value), fhandle, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError) as exc:
+            logging.warning(
+                "Could not write cache entry {}: {}".format(entry_path, exc)
+            )
+
+
+def _item_id_and_paths(item):
+    if hasattr(item, "mtrack_id"):
+        return item.mtrack_id, item._multitrack_paths
+    return item.track_id, item._track_paths
+
+
+class AudioCache(object):
+    """On-disk, size-capped cache of decoded audio
+
+    Decoded signals are stored as raw ``.npy`` arrays, keyed by the audio
+    file (absolute path, size and modification time) and the decoding
+    parameters (sample rate, mono, offset and duration), so an entry is never
+    reused once its source file changes. When the cache grows beyond
+    max_size, the least recently used entries are evicted.
+
+    Attributes:
+        cache_dir (str): directory where decoded audio is stored
+        max_size (int or None): maximum total size of the cache in bytes.
+            If None, the cache is unbounded.
+        mmap (bool): if True, cached audio is returned as read-only
+            memory-mapped arrays
+
+    """
+
+    def __init__(self, cache_dir, max_size=None, mmap=False):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.mmap = mmap
+
+    def _entry_path(self, local_path, sr, mono, offset, duration):
+        stat = os.stat(local_path)
+        key = json.dumps(
+            [
+                os.path.abspath(local_path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                sr,
+                mono,
+                offset,
+                duration,
+            ]
+        )
+        return os.path.join(
+            self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest()
+        )
+
+    def get(self, local_path, sr, mono, offset, duration, load):
+        """Get decoded audio from the cache, decoding and storing it on a miss
+
+        Args:
+            local_path (str): path to the audio file
+            sr (int or None): requested sample rate, None for the native rate
+            mono (bool): if True, audio is downmixed to mono
+            offset (float): start of the decoded audio, in seconds
+            duration (float or None): length of the decoded audio, in seconds
+            load (function): function of no arguments decoding the audio,
+                returning a tuple (audio, sample_rate)
+
+        Returns:
+            * np.ndarray - the audio signal
+            * float - the sample rate of the audio
+
+        """
+        entry_path = self._entry_path(local_path, sr, mono, offset, duration)
+        try:
+            with open(entry_path + ".json") as fhandle:
+                sample_rate = json.load(fhandle)["sr"]
+            audio = np.load(entry_path + ".npy", mmap_mode="r" if self.mmap else None)
+            # mark the entry as recently used
+            os.utime(entry_path + ".npy")
+            return audio, sample_rate
+        except (OSError, ValueError, KeyError):
+            pass
+
+        audio, sample_rate = load()
+        self._put(entry_path, audio, sample_rate)
+        return audio, sample_rate
+
+    def _put(self, entry_path, audio, sample_rate):
+        tmp_suffix = ".{}.tmp".format(os.getpid())
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(entry_path + tmp_suffix, "wb") as fhandle:
+                np.save(fhandle, np.asarray(audio, dtype=np.float32))
+            os.replace(entry_path + tmp_suffix, entry_path + ".npy")
+            with open(entry_path + ".json" + tmp_suffix, "w") as fhandle:
+                json.dump({"sr": sample_rate}, fhandle)
+            os.replace(entry_path + ".json" + tmp_suffix, entry_path + ".json")
+        except OSError as exc:
+            logging.warning(
+                "Could not write cache entry {}: {}".format(entry_path, exc)
+            )
+            return
+        if self.max_size is not None:
+            self.evict(self.max_size)
+
+    def size(self):
+        """Total size of the cached audio
+
+        Returns:
+            int: size in bytes
+
+        """
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for fname in os.listdir(self.cache_dir):
+            if not fname.endswith(".npy"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, fname))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, fname[: -len(".npy")], stat.st_size))
+        return entries
+
+    def evict(self, max_size):
+        """Evict the least recently used entries until the cache fits in max_size
+
+        Args:
+            max_size (int): maximum total size of the cache in bytes
+
+        """
+        entries = sorted(self._entries())
+        total_size = sum(size for _, _, size in entries)
+        for _, name, size in entries:
+            if total_size <= max_size:
+                break
+            for suffix in [".npy", ".json"]:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name + suffix))
+                except OSError:
+                    pass
+            total_size -= size
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        self.evict(0)
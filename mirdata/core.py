@@ -1,5 +1,9 @@
 """Core mirdata classes"""
 
+import bisect
+import collections
+import collections.abc
+import functools
 import json
 import os
 import random
@@ -9,8 +13,15 @@ from typing import Any, List, Optional
 import numpy as np
 from smart_open import open
 
+from mirdata import binary_index
+from mirdata import cache
 from mirdata import download_utils
+from mirdata import io
+from mirdata import parallel
 from mirdata import validate
+from mirdata.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
 
 MAX_STR_LEN = 100
 DOCS_URL = "https://mirdata.readthedocs.io/en/stable/source/mirdata.html"
@@ -34,6 +45,10 @@ class cached_property(object):
     property.
     Source: https://github.com/bottlepy/bottle/commit/fa7733e075da0d790d809aa3d2f53071897e6f76
 
+    Public properties of tracks with an annotation cache (see
+    ``Dataset.set_annotation_cache``) are also looked up in, and stored to,
+    the persistent cache.
+
     """
 
     def __init__(self, func):
@@ -43,7 +58,16 @@ class cached_property(object):
     def __get__(self, obj: Any, cls: type) -> Any:
         if obj is None:
             return self
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        name = self.func.__name__
+        if (
+            isinstance(obj, Track)
+            and obj._annotation_cache is not None
+            and not name.startswith("_")
+        ):
+            value = obj._annotation_cache.get(obj, name, lambda: self.func(obj))
+        else:
+            value = self.func(obj)
+        obj.__dict__[name] = value
         return value
 
 
@@ -137,6 +161,9 @@ class Dataset(object):
         self._download_info = download_info
         self._license_info = license_info
         self.readme = "{}#module-mirdata.datasets.{}".format(DOCS_URL, self.name)
+        self._annotation_cache = None
+        # shared by every track, rather than a new closure per track
+        self._get_metadata = lambda: self._metadata
 
         # this is a hack to be able to have dataset-specific docstrings
         self.track = lambda track_id: self._track(track_id)
@@ -164,6 +191,10 @@ class Dataset(object):
 
     @cached_property
     def _index(self):
+        binary_path = self._index_data.get_binary_path()
+        if binary_index.is_binary_index_current(binary_path, self.index_path):
+            return binary_index.load_binary_index(binary_path)
+
         try:
             with open(self.index_path, encoding="utf-8") as fhandle:
                 index = json.load(fhandle)
@@ -183,6 +214,22 @@ class Dataset(object):
     def _metadata(self):
         return None
 
+    def set_annotation_cache(self, cache_dir):
+        """Persist parsed annotations of this dataset's tracks in cache_dir
+
+        Annotations are parsed once and stored in cache_dir, and loaded from
+        there by any later process, until the annotation's files change on disk.
+
+        Args:
+            cache_dir (str or None): directory where annotations are cached.
+                If None, disables the annotation cache.
+
+        """
+        if cache_dir is None:
+            self._annotation_cache = None
+        else:
+            self._annotation_cache = cache.AnnotationCache(cache_dir)
+
     @property
     def default_path(self):
         """Get the default path for the dataset
@@ -209,9 +256,12 @@ class Dataset(object):
         if self._track_class is None:
             raise AttributeError("This dataset does not have tracks")
         else:
-            return self._track_class(
-                track_id, self.data_home, self.name, self._index, lambda: self._metadata
+            track = self._track_class(
+                track_id, self.data_home, self.name, self._index, self._get_metadata
             )
+            if self._annotation_cache is not None:
+                track._annotation_cache = self._annotation_cache
+            return track
 
     def _multitrack(self, mtrack_id):
         """Load a multitrack by mtrack_id.
@@ -228,39 +278,54 @@ class Dataset(object):
         if self._multitrack_class is None:
             raise AttributeError("This dataset does not have multitracks")
         else:
-            return self._multitrack_class(
+            mtrack = self._multitrack_class(
                 mtrack_id,
                 self.data_home,
                 self.name,
                 self._index,
                 self._track_class,
-                lambda: self._metadata,
+                self._get_metadata,
             )
+            if self._annotation_cache is not None:
+                mtrack._annotation_cache = self._annotation_cache
+            return mtrack
 
-    def load_tracks(self):
+    def load_tracks(self, lazy=False):
         """Load all tracks in the dataset
 
+        Args:
+            lazy (bool): if True, returns a LazyTracks mapping which creates
+                Track objects when they are first accessed
+
         Returns:
-            dict:
+            dict or LazyTracks:
                 {`track_id`: track data}
 
         Raises:
             NotImplementedError: If the dataset does not support Tracks
 
         """
+        if lazy:
+            return LazyTracks(self)
         return {track_id: self.track(track_id) for track_id in self.track_ids}
 
-    def load_multitracks(self):
+    def load_multitracks(self, lazy=False):
         """Load all multitracks in the dataset
 
+        Args:
+            lazy (bool): if True, returns a LazyTracks mapping which creates
+                MultiTrack objects when they are first accessed
+
         Returns:
-            dict:
+            dict or LazyTracks:
                 {`mtrack_id`: multitrack data}
 
         Raises:
             NotImplementedError: If the dataset does not support Multitracks
 
         """
+        if lazy:
+            return LazyTracks(self, multitracks=True)
         return {mtrack_id: self.multitrack(mtrack_id) for mtrack_id in self.mtrack_ids}
 
     def choice_track(self):
@@ -317,6 +382,101 @@ class Dataset(object):
             for name, a, b in zip(partition_names, [0] + partitions, partitions)
         }
 
+    def get_metadata_column(self, key, ids=None):
+        """Get one metadata field of many tracks as an array
+
+        The values are read in a single pass over the dataset's metadata,
+        without creating Track objects.
+
+        Args:
+            key (str): the metadata field, e.g. "split"
+            ids (list or None): the track (or multitrack) ids to get the field
+                for. If None, uses every track_id
+
+        Raises:
+            AttributeError: If this dataset does not have metadata
+
+        Returns:
+            np.ndarray: the field's value for each id, in the order of ids.
+            Missing values are None. If the values are not all of the same
+            type, the array has dtype object, so values are not converted
+
+        """
+        if ids is None:
+            ids = self.track_ids
+        metadata = self._metadata
+        if not metadata:
+            raise AttributeError("This dataset does not have metadata.")
+
+        # same lookup as Track._track_metadata: per-id entries, else global
+        values = [
+            (metadata[item_id] if item_id in metadata else metadata).get(key)
+            for item_id in ids
+        ]
+        # e.g. np.array would turn a mix of int and str labels into strings
+        if len(set(type(value) for value in values)) > 1:
+            column = np.empty((len(values),), dtype=object)
+            column[:] = values
+            return column
+        return np.array(values)
+
+    @cached_property
+    def _metadata_table(self):
+        metadata = self._metadata
+        if not metadata:
+            raise AttributeError("This dataset does not have metadata.")
+        sections = [
+            self._index.get("tracks") or {},
+            self._index.get("multitracks") or {},
+        ]
+        rows = {
+            item_id: value
+            for item_id, value in metadata.items()
+            if isinstance(value, dict) and any(item_id in ids for ids in sections)
+        }
+        if not rows:
+            raise AttributeError("This dataset does not have per-track metadata.")
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+    def metadata_table(self):
+        """Get the dataset's metadata as a table, with one row per track
+
+        The table is built once from the dataset's metadata, and can be
+        filtered with vectorized operations (see ``select_ids``). Metadata
+        fields which are missing for a track are NaN.
+
+        Raises:
+            AttributeError: If this dataset does not have per-track metadata
+
+        Returns:
+            pd.DataFrame: metadata table, indexed by track (or multitrack) id,
+            with one column per metadata field
+
+        """
+        return self._metadata_table
+
+    def select_ids(self, condition):
+        """Select the ids of the tracks whose metadata matches a condition
+
+        Args:
+            condition (str or function): a ``pd.DataFrame.query`` expression
+                such as ``"year > 2010 and split == 'train'"``, or a function
+                mapping the metadata table to a boolean mask
+
+        Raises:
+            AttributeError: If this dataset does not have per-track metadata
+
+        Returns:
+            np.ndarray: the selected track (or multitrack) ids
+
+        """
+        table = self.metadata_table()
+        if isinstance(condition, str):
+            selected = table.query(condition)
+        else:
+            selected = table[np.asarray(condition(table), dtype=bool)]
+        return selected.index.to_numpy()
+
     def get_track_splits(self):
         """Get predetermined track splits (e.g. train/ test)
         released alongside this dataset
@@ -331,6 +491,12 @@ class Dataset(object):
         if self._track_class is None:
             raise AttributeError("This dataset does not have tracks")
 
+        if self._track_class._split_metadata_key is not None:
+            labels = self.get_metadata_column(
+                self._track_class._split_metadata_key, self.track_ids
+            )
+            return _group_ids(self.track_ids, labels)
+
         if not hasattr(self.choice_track(), "split"):
             raise NotImplementedError(
                 f"The {self.name} dataset does not have an official split. Use"
@@ -376,6 +542,12 @@ class Dataset(object):
         if self._multitrack_class is None:
             raise AttributeError("This dataset does not have multitracks")
 
+        if self._multitrack_class._split_metadata_key is not None:
+            labels = self.get_metadata_column(
+                self._multitrack_class._split_metadata_key, self.mtrack_ids
+            )
+            return _group_ids(self.mtrack_ids, labels)
+
         if not hasattr(self.choice_multitrack(), "split"):
             raise NotImplementedError(
                 f"The {self.name} dataset does not have an official split. Use"
@@ -430,6 +602,8 @@ class Dataset(object):
         force_overwrite=False,
         cleanup=False,
         allow_invalid_checksum=False,
+        num_workers=1,
+        stream_extract=False,
     ):
         """Download data to `save_dir` and optionally print a message.
 
@@ -445,6 +619,11 @@ class Dataset(object):
                 Allow invalid checksums of the downloaded data. Useful sometimes behind some
                 proxies that inspection the downloaded data. When having a different checksum
                 promts a warn instead of raising an exception
+            num_workers (int):
+                Number of remote files downloaded concurrently.
+            stream_extract (bool):
+                If True, tar archives are extracted while they are downloaded.
+                With cleanup=True, the archives are never written to disk.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -460,8 +639,25 @@ class Dataset(object):
             force_overwrite=force_overwrite,
             cleanup=cleanup,
             allow_invalid_checksum=allow_invalid_checksum,
+            num_workers=num_workers,
+            stream_extract=stream_extract,
         )
 
+    def build_binary_index(self):
+        """Build a compact, memory-mapped version of this dataset's index
+
+        Subsequent loads of the index memory-map the binary index instead of
+        parsing the whole JSON index, so track lookups don't require holding the
+        full index in memory, and processes loading the same dataset share it.
+
+        Returns:
+            str: path to the binary index file
+
+        """
+        binary_path = self._index_data.build_binary_index()
+        self.__dict__.pop("_index", None)
+        return binary_path
+
     @cached_property
     def track_ids(self):
         """Return track ids
@@ -486,11 +682,40 @@ class Dataset(object):
             raise AttributeError("This dataset does not have multitracks")
         return list(self._index["multitracks"].keys())
 
-    def validate(self, verbose=True):
+    def validate(
+        self,
+        verbose=True,
+        num_workers=1,
+        executor="thread",
+        full=False,
+        mode="full",
+        sample_fraction=0.1,
+        checksum_cache=None,
+        use_inode=False,
+    ):
         """Validate if the stored dataset is a valid version
 
+        If ``checksum_cache`` is set, checksums of valid files are cached in that
+        directory, and files which did not change since the last validation are
+        not hashed again.
+
+        Use ``mode="exists"`` for a cheap sanity check which only verifies that
+        every file in the index exists, or ``mode="sample"`` to additionally
+        verify the checksums of a random ``sample_fraction`` of the files.
+
         Args:
             verbose (bool): If False, don't print output
+            num_workers (int): number of files to validate in parallel
+            executor (str): either "thread" or "process", the kind of worker pool
+                used when num_workers > 1
+            full (bool): If True, ignore cached checksums and hash every file
+            mode (str): one of "full" (hash every file), "sample" (hash a random
+                subset of files) or "exists" (only check that files exist)
+            sample_fraction (float): fraction of files hashed when mode="sample"
+            checksum_cache (str or None): directory where checksums of valid
+                files are cached between validations. If None, nothing is cached
+            use_inode (bool): If True, cached checksums are also invalidated when
+                a file's inode changes
 
         Returns:
             * list - files in the index but are missing locally
@@ -498,11 +723,291 @@ class Dataset(object):
 
         """
         missing_files, invalid_checksums = validate.validator(
-            self._index, self.data_home, verbose=verbose
+            self._index,
+            self.data_home,
+            verbose=verbose,
+            num_workers=num_workers,
+            executor=executor,
+            full=full,
+            mode=mode,
+            sample_fraction=sample_fraction,
+            checksum_cache=checksum_cache,
+            use_inode=use_inode,
         )
         return missing_files, invalid_checksums
 
 
+def _group_ids(ids, labels):
+    """Group ids by label, keeping the order of first appearance of each label"""
+    groups = {}
+    for item_id, label in zip(ids, labels.tolist()):
+        if label in groups:
+            groups[label].append(item_id)
+        else:
+            groups[label] = [item_id]
+    return groups
+
+
+class DelimitedIdIndex(object):
+    """Substring search over ids made of delimited fields
+
+    Ids such as ``source#split#mbid#genre`` are split into fields once, and
+    each field is indexed, so that searching for a string which spans a
+    delimiter (e.g. ``"#train#"`` or ``"tagtraum#validation#"``) only checks
+    the ids sharing its fields instead of scanning every id. Search results
+    are the same as ``[i for i in ids if search_key in i]``.
+
+    Args:
+        ids (list): the ids to search
+        delimiter (str): the delimiter between the fields of an id
+
+    """
+
+    def __init__(self, ids, delimiter="#"):
+        self._ids = list(ids)
+        self._delimiter = delimiter
+        postings = collections.defaultdict(list)
+        for position, item_id in enumerate(self._ids):
+            for field in set(item_id.split(delimiter)):
+                if field:
+                    postings[field].append(position)
+        self._postings = {
+            field: np.array(positions, dtype=np.int64)
+            for field, positions in postings.items()
+        }
+        self._fields = sorted(self._postings.keys())
+        self._reversed_fields = sorted(field[::-1] for field in self._postings)
+        self._results = {}
+
+    @staticmethod
+    def _with_prefix(sorted_fields, prefix):
+        start = bisect.bisect_left(sorted_fields, prefix)
+        end = start
+        while end < len(sorted_fields) and sorted_fields[end].startswith(prefix):
+            end += 1
+        return sorted_fields[start:end]
+
+    def _union(self, fields):
+        if len(fields) == 0:
+            return np.array([], dtype=np.int64)
+        return np.unique(np.concatenate([self._postings[f] for f in fields]))
+
+    def _candidates(self, search_key):
+        """Positions of the ids which may contain search_key, or None for all"""
+        parts = search_key.split(self._delimiter)
+        if len(parts) == 1:
+            return None
+        # interior parts are whole fields, the first part ends a field and
+        # the last part starts a field
+        constraints = [
+            self._postings.get(part, np.array([], dtype=np.int64))
+            for part in parts[1:-1]
+            if part
+        ]
+        if parts[0]:
+            constraints.append(
+                self._union(
+                    [
+                        field[::-1]
+                        for field in self._with_prefix(
+                            self._reversed_fields, parts[0][::-1]
+                        )
+                    ]
+                )
+            )
+        if parts[-1]:
+            constraints.append(self._union(self._with_prefix(self._fields, parts[-1])))
+        if len(constraints) == 0:
+            return None
+        candidates = min(constraints, key=len)
+        for constraint in constraints:
+            if constraint is not candidates:
+                candidates = np.intersect1d(candidates, constraint, assume_unique=True)
+        return candidates
+
+    def search(self, search_key):
+        """Get the ids containing search_key
+
+        Args:
+            search_key (str): the string to search for
+
+        Returns:
+            list: the matching ids, in their original order
+
+        """
+        if search_key not in self._results:
+            candidates = self._candidates(search_key)
+            if candidates is None:
+                ids = self._ids
+            else:
+                ids = [self._ids[position] for position in candidates]
+            self._results[search_key] = [i for i in ids if search_key in i]
+        return list(self._results[search_key])
+
+
+class LazyTracks(collections.abc.Mapping):
+    """Read-only mapping of track ids to Track objects, created on first access
+
+    Track (or MultiTrack) objects are created once and kept, so annotations
+    loaded through them (or warmed with ``prefetch``) stay loaded.
+
+    Args:
+        dataset (Dataset): the dataset the tracks belong to
+        multitracks (bool): if True, maps multitrack ids to MultiTrack objects
+
+    """
+
+    def __init__(self, dataset, multitracks=False):
+        self._dataset = dataset
+        self._multitracks = multitracks
+        if multitracks:
+            self._ids = dataset.mtrack_ids
+            self._load = dataset.multitrack
+            self._section = dataset._index["multitracks"]
+        else:
+            self._ids = dataset.track_ids
+            self._load = dataset.track
+            self._section = dataset._index["tracks"]
+        self._items = {}
+
+    def __getitem__(self, key):
+        if key not in self._items:
+            if key not in self._section:
+                raise KeyError(key)
+            self._items[key] = self._load(key)
+        return self._items[key]
+
+    def __contains__(self, key):
+        return key in self._section
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return "LazyTracks({}, {} of {} loaded)".format(
+            self._dataset.name, len(self._items), len(self)
+        )
+
+    def prefetch(
+        self,
+        keys=None,
+        attributes=None,
+        num_workers=1,
+        executor="thread",
+        verbose=False,
+    ):
+        """Create tracks and load their attributes ahead of time
+
+        Cached properties (annotations) are kept on the track objects.
+        Other attributes, such as audio, are only loaded to warm the
+        persistent caches (see ``Dataset.set_annotation_cache`` and
+        ``mirdata.io.set_audio_cache``).
+
+        Args:
+            keys (list or None): ids of the tracks to prefetch. If None,
+                prefetches every track
+            attributes (list or None): names of the attributes to load. If
+                None, loads every public cached property (e.g. annotations)
+            num_workers (int): number of parallel workers
+            executor (str): one of "thread" or "process", the kind of
+                parallel workers
+            verbose (bool): if True, shows a progress bar
+
+        """
+        keys = list(self._ids if keys is None else keys)
+        for key in keys:
+            if key not in self._section:
+                raise KeyError(key)
+        if len(keys) == 0:
+            return
+
+        if attributes is None:
+            attributes = _cached_attributes(type(self[keys[0]]))
+
+        if executor == "process" and num_workers is not None and num_workers > 1:
+            dataset = self._dataset
+            annotation_cache = dataset._annotation_cache
+            audio_cache = io.get_audio_cache()
+            load_function = functools.partial(
+                _prefetch_attributes,
+                (
+                    type(dataset),
+                    dataset.data_home,
+                    dataset.version,
+                    annotation_cache.cache_dir if annotation_cache else None,
+                    (
+                        (audio_cache.cache_dir, audio_cache.max_size, audio_cache.mmap)
+                        if audio_cache
+                        else None
+                    ),
+                ),
+                self._multitracks,
+                attributes,
+            )
+            results = parallel.map_items(
+                load_function, keys, verbose, num_workers, executor
+            )
+            for key, values in zip(keys, results):
+                self[key].__dict__.update(values)
+        else:
+            # tracks are created in the workers, but only stored by the
+            # calling thread, so that _items is never written concurrently
+            def load_function(key):
+                track = self._items.get(key)
+                if track is None:
+                    track = self._load(key)
+                _warm_attributes(track, attributes)
+                return track
+
+            tracks = parallel.map_items(
+                load_function, keys, verbose, num_workers, executor
+            )
+            for key, track in zip(keys, tracks):
+                self._items.setdefault(key, track)
+
+
+def _cached_attributes(track_class):
+    """Names of the public cached properties of a Track class"""
+    return sorted(
+        name
+        for klass in track_class.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property) and not name.startswith("_")
+    )
+
+
+def _warm_attributes(track, attributes):
+    for attribute in attributes:
+        getattr(track, attribute)
+
+
+_PREFETCH_DATASETS = {}
+
+
+def _prefetch_attributes(dataset_spec, multitracks, attributes, key):
+    """Load the attributes of one track in a worker process
+
+    Returns:
+        dict: the values of the cached properties among attributes
+
+    """
+    if dataset_spec not in _PREFETCH_DATASETS:
+        dataset_class, data_home, version, cache_dir, audio_cache = dataset_spec
+        dataset = dataset_class(data_home=data_home, version=version)
+        dataset.set_annotation_cache(cache_dir)
+        if audio_cache is not None:
+            io.set_audio_cache(*audio_cache)
+        _PREFETCH_DATASETS[dataset_spec] = dataset
+    dataset = _PREFETCH_DATASETS[dataset_spec]
+    track = dataset.multitrack(key) if multitracks else dataset.track(key)
+    _warm_attributes(track, attributes)
+    cached = set(_cached_attributes(type(track)))
+    return {name: track.__dict__[name] for name in attributes if name in cached}
+
+
 class Track(object):
     """Track base class
 
@@ -510,6 +1015,15 @@ class Track(object):
 
     """
 
+    _annotation_cache = None
+    # size and modification time of the track's files, computed once per
+    # track by the annotation cache
+    _annotation_signature = None
+
+    # metadata field holding the split, if the split property reads it from
+    # the track's metadata. Used to compute splits without creating tracks
+    _split_metadata_key = None
+
     def __init__(self, track_id, data_home, dataset_name, index, metadata):
         """Track init method. Sets boilerplate attributes, including:
 
@@ -595,6 +1109,27 @@ class Track(object):
         else:
             return os.path.join(self._data_home, self._track_paths[key][0])
 
+    def load_audio_segment(self, start, duration, sr=None, mono=True):
+        """Load a segment of the track's audio, without decoding the whole file
+
+        Args:
+            start (float): start of the segment, in seconds
+            duration (float): duration of the segment, in seconds
+            sr (float or None): sample rate to resample to. If None, the native
+                sample rate is used
+            mono (bool): if True, audio is downmixed to mono
+
+        Returns:
+            * np.ndarray - the audio signal
+            * float - the sample rate of the audio
+
+        """
+        if not hasattr(self, "audio_path"):
+            raise AttributeError("This Track does not have an audio_path.")
+        if self.audio_path is None:
+            return None
+        return io.load_audio_segment(self.audio_path, start, duration, sr=sr, mono=mono)
+
 
 class MultiTrack(Track):
     """MultiTrack class.
@@ -606,6 +1141,9 @@ class MultiTrack(Track):
 
     """
 
+    # Track objects of the multitrack, created on first access
+    _tracks = None
+
     def __init__(
         self, mtrack_id, data_home, dataset_name, index, track_class, metadata
     ):
@@ -643,12 +1181,18 @@ class MultiTrack(Track):
 
     @property
     def tracks(self):
-        return {
-            t: self._track_class(
-                t, self._data_home, self._dataset_name, self._index, self._metadata
-            )
-            for t in self.track_ids
-        }
+        if self._tracks is None:
+            tracks = {
+                t: self._track_class(
+                    t, self._data_home, self._dataset_name, self._index, self._metadata
+                )
+                for t in self.track_ids
+            }
+            if self._annotation_cache is not None:
+                for track in tracks.values():
+                    track._annotation_cache = self._annotation_cache
+            self._tracks = tracks
+        return self._tracks
 
     @property
     def track_audio_property(self):
@@ -700,47 +1244,51 @@ class MultiTrack(Track):
                 if enforce_length=True and lengths are not equal
 
         """
-        signals = []
-        lengths = []
-        sample_rates = []
-        for k in track_keys:
-            audio, sample_rate = getattr(self.tracks[k], self.track_audio_property)
-            # ensure all signals are shape (n_channels, n_samples)
-            if len(audio.shape) == 1:
-                audio = audio[np.newaxis, :]
-            signals.append(audio)
-            lengths.append(audio.shape[1])
-            sample_rates.append(sample_rate)
+        return self._mix({None: (track_keys, weights)}, average, enforce_length)[None]
 
-        if len(set(sample_rates)) > 1:
-            raise ValueError(
-                "Sample rates for tracks {} are not equal: {}".format(
-                    track_keys, sample_rates
-                )
-            )
+    def _mix(self, targets, average=True, enforce_length=True, load_audio=None):
+        """Mix several targets in one pass over their tracks
 
-        max_length = np.max(lengths)
-        if any([l != max_length for l in lengths]):
-            if enforce_length:
-                raise ValueError(
-                    "Track's {} audio are not the same length {}. Use enforce_length=False to pad"
-                    " with zeros.".format(track_keys, lengths)
-                )
-            else:
-                # pad signals to the max length
-                signals = [
-                    np.pad(signal, ((0, 0), (0, max_length - signal.shape[1])))
-                    for signal in signals
-                ]
+        The audio of each track is loaded once, even if the track is part of
+        several targets, and is accumulated in place into each target's buffer.
 
-        if weights is None:
-            weights = np.ones((len(track_keys),))
+        Args:
+            targets (dict): {target name: (list of track keys, list of weights or None)}
+            average (bool): if True, computes a weighted average of the tracks
+                if False, computes a weighted sum of the tracks
+            enforce_length (bool): If True, raises ValueError if the tracks of a
+                target are not the same length. If False, pads audio with zeros
+            load_audio (function or None): function taking a track key and
+                returning the track's (audio, sample_rate). If None, the
+                track's track_audio_property is used
 
-        target = np.average(signals, axis=0, weights=weights)
-        if not average:
-            target *= np.sum(weights)
+        Returns:
+            dict: {target name: target audio with shape (n_channels, n_samples)}
 
-        return target
+        """
+        mixes = {
+            name: _Mix(track_keys, weights, average)
+            for name, (track_keys, weights) in targets.items()
+        }
+        uses = {}
+        for mix in mixes.values():
+            for key, weight in zip(mix.track_keys, mix.weights):
+                uses.setdefault(key, []).append((mix, weight))
+
+        if load_audio is None:
+
+            def load_audio(key):
+                return getattr(self.tracks[key], self.track_audio_property)
+
+        for key, key_uses in uses.items():
+            audio, sample_rate = load_audio(key)
+            # ensure all signals are shape (n_channels, n_samples)
+            if len(audio.shape) == 1:
+                audio = audio[np.newaxis, :]
+            for mix, weight in key_uses:
+                mix.add(audio, sample_rate, weight)
+
+        return {name: mix.result(enforce_length) for name, mix in mixes.items()}
 
     def get_random_target(self, n_tracks=None, min_weight=0.3, max_weight=1.0):
         """Get a random target by combining a random selection of tracks with random weights
@@ -780,6 +1328,102 @@ class MultiTrack(Track):
         return self.get_target(tracks)
 
 
+class _Mix(object):
+    """Weighted mixture of tracks, accumulated one track at a time
+
+    Args:
+        track_keys (list): list of track keys to mix together
+        weights (list or None): list of scalars, one per track. If None, all
+            tracks have weight 1
+        average (bool): if True, the mixture is a weighted average of the tracks,
+            otherwise it is a weighted sum
+
+    """
+
+    def __init__(self, track_keys, weights, average):
+        self.track_keys = list(track_keys)
+        if len(self.track_keys) == 0:
+            raise ValueError("No tracks to mix")
+        if weights is None:
+            weights = np.ones((len(self.track_keys),))
+        self.weights = np.asarray(weights, dtype=float)
+        if self.weights.shape != (len(self.track_keys),):
+            raise ValueError(
+                "Expected one weight per track, got {} weights for {} tracks".format(
+                    len(self.weights), len(self.track_keys)
+                )
+            )
+        if average and np.sum(self.weights) == 0:
+            raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+        self.average = average
+        self.buffer = None
+        self.lengths = []
+        self.sample_rates = []
+        # reused to scale tracks without allocating an array per track
+        self._scaled = None
+
+    def add(self, audio, sample_rate, weight):
+        """Add a track's audio to the mixture
+
+        Args:
+            audio (np.ndarray): audio with shape (n_channels, n_samples)
+            sample_rate (float): the audio's sample rate
+            weight (float): the track's weight
+
+        """
+        self.lengths.append(audio.shape[1])
+        self.sample_rates.append(sample_rate)
+        if self.buffer is None:
+            self.buffer = np.zeros(audio.shape)
+        elif self.buffer.shape[0] != audio.shape[0]:
+            raise ValueError(
+                "Tracks {} do not have the same number of channels".format(
+                    self.track_keys
+                )
+            )
+        elif self.buffer.shape[1] < audio.shape[1]:
+            # pad the mixture with zeros to the length of the longest track
+            self.buffer = np.pad(
+                self.buffer, ((0, 0), (0, audio.shape[1] - self.buffer.shape[1]))
+            )
+        mixed = self.buffer[:, : audio.shape[1]]
+        if weight == 1:
+            mixed += audio
+            return
+
+        if self._scaled is None or self._scaled.shape[1] < audio.shape[1]:
+            self._scaled = np.empty(self.buffer.shape)
+        scaled = self._scaled[:, : audio.shape[1]]
+        np.multiply(audio, weight, out=scaled)
+        mixed += scaled
+
+    def result(self, enforce_length):
+        """Get the mixture
+
+        Args:
+            enforce_length (bool): If True, raises ValueError if the tracks are
+                not the same length
+
+        Returns:
+            np.ndarray: mixture audio with shape (n_channels, n_samples)
+
+        """
+        if len(set(self.sample_rates)) > 1:
+            raise ValueError(
+                "Sample rates for tracks {} are not equal: {}".format(
+                    self.track_keys, self.sample_rates
+                )
+            )
+        if enforce_length and any(l != max(self.lengths) for l in self.lengths):
+            raise ValueError(
+                "Track's {} audio are not the same length {}. Use enforce_length=False to pad"
+                " with zeros.".format(self.track_keys, self.lengths)
+            )
+        if self.average:
+            self.buffer /= np.sum(self.weights)
+        return self.buffer
+
+
 class Index(object):
     """Class for storing information about dataset indexes.
     Args:
@@ -836,3 +1480,21 @@ class Index(object):
             str: absolute path to the index file
         """
         return os.path.join(self.indexes_dir, self.filename)
+
+    def get_binary_path(self) -> str:
+        """Get the absolute path to the binary (memory-mapped) version of the index
+        Returns:
+            str: absolute path to the binary index file
+        """
+        return os.path.splitext(self.get_path())[0] + ".bin"
+
+    def build_binary_index(self) -> str:
+        """Build the binary version of the index from the JSON index.
+
+        Once built, datasets memory-map the binary index instead of parsing the
+        JSON index, as long as the JSON index is not modified.
+
+        Returns:
+            str: absolute path to the binary index file
+        """
+        return binary_index.write_binary_index(self.get_path(), self.get_binary_path())
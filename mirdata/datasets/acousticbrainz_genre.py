@@ -182,14 +182,31 @@ class Track(core.Track):
 
     """
 
-    def __init__(self, track_id, data_home, dataset_name, index, metadata):
-        super().__init__(track_id, data_home, dataset_name, index, metadata)
+    # fields derived from the track_id are not stored, to keep tracks small
+    @property
+    def path(self):
+        """str: path to the track's data file"""
+        return os.path.normpath(self.get_path("data"))
+
+    @property
+    def genre(self):
+        """list: human-labeled genre and subgenres list"""
+        return [genre for genre in self.track_id.split("#")[4:] if genre != ""]
+
+    @property
+    def mbid(self):
+        """str: musicbrainz id"""
+        return self.track_id.split("#")[2]
 
-        self.path = os.path.normpath(self.get_path("data"))
-        self.genre = [genre for genre in self.track_id.split("#")[4:] if genre != ""]
-        self.mbid = self.track_id.split("#")[2]
-        self.mbid_group = self.track_id.split("#")[3]
-        self.split = self.track_id.split("#")[1]
+    @property
+    def mbid_group(self):
+        """str: musicbrainz id group"""
+        return self.track_id.split("#")[3]
+
+    @property
+    def split(self):
+        """str: train or validation split"""
+        return self.track_id.split("#")[1]
 
     # Metadata
     @property
@@ -387,6 +404,10 @@ class Dataset(core.Dataset):
     def load_extractor(self, *args, **kwargs):
         return load_extractor(*args, **kwargs)
 
+    @core.cached_property
+    def _track_id_index(self):
+        return core.DelimitedIdIndex(self.track_ids, delimiter="#")
+
     def filter_index(self, search_key):
         """Load from AcousticBrainz genre dataset the indexes that match with search_key.
 
@@ -398,10 +419,8 @@ class Dataset(core.Dataset):
 
         """
 
-        acousticbrainz_genre_data = {
-            k: v for k, v in self._index["tracks"].items() if search_key in k
-        }
-        return acousticbrainz_genre_data
+        tracks = self._index["tracks"]
+        return {k: tracks[k] for k in self._track_id_index.search(search_key)}
 
     def load_all_train(self):
         """Load from AcousticBrainz genre dataset the tracks that are used for training across the four different datasets.
@@ -115,12 +115,14 @@ import os
 from string import Template
 from typing import Tuple, Optional
 
-import librosa
 import numpy as np
-import pandas as pd
 
 from mirdata import annotations
 from mirdata import core
+from mirdata import io
+from mirdata.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
 
 
 BIBTEX = """@inproceedings{cortes2022BAF,
@@ -314,7 +316,7 @@ def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=8000, mono=True)
+    return io.load_audio(fpath, sr=8000, mono=True)
 
 
 def load_matches(track_metadata: dict) -> Optional[EventDataExtended]:
@@ -352,7 +354,7 @@ def load_matches(track_metadata: dict) -> Optional[EventDataExtended]:
         )
 
 
-def csv_to_pandas(file_path: str) -> pd.DataFrame:
+def csv_to_pandas(file_path: str) -> "pd.DataFrame":
     try:
         df = pd.read_csv(file_path)
     except FileNotFoundError as not_found:
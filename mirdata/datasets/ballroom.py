@@ -35,7 +35,6 @@
 import os
 import csv
 import logging
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
@@ -170,7 +169,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
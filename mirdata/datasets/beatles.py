@@ -14,7 +14,6 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -143,7 +142,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
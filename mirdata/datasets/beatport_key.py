@@ -30,7 +30,6 @@ import fnmatch
 import json
 
 from deprecated.sphinx import deprecated
-import librosa
 from smart_open import open
 
 from mirdata import core, download_utils, io
@@ -155,7 +154,7 @@ def load_audio(fpath):
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -14,7 +14,6 @@ import re
 from typing import BinaryIO, TextIO, Optional, Tuple, Dict, List
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -241,7 +240,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -37,7 +37,6 @@
 import os
 import csv
 import logging
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
@@ -157,7 +156,7 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(audio_path, sr=44100, mono=False)
 
 
 @io.coerce_to_string_io
@@ -21,7 +21,6 @@
 import csv
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, annotations, io
@@ -123,7 +122,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
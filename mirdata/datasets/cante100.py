@@ -51,7 +51,6 @@ import xml.etree.ElementTree as ET
 from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -266,7 +265,7 @@ def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=22050, mono=False)
+    return io.load_audio(fpath, sr=22050, mono=False)
 
 
 @io.coerce_to_string_io
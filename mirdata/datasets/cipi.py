@@ -31,9 +31,10 @@ from smart_open import open
 
 
 from mirdata import core
+from mirdata.lazy_import import lazy_import
 
 try:
-    import music21
+    music21 = lazy_import("music21")
 except ImportError:
     logging.error(
         "In order to use cipi you must have music21 installed. "
@@ -168,7 +169,7 @@ class Track(core.Track):
 
 def load_score(
     fhandle: str, data_home: str = "tests/resources/mir_datasets/cipi"
-) -> music21.stream.Score:
+) -> "music21.stream.Score":
     """Load cipi score in music21 stream
 
     Args:
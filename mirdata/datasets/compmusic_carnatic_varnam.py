@@ -40,7 +40,6 @@
 import os
 import csv
 import glob
-import librosa
 from typing import TextIO
 
 import numpy as np
@@ -183,7 +182,7 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(audio_path, sr=44100, mono=False)
 
 
 @io.coerce_to_string_io
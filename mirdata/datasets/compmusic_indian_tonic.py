@@ -53,11 +53,9 @@ import os
 import glob
 import json
 
-import librosa
-
 from smart_open import open
 
-from mirdata import core, download_utils
+from mirdata import core, download_utils, io
 
 BIBTEX = """@article{Gulati2014,
     author = {Gulati, S. and Bellur, A. and Salamon, J. and Ranjani, H. G. and Ishwar, V. and Murthy, H. A. and Serra, X.},
@@ -187,7 +185,7 @@ def load_audio(audio_path):
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(audio_path, sr=44100, mono=False)
 
 
 @core.docstring_inherit(core.Dataset)
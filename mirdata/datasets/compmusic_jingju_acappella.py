@@ -52,7 +52,6 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -209,7 +208,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @io.coerce_to_string_io
@@ -45,7 +45,6 @@ import os
 import csv
 import json
 
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
@@ -232,7 +231,7 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(audio_path, sr=44100, mono=False)
 
 
 @io.coerce_to_string_io
@@ -33,7 +33,6 @@
 """
 
 import csv
-import librosa
 import numpy as np
 from typing import Optional, TextIO, Tuple, List
 
@@ -152,7 +151,7 @@ def load_audio(audio_path):
     """
     if audio_path is None:
         return None
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(audio_path, sr=44100, mono=False)
 
 
 @io.coerce_to_string_io
@@ -100,11 +100,13 @@ import os
 from typing import Optional, BinaryIO
 
 from deprecated.sphinx import deprecated
-import h5py
 import numpy as np
 from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy_import import lazy_import
+
+h5py = lazy_import("h5py")
 
 LICENSE_INFO = """
 Creative Commons Attribution Non Commercial Share Alike 4.0 International
@@ -529,6 +531,10 @@ class Dataset(core.Dataset):
     def load_tags(self, *args, **kwargs):
         return load_tags(*args, **kwargs)
 
+    @core.cached_property
+    def _track_id_index(self):
+        return core.DelimitedIdIndex(self.track_ids, delimiter="#")
+
     def filter_index(self, search_key):
         """Load from Da-TACOS genre dataset the indexes that match with search_key.
 
@@ -539,8 +545,8 @@ class Dataset(core.Dataset):
              dict: {`track_id`: track data}
 
         """
-        data = {k: v for k, v in self._index["tracks"].items() if search_key in k}
-        return data
+        tracks = self._index["tracks"]
+        return {k: tracks[k] for k in self._track_id_index.search(search_key)}
 
     def benchmark_tracks(self):
         """Load from Da-TACOS dataset the benchmark subset tracks.
@@ -46,10 +46,12 @@ import csv
 from typing import BinaryIO, Optional, TextIO, Tuple, List
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, annotations, io
+from mirdata.lazy_import import lazy_import
+
+librosa = lazy_import("librosa")
 
 BIBTEX = """
 @article{RosenzweigCWSGM20_DCS_TISMIR,
@@ -384,7 +386,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=True)
+    return io.load_audio(fhandle, sr=22050, mono=True)
 
 
 @io.coerce_to_string_io
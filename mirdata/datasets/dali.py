@@ -22,7 +22,6 @@ import pickle
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -228,7 +227,7 @@ def load_audio(fhandle: BinaryIO) -> Optional[Tuple[np.ndarray, float]]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -89,7 +89,6 @@ from typing import BinaryIO, Optional, Tuple
 from ast import literal_eval
 import re
 
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -296,7 +295,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
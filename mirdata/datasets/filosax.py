@@ -41,7 +41,6 @@ import json
 import os
 from typing import BinaryIO, Dict, Optional, TextIO, Tuple, List
 
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -492,7 +491,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
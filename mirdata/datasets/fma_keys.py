@@ -52,8 +52,6 @@ import numpy as np
 from math import floor
 from smart_open import open
 
-import librosa
-
 from mirdata import download_utils, core, io
 
 from typing import Optional, Tuple
@@ -268,4 +266,4 @@ def load_audio(path: str) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    return librosa.load(path, sr=None, mono=True)
+    return io.load_audio(path, sr=None, mono=True)
@@ -35,7 +35,6 @@
 
 import csv
 
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, Tuple
 
@@ -176,7 +175,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @io.coerce_to_string_io
@@ -44,7 +44,6 @@ import os
 from typing import BinaryIO, TextIO, Tuple, Optional
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -194,7 +193,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=16000, mono=True)
+    return io.load_audio(fhandle, sr=16000, mono=True)
 
 
 @io.coerce_to_string_io
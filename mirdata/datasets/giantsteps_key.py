@@ -36,7 +36,6 @@ import json
 from typing import Dict, List, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import core, download_utils, io
@@ -156,7 +155,7 @@ def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -70,7 +70,6 @@ from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
 import json
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
@@ -188,7 +187,7 @@ def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
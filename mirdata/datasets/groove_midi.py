@@ -51,15 +51,16 @@ import os
 from typing import BinaryIO, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
 from smart_open import open
 
 from mirdata import annotations
 from mirdata import core
 from mirdata import download_utils
 from mirdata import io
+from mirdata.lazy_import import lazy_import
+
+pretty_midi = lazy_import("pretty_midi")
 
 
 BIBTEX = """@inproceedings{groove2019,
@@ -229,6 +230,8 @@ class Track(core.Track):
 
     """
 
+    _split_metadata_key = "split"
+
     def __init__(self, track_id, data_home, dataset_name, index, metadata):
         super().__init__(track_id, data_home, dataset_name, index, metadata)
 
@@ -313,11 +316,11 @@ def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """
     if not path:
         return None, None
-    return librosa.load(path, sr=22050, mono=True)
+    return io.load_audio(path, sr=22050, mono=True)
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> Optional[pretty_midi.PrettyMIDI]:
+def load_midi(fhandle: BinaryIO) -> Optional["pretty_midi.PrettyMIDI"]:
     """Load a Groove MIDI midi file.
 
     Args:
@@ -19,7 +19,6 @@
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, io, annotations
@@ -173,7 +172,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    audio, sr = librosa.load(fhandle, sr=22050, mono=True)
+    audio, sr = io.load_audio(fhandle, sr=22050, mono=True)
     return audio, sr
 
 
@@ -57,7 +57,6 @@ from typing import BinaryIO, Optional, TextIO, Tuple, Dict, List
 
 from deprecated.sphinx import deprecated
 import json
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -318,7 +317,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_bytes_io
@@ -333,7 +332,7 @@ def load_multitrack_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False)
 
 
 @io.coerce_to_string_io
@@ -8,19 +8,32 @@
 
     This dataset contains 30 pieces composed by Joseph Haydn in symbolic format, which have each been manually
     annotated with harmonic analyses.
+
+Every loader of this module derives its annotations from the same parsed score:
+each humdrum file is parsed once with music21 and kept in memory for the
+most recently used files. Parsed scores can also be persisted on disk with
+``haydn_op20.set_score_cache(cache_dir)``, so later processes skip parsing.
 """
 
+import copy
+import functools
+import hashlib
+import json
 import logging
 import os
+import pickle
 from typing import Optional, TextIO, List
 
 from deprecated.sphinx import deprecated
 import numpy as np
+from smart_open import open
 
 from mirdata import core, io, download_utils
+from mirdata.lazy_import import lazy_import
+from mirdata.version import version as mirdata_version
 
 try:
-    import music21
+    music21 = lazy_import("music21")
 except ImportError:
     logging.error(
         "In order to use haydn_op20 you must have music21 installed. "
@@ -65,6 +78,11 @@ LICENSE_INFO = (
     "Creative Commons Attribution Non Commercial Share Alike 4.0 International."
 )
 
+# number of parsed scores kept in memory
+SCORE_MEMORY_SIZE = 8
+
+_SCORE_CACHE_DIR = None
+
 
 class Track(core.Track):
     """haydn op20 track class
@@ -94,7 +112,7 @@ class Track(core.Track):
         self.title = os.path.splitext(self._track_paths["annotations"][0])[0]
 
     @core.cached_property
-    def score(self) -> music21.stream.Score:
+    def score(self) -> "music21.stream.Score":
         return load_score(self.humdrum_annotated_path)
 
     @core.cached_property
@@ -129,9 +147,77 @@ class Track(core.Track):
         return convert_and_save_to_midi(self.humdrum_annotated_path)
 
 
+def set_score_cache(cache_dir: Optional[str]) -> None:
+    """Persist parsed scores on disk, so each file is parsed once across processes
+
+    Entries are keyed by the file's path, size and modification time, and by
+    the mirdata and music21 versions.
+
+    Args:
+        cache_dir (str or None): directory where parsed scores are stored.
+            If None, parsed scores are only kept in memory.
+
+    """
+    global _SCORE_CACHE_DIR
+    _SCORE_CACHE_DIR = cache_dir
+
+
+def _parse_score(path: str):
+    """Parse a humdrum score and split it from its roman numeral annotations
+
+    Args:
+        path (str): path to the humdrum file
+
+    Returns:
+        * music21.stream.Score - score in music21 format, without annotations
+        * list - list of roman numerals [(offset, roman numeral)]
+
+    """
+    score = music21.converter.parse(path, format="humdrum")
+
+    # Stream.flat was replaced by Stream.flatten() in music21 7
+    flat_score = score.flatten() if hasattr(score, "flatten") else score.flat
+    rna = {rn.offset: rn for rn in list(flat_score.getElementsByClass("RomanNumeral"))}
+    score.remove(list(rna.values()), recurse=True)
+    rna_clean = [(offset, rn) for offset, rn in rna.items() if rn]
+    return score, rna_clean
+
+
+@functools.lru_cache(maxsize=SCORE_MEMORY_SIZE)
+def _load_parsed_score(path: str, size: int, mtime_ns: int, cache_dir: Optional[str]):
+    if cache_dir is None:
+        return _parse_score(path)
+
+    key = json.dumps(
+        [mirdata_version, music21.__version__, os.path.abspath(path), size, mtime_ns]
+    )
+    entry_path = os.path.join(
+        cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pkl"
+    )
+    try:
+        with open(entry_path, "rb") as fhandle:
+            return pickle.load(fhandle)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    parsed = _parse_score(path)
+    tmp_path = "{}.{}.tmp".format(entry_path, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as fhandle:
+            pickle.dump(parsed, fhandle, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+    except (OSError, pickle.PicklingError) as exc:
+        logging.warning("Could not write cache entry {}: {}".format(entry_path, exc))
+    return parsed
+
+
 def _split_score_annotations(fhandle: TextIO):
     """Load haydn op20 score and annotations divided.
 
+    The parsed score is shared by all the loaders of a file, so it should not
+    be modified.
+
     Args:
         fhandle (str or file-like): path to hrm annotations
 
@@ -139,18 +225,19 @@ def _split_score_annotations(fhandle: TextIO):
         music21.stream.Score: score in music21 format
         list: list of roman numerals [(time in seconds, roman numeral)]
     """
-    score = music21.converter.parse(fhandle.name, format="humdrum")
-
-    rna = {rn.offset: rn for rn in list(score.flat.getElementsByClass("RomanNumeral"))}
-    score.remove(list(rna.values()), recurse=True)
-    rna_clean = [(offset, rn) for offset, rn in rna.items() if rn]
-    return score, rna_clean
+    stat = os.stat(fhandle.name)
+    return _load_parsed_score(
+        fhandle.name, stat.st_size, stat.st_mtime_ns, _SCORE_CACHE_DIR
+    )
 
 
 @io.coerce_to_string_io
 def load_score(fhandle: TextIO):
     """Load haydn op20 score with annotations from a file with music21 format (music21.stream.Score).
 
+    Parsed scores are cached, and each call returns a copy of the cached
+    score, so it can be modified freely.
+
     Args:
         fhandle (str or file-like): path to score
 
@@ -159,7 +246,7 @@ def load_score(fhandle: TextIO):
 
     """
     score, rna = _split_score_annotations(fhandle)
-    return score
+    return copy.deepcopy(score)
 
 
 def _load_key_base(fhandle, resolution):
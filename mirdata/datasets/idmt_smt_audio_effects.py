@@ -34,7 +34,6 @@
 """
 
 import os
-import librosa
 import numpy as np
 import xml.etree.ElementTree as ET
 
@@ -191,7 +190,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
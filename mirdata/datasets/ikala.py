@@ -19,11 +19,13 @@ import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy_import import lazy_import
+
+librosa = lazy_import("librosa")
 
 
 BIBTEX = """@inproceedings{chan2015vocal,
@@ -186,7 +188,7 @@ def load_vocal_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(fhandle, sr=None, mono=False)
     vocal_channel = audio[1, :]
     return vocal_channel, sr
 
@@ -203,7 +205,7 @@ def load_instrumental_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(fhandle, sr=None, mono=False)
     instrumental_channel = audio[0, :]
     return instrumental_channel, sr
 
@@ -220,7 +222,7 @@ def load_mix_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    mixed_audio, sr = librosa.load(fhandle, sr=None, mono=True)
+    mixed_audio, sr = io.load_audio(fhandle, sr=None, mono=True)
     # multipy by 2 because librosa averages the left and right channel.
     return 2.0 * mixed_audio, sr
 
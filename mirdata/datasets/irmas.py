@@ -94,7 +94,6 @@ import os
 from typing import BinaryIO, List, Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import core, download_utils, io
@@ -252,7 +251,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=False)
+    return io.load_audio(fhandle, sr=44100, mono=False)
 
 
 @io.coerce_to_string_io
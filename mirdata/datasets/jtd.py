@@ -59,7 +59,6 @@ import json
 from typing import BinaryIO, Optional, TextIO, Tuple
 from smart_open import open
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils, core, annotations, io
@@ -538,7 +537,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @io.coerce_to_string_io
@@ -36,12 +36,13 @@ import os
 from typing import BinaryIO, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
 from smart_open import open
 
 from mirdata import core, download_utils, io
+from mirdata.lazy_import import lazy_import
+
+pretty_midi = lazy_import("pretty_midi")
 
 
 BIBTEX = """@inproceedings{
@@ -116,6 +117,8 @@ class Track(core.Track):
 
     """
 
+    _split_metadata_key = "split"
+
     def __init__(self, track_id, data_home, dataset_name, index, metadata):
         super().__init__(track_id, data_home, dataset_name, index, metadata)
 
@@ -144,7 +147,7 @@ class Track(core.Track):
         return self._track_metadata.get("duration")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> Optional["pretty_midi.PrettyMIDI"]:
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -179,7 +182,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -20,7 +20,6 @@
 
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import io, core, annotations, download_utils
@@ -121,7 +120,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -31,7 +31,6 @@ import os
 from typing import BinaryIO, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -134,7 +133,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=True)
+    return io.load_audio(fhandle, sr=22050, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
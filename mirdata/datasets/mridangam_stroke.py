@@ -44,7 +44,6 @@
 import os
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, Tuple
 
@@ -163,7 +162,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -41,9 +41,8 @@ import os
 from typing import Optional, Tuple, BinaryIO
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-from mirdata import download_utils, core
+from mirdata import download_utils, core, io
 from smart_open import open
 
 BIBTEX = """@conference {bogdanov2019mtg,
@@ -164,7 +163,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False)
 
 
 @core.docstring_inherit(core.Dataset)
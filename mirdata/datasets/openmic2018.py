@@ -40,12 +40,13 @@ import re
 from pathlib import Path
 from typing import BinaryIO, Optional, Tuple, Dict, List
 
-import librosa
 import numpy as np
-import pandas as pd
 from smart_open import open
 
 from mirdata import download_utils, core, io
+from mirdata.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
 
 BIBTEX = """
 @inproceedings{DBLP:conf/ismir/HumphreyDM18,
@@ -149,6 +150,8 @@ class Track(core.Track):
 
     """
 
+    _split_metadata_key = "split"
+
     def __init__(self, track_id, data_home, dataset_name, index, metadata):
         super().__init__(
             track_id,
@@ -279,7 +282,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
 
     """
     # -- load as 44100 mono
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 # -- use this decorator so the docs are complete
@@ -48,10 +48,12 @@
 from typing import BinaryIO, Optional, TextIO, Tuple, cast
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import annotations, core, download_utils, io
+from mirdata.lazy_import import lazy_import
+
+librosa = lazy_import("librosa")
 
 
 BIBTEX = """
@@ -343,7 +345,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -34,7 +34,6 @@ import os
 from typing import Tuple, TextIO, Optional, BinaryIO
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 
 from mirdata import download_utils, annotations, io, core
@@ -149,7 +148,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @io.coerce_to_string_io
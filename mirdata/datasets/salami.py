@@ -20,7 +20,6 @@ import os
 from typing import Optional, TextIO, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 import logging
 from smart_open import open
@@ -243,7 +242,7 @@ def load_audio(fpath: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fpath, sr=None, mono=True)
+    return io.load_audio(fpath, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
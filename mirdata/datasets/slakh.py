@@ -30,13 +30,14 @@ import os
 from typing import BinaryIO, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
-import pretty_midi
 from smart_open import open
 import yaml
 
 from mirdata import io, download_utils, core, annotations
+from mirdata.lazy_import import lazy_import
+
+pretty_midi = lazy_import("pretty_midi")
 
 BIBTEX = """
 @inproceedings{manilow2019cutting,
@@ -201,7 +202,7 @@ class Track(core.Track):
         return group[0]
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> Optional["pretty_midi.PrettyMIDI"]:
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -309,7 +310,7 @@ class MultiTrack(core.MultiTrack):
         return self._multitrack_metadata.get("overall_gain")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> Optional["pretty_midi.PrettyMIDI"]:
         return io.load_midi(self.midi_path)
 
     @core.cached_property
@@ -335,22 +336,17 @@ class MultiTrack(core.MultiTrack):
         """
         return load_audio(self.mix_path)
 
-    def get_submix_by_group(self, target_groups):
-        """Create submixes grouped by instrument type. Creates one submix
-        per target group, plus one additional "other" group for any remaining sources.
-        Only tracks with available audio are mixed.
+    def _submix_groups(self, target_groups):
+        """Assign the tracks with available audio to submix groups
 
         Args:
-            target_groups (list): List of target groups. Elements should be one of
-                MIXING_GROUPS, e.g. ["bass", "guitar"]
+            target_groups (list): List of target groups
 
         Returns:
-            * submixes (dict): {group: audio_signal} of submixes
-            * groups (dict): {group: list of track ids} of submixes
+            dict: {group: list of track ids}, with an additional "other" group
 
         """
         groups = {}
-        submixes = {}
         tracks_with_audio = [
             track for track in self.tracks.values() if track.audio_path
         ]
@@ -363,20 +359,99 @@ class MultiTrack(core.MultiTrack):
             ]
             in_group.extend(groups[group])
 
-            submixes[group] = (
-                None if len(groups[group]) == 0 else self.get_target(groups[group])
-            )
-
         groups["other"] = [
             track.track_id
             for track in tracks_with_audio
             if track.track_id not in in_group
         ]
-        submixes["other"] = (
-            None if len(groups["other"]) == 0 else self.get_target(groups["other"])
+        return groups
+
+    def get_submix_by_group(self, target_groups):
+        """Create submixes grouped by instrument type. Creates one submix
+        per target group, plus one additional "other" group for any remaining sources.
+        Only tracks with available audio are mixed.
+
+        Args:
+            target_groups (list): List of target groups. Elements should be one of
+                MIXING_GROUPS, e.g. ["bass", "guitar"]
+
+        Returns:
+            * submixes (dict): {group: audio_signal} of submixes
+            * groups (dict): {group: list of track ids} of submixes
+
+        """
+        groups = self._submix_groups(target_groups)
+
+        # all submixes are computed in one pass, loading each stem once
+        mixes = self._mix(
+            {
+                group: (track_ids, None)
+                for group, track_ids in groups.items()
+                if len(track_ids) > 0
+            }
         )
+        submixes = {group: mixes.get(group) for group in groups}
         return submixes, groups
 
+    def iter_submix_by_group(self, target_groups, block_duration=30.0):
+        """Create submixes grouped by instrument type, one block at a time.
+
+        Equivalent to get_submix_by_group, but each stem is decoded
+        block_duration seconds at a time, so memory use is bounded by the
+        duration of a block rather than by the duration of the multitrack.
+        Concatenating the blocks of a group along the last axis gives the
+        group's submix.
+
+        Args:
+            target_groups (list): List of target groups. Elements should be one of
+                MIXING_GROUPS, e.g. ["bass", "guitar"]
+            block_duration (float): duration of the blocks, in seconds
+
+        Yields:
+            dict: {group: audio_signal} of submix blocks with shape
+            (n_channels, n_samples), or None for groups without tracks.
+            Groups are the same as the ones returned by get_submix_by_group.
+            If none of the groups has tracks, nothing is yielded, whereas
+            get_submix_by_group returns None for every group.
+
+        """
+        if block_duration <= 0:
+            raise ValueError("block_duration must be positive")
+
+        groups = self._submix_groups(target_groups)
+        targets = {
+            group: (track_ids, None)
+            for group, track_ids in groups.items()
+            if len(track_ids) > 0
+        }
+        if len(targets) == 0:
+            return
+
+        # blocks are aligned to samples once the stems' sample rate is known
+        start, duration = 0.0, block_duration
+        while True:
+            sample_rates = []
+
+            def load_block(track_id):
+                audio, sample_rate = self.tracks[track_id].load_audio_segment(
+                    start, duration, mono=False
+                )
+                sample_rates.append(sample_rate)
+                return audio, sample_rate
+
+            mixes = self._mix(targets, load_audio=load_block)
+            n_samples = max(mix.shape[-1] for mix in mixes.values())
+            if n_samples == 0:
+                return
+            yield {group: mixes.get(group) for group in groups}
+
+            # a block shorter than requested means the longest stem ended
+            block_size = int(round(block_duration * sample_rates[0]))
+            if n_samples < block_size:
+                return
+            start = (round(start * sample_rates[0]) + block_size) / sample_rates[0]
+            duration = block_size / sample_rates[0]
+
 
 @io.coerce_to_bytes_io
 def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
@@ -390,7 +465,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False)
 
 
 @core.docstring_inherit(core.Dataset)
@@ -48,7 +48,6 @@ import os
 from typing import BinaryIO, Optional, Tuple
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -119,6 +118,8 @@ class Track(core.Track):
 
     """
 
+    _split_metadata_key = "Fold"
+
     def __init__(self, track_id, data_home, dataset_name, index, metadata):
         super().__init__(track_id, data_home, dataset_name, index, metadata)
 
@@ -200,7 +201,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @core.docstring_inherit(core.Dataset)
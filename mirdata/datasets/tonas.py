@@ -48,7 +48,6 @@ import os
 from typing import TextIO, Tuple, Optional
 
 from deprecated.sphinx import deprecated
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -200,7 +199,7 @@ def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=44100, mono=True)
+    return io.load_audio(fhandle, sr=44100, mono=True)
 
 
 @io.coerce_to_string_io
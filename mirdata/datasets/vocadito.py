@@ -20,7 +20,6 @@ import csv
 import os
 from typing import BinaryIO, List, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 from smart_open import open
 
@@ -146,7 +145,7 @@ def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
         * float - sample rate
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 @io.coerce_to_string_io
@@ -1,11 +1,19 @@
 """Utilities for downloading from the web."""
 
 import chardet
+import concurrent.futures
 import glob
+import hashlib
+import http.client
 import logging
 import os
 import shutil
+import socket
 import tarfile
+import tempfile
+import threading
+import time
+import urllib.error
 import urllib.request
 import zipfile
 import warnings
@@ -17,6 +25,15 @@ from mirdata.validate import md5
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
+# size of the chunks read from the network and written to disk when downloading
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# number of times an interrupted download is resumed before giving up
+DOWNLOAD_RETRIES = 5
+# seconds without receiving data after which a download is considered interrupted
+DOWNLOAD_TIMEOUT = 60
+# suffix of partially downloaded files, which are resumed on the next download
+PARTIAL_SUFFIX = ".part"
+
 
 class RemoteFileMetadata(object):
     """The metadata for a remote file
@@ -50,6 +67,8 @@ def downloader(
     force_overwrite=False,
     cleanup=False,
     allow_invalid_checksum=False,
+    num_workers=1,
+    stream_extract=False,
 ):
     """Download data to `save_dir` and optionally log a message.
 
@@ -75,6 +94,14 @@ def downloader(
         allow_invalid_checksum (bool):
             Allow having an invalid checksum, and whenever this happens prompt a
             warning instead of deleting the files.
+        num_workers (int):
+            Number of remotes downloaded concurrently. Archives are extracted
+            one after another, in order, once all downloads are complete.
+        stream_extract (bool):
+            If True, tar archives are extracted while they are downloaded,
+            instead of being written to disk, re-read to verify their checksum
+            and read again to be extracted. Combined with cleanup=True, the
+            archives are never written to disk.
 
     """
     if not os.path.exists(save_dir):
@@ -133,29 +160,73 @@ def downloader(
         else:
             logging.warning("Downloading {} to {}".format(objs_to_download, save_dir))
 
+        downloaded = {}
+        if num_workers > 1:
+            downloaded = download_remotes(
+                {
+                    k: remotes[k]
+                    for k in objs_to_download
+                    if not (stream_extract and _is_tar_file(remotes[k].filename))
+                },
+                save_dir,
+                force_overwrite,
+                allow_invalid_checksum,
+                num_workers,
+            )
+            # archives are independent, so they are extracted concurrently too
+            extract_archives(
+                {
+                    k: path
+                    for k, path in downloaded.items()
+                    if ".zip" in os.path.splitext(path)[-1] or _is_tar_file(path)
+                },
+                cleanup,
+                num_workers,
+            )
+
+        # source directories already unpacked, when archives were extracted
+        # concurrently before unpacking
+        unpacked = set()
         for k in objs_to_download:
-            logging.warning("[{}] downloading {}".format(k, remotes[k].filename))
             extension = os.path.splitext(remotes[k].filename)[-1]
+            if k not in downloaded:
+                logging.warning("[{}] downloading {}".format(k, remotes[k].filename))
             if ".zip" in extension:
-                download_zip_file(
-                    remotes[k],
-                    save_dir,
-                    force_overwrite,
-                    cleanup,
-                    allow_invalid_checksum,
-                )
-            elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
-                download_tar_file(
-                    remotes[k],
-                    save_dir,
-                    force_overwrite,
-                    cleanup,
-                    allow_invalid_checksum,
-                )
+                if k not in downloaded:
+                    download_zip_file(
+                        remotes[k],
+                        save_dir,
+                        force_overwrite,
+                        cleanup,
+                        allow_invalid_checksum,
+                    )
+            elif _is_tar_file(remotes[k].filename):
+                if k in downloaded:
+                    pass
+                elif stream_extract:
+                    download_tar_file(
+                        remotes[k],
+                        save_dir,
+                        force_overwrite,
+                        cleanup,
+                        allow_invalid_checksum,
+                        stream_extract=True,
+                    )
+                else:
+                    download_tar_file(
+                        remotes[k],
+                        save_dir,
+                        force_overwrite,
+                        cleanup,
+                        allow_invalid_checksum,
+                    )
             else:
-                download_path = download_from_remote(
-                    remotes[k], save_dir, force_overwrite, allow_invalid_checksum
-                )
+                if k in downloaded:
+                    download_path = downloaded[k]
+                else:
+                    download_path = download_from_remote(
+                        remotes[k], save_dir, force_overwrite, allow_invalid_checksum
+                    )
 
                 # Special handling for index files that might be zipped
                 # Check if this is an index file and if the downloaded file is actually a zip
@@ -188,6 +259,8 @@ def downloader(
                     )
                     # path to directory to unpack
                     source_dir = os.path.join(destination_dir, src_dir)
+                    if k in downloaded and source_dir in unpacked:
+                        continue
 
                     if not os.path.exists(source_dir):
                         logging.warning(
@@ -198,11 +271,21 @@ def downloader(
                         return
 
                     move_directory_contents(source_dir, destination_dir)
+                    if k in downloaded:
+                        unpacked.add(source_dir)
 
     if info_message is not None:
         logging.warning(info_message.format(save_dir))
 
 
+def _is_tar_file(filename):
+    """Check if a remote file is downloaded as a tar archive"""
+    extension = os.path.splitext(filename)[-1]
+    if ".zip" in extension:
+        return False
+    return ".gz" in extension or ".tar" in extension or ".bz2" in extension
+
+
 class DownloadProgressBar(tqdm):
     """
     Wrap `tqdm` to show download progress
@@ -214,24 +297,170 @@ class DownloadProgressBar(tqdm):
         self.update(b * bsize - self.n)
 
 
-def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checksum):
-    """Download a remote dataset into path
-    Fetch a dataset pointed by remote's url, save into path using remote's
-    filename and ensure its integrity based on the MD5 Checksum of the
-    downloaded file.
+def download_remotes(
+    remotes, save_dir, force_overwrite, allow_invalid_checksum, num_workers
+):
+    """Download several remotes concurrently
 
-    Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
+    Args:
+        remotes (dict): RemoteFileMetadata objects to download, by key
+        save_dir (str): Directory to save the files to. Usually `data_home`
+        force_overwrite (bool): If True, overwrite existing files
+        allow_invalid_checksum (bool): If True, warn instead of raising an error
+            when a downloaded file has an invalid checksum
+        num_workers (int): number of files downloaded at the same time
+
+    Returns:
+        dict: full path of each downloaded file, by key
+
+    Raises:
+        IOError: if a download fails or a file has an invalid checksum. The
+            other downloads are completed first.
+
+    """
+    logging.warning(
+        "Downloading {} with {} concurrent downloads".format(
+            list(remotes.keys()), num_workers
+        )
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+        futures = {
+            k: pool.submit(
+                download_from_remote,
+                remote,
+                save_dir,
+                force_overwrite,
+                allow_invalid_checksum,
+            )
+            for k, remote in remotes.items()
+        }
+        concurrent.futures.wait(futures.values())
+    return {k: future.result() for k, future in futures.items()}
+
+
+def _is_retryable(exc):
+    """Check if a download error is a transient network error worth retrying"""
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code >= 500
+    return isinstance(
+        exc,
+        (
+            urllib.error.URLError,
+            ConnectionError,
+            socket.timeout,
+            http.client.IncompleteRead,
+        ),
+    )
+
+
+def _stream_to_file(url, download_path, chunk_size=DOWNLOAD_CHUNK_SIZE, checksum=None):
+    """Stream a url to a file, resuming any partial download, and hash it on the fly
+
+    Data is written to ``download_path + PARTIAL_SUFFIX``, which is renamed to
+    download_path once complete. If a partial file exists, only the missing
+    bytes are requested with an HTTP Range request. If the server does not
+    support range requests, the file is downloaded from scratch. If the
+    partial file is already complete, it is renamed without downloading it again.
 
     Args:
-        remote (RemoteFileMetadata): Named tuple containing remote dataset
-            meta information: url, filename and checksum
+        url (str): the url to download
+        download_path (str): path of the downloaded file
+        chunk_size (int): number of bytes read and written at a time
+        checksum (str or None): expected md5 checksum of the file, used to tell
+            if a partial file is complete. If None, the size reported by the
+            server is used instead
+
+    Returns:
+        str: md5 checksum of the downloaded file
+
+    """
+    partial_path = download_path + PARTIAL_SUFFIX
+    offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+
+    request = urllib.request.Request(url)
+    if offset > 0:
+        request.add_header("Range", "bytes={}-".format(offset))
+
+    try:
+        response = urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT)
+    except urllib.error.HTTPError as exc:
+        if offset > 0 and exc.code == 416:
+            # the requested range starts at or past the end of the file: the
+            # partial file is either complete or invalid
+            partial_checksum = md5(partial_path)
+            if checksum is None:
+                is_complete = _content_range_size(exc.headers) == offset
+            else:
+                is_complete = partial_checksum == checksum
+            if is_complete:
+                os.replace(partial_path, download_path)
+                return partial_checksum
+            os.remove(partial_path)
+            return _stream_to_file(url, download_path, chunk_size, checksum)
+        raise
+
+    hash_md5 = hashlib.md5()
+    with response:
+        if offset > 0 and response.getcode() == 206:
+            mode = "ab"
+            # the bytes already on disk are read once to seed the checksum
+            with open(partial_path, "rb") as fhandle:
+                for chunk in iter(lambda: fhandle.read(chunk_size), b""):
+                    hash_md5.update(chunk)
+        else:
+            offset = 0
+            mode = "wb"
+
+        content_length = response.headers.get("Content-Length")
+        total = int(content_length) + offset if content_length else None
+        with DownloadProgressBar(
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            total=total,
+            initial=offset,
+            desc=os.path.basename(download_path),
+        ) as progress, open(partial_path, mode) as fhandle:
+            for chunk in iter(lambda: response.read(chunk_size), b""):
+                fhandle.write(chunk)
+                hash_md5.update(chunk)
+                progress.update(len(chunk))
+                offset += len(chunk)
+
+        if total is not None and offset < total:
+            raise http.client.IncompleteRead(b"", total - offset)
+
+    os.replace(partial_path, download_path)
+    return hash_md5.hexdigest()
+
+
+def _content_range_size(headers):
+    """Get the size of the complete file from a Content-Range header
+
+    Args:
+        headers (email.message.Message or None): http response headers
+
+    Returns:
+        int or None: the size, or None if it is unknown
+
+    """
+    content_range = headers.get("Content-Range") if headers is not None else None
+    if not content_range or "/" not in content_range:
+        return None
+    size = content_range.rsplit("/", 1)[1].strip()
+    return int(size) if size.isdigit() else None
+
+
+def _get_download_path(remote, save_dir):
+    """Get the local path of a remote file, creating its directory if needed
+
+    Args:
+        remote (RemoteFileMetadata): the remote file
         save_dir (str): Directory to save the file to. Usually `data_home`
-        force_overwrite  (bool):
-            If True, overwrite existing file with the downloaded file.
-            If False, does not overwrite, but checks that checksum is consistent.
 
     Returns:
-        str: Full path of the created file.
+        str: Full path of the local file
 
     """
     file_uri = parse_uri(save_dir)
@@ -249,50 +478,61 @@ def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checks
     if not os.path.exists(download_dir):
         os.makedirs(download_dir)
 
-    download_path = os.path.join(download_dir, remote.filename)
+    return os.path.join(download_dir, remote.filename)
 
-    if not os.path.exists(download_path) or force_overwrite:
-        # if we got here, we want to overwrite any existing file
-        if os.path.exists(download_path):
-            os.remove(download_path)
 
-        # If file doesn't exist or we want to overwrite, download it
-        with DownloadProgressBar(
-            unit="B", unit_scale=True, unit_divisor=1024, miniters=1
-        ) as t:
-            try:
-                urllib.request.urlretrieve(
-                    remote.url,
-                    filename=download_path,
-                    reporthook=t.update_to,
-                    data=None,
-                )
-            except Exception as exc:
-                error_msg = """
-                            mirdata failed to download the dataset from {}!
-                            Please try again in a few minutes.
-                            If this error persists, please raise an issue at
-                            https://github.com/mir-dataset-loaders/mirdata,
-                            and tag it with 'broken-link'.
-                            """.format(
-                    remote.url
+def _with_retries(download_function, url):
+    """Call download_function, retrying it if the download is interrupted
+
+    Args:
+        download_function (function): function without arguments which downloads url
+        url (str): the downloaded url, for logging
+
+    Returns:
+        the output of download_function
+
+    """
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        try:
+            return download_function()
+        except Exception as exc:
+            if attempt < DOWNLOAD_RETRIES and _is_retryable(exc):
+                logging.warning(
+                    "Download of {} interrupted ({}), resuming...".format(url, exc)
                 )
-                logging.error(error_msg)
-                raise exc
-    else:
-        logging.warning(
-            "{} already exists and will not be downloaded. ".format(download_path)
-            + "Rerun with force_overwrite=True to delete this file and force the download."
-        )
+                time.sleep(min(2**attempt, 30))
+                continue
+            error_msg = """
+                        mirdata failed to download the dataset from {}!
+                        Please try again in a few minutes.
+                        If this error persists, please raise an issue at
+                        https://github.com/mir-dataset-loaders/mirdata,
+                        and tag it with 'broken-link'.
+                        """.format(url)
+            logging.error(error_msg)
+            raise exc
+
+
+def _check_checksum(download_path, checksum, expected_checksum, allow_invalid_checksum):
+    """Raise an error (or warn) if a downloaded file's checksum is not the expected one
+
+    Args:
+        download_path (str): path of the downloaded file
+        checksum (str): the md5 checksum of the downloaded data
+        expected_checksum (str): the expected md5 checksum
+        allow_invalid_checksum (bool): if True, warn instead of raising an error
+
+    Raises:
+        IOError: if the checksums differ and allow_invalid_checksum is False
 
-    checksum = md5(download_path)
-    if remote.checksum != checksum:
+    """
+    if expected_checksum != checksum:
         if allow_invalid_checksum:
             warnings.warn(
                 "{} has an MD5 checksum ({}) "
                 "differing from expected ({}), "
                 "file may be corrupted.".format(
-                    download_path, checksum, remote.checksum
+                    download_path, checksum, expected_checksum
                 ),
                 UserWarning,
             )
@@ -301,9 +541,62 @@ def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checks
                 "{} has an MD5 checksum ({}) "
                 "differing from expected ({}), "
                 "file may be corrupted.".format(
-                    download_path, checksum, remote.checksum
+                    download_path, checksum, expected_checksum
                 )
             )
+
+
+def download_from_remote(remote, save_dir, force_overwrite, allow_invalid_checksum):
+    """Download a remote dataset into path
+    Fetch a dataset pointed by remote's url, save into path using remote's
+    filename and ensure its integrity based on the MD5 Checksum of the
+    downloaded file.
+
+    The checksum is computed while the file is downloaded. Interrupted
+    downloads are retried, resuming from the last received byte when the
+    server supports HTTP Range requests, and a partially downloaded file left
+    by a previous call is resumed as well.
+
+    Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
+
+    Args:
+        remote (RemoteFileMetadata): Named tuple containing remote dataset
+            meta information: url, filename and checksum
+        save_dir (str): Directory to save the file to. Usually `data_home`
+        force_overwrite  (bool):
+            If True, overwrite existing file with the downloaded file.
+            If False, does not overwrite, but checks that checksum is consistent.
+
+    Returns:
+        str: Full path of the created file.
+
+    """
+    download_path = _get_download_path(remote, save_dir)
+
+    checksum = None
+    if not os.path.exists(download_path) or force_overwrite:
+        # if we got here, we want to overwrite any existing file
+        if os.path.exists(download_path):
+            os.remove(download_path)
+        if force_overwrite and os.path.exists(download_path + PARTIAL_SUFFIX):
+            os.remove(download_path + PARTIAL_SUFFIX)
+
+        # If file doesn't exist or we want to overwrite, download it
+        checksum = _with_retries(
+            lambda: _stream_to_file(
+                remote.url, download_path, checksum=remote.checksum
+            ),
+            remote.url,
+        )
+    else:
+        logging.warning(
+            "{} already exists and will not be downloaded. ".format(download_path)
+            + "Rerun with force_overwrite=True to delete this file and force the download."
+        )
+
+    if checksum is None:
+        checksum = md5(download_path)
+    _check_checksum(download_path, checksum, remote.checksum, allow_invalid_checksum)
     return download_path
 
 
@@ -329,66 +622,149 @@ def download_zip_file(
     unzip(zip_download_path, cleanup=cleanup)
 
 
-def extractall_unicode(zfile, out_dir):
+def _unicode_filename(member):
+    """Get the name of a zip archive member, fixing its encoding if needed
+
+    Args:
+        member (zipfile.ZipInfo): the zip archive member
+
+    Returns:
+        str: the member's filename
+
+    """
+    ZIP_FILENAME_UTF8_FLAG = 0x800
+
+    filename = member.filename
+
+    # if block to deal with irmas and good-sounds archives
+    # check if the zip archive does not have the encoding info set
+    # encode-decode filename only if it's different than the original name
+    if (member.flag_bits & ZIP_FILENAME_UTF8_FLAG == 0) and filename.encode(
+        "cp437"
+    ).decode(errors="ignore") != filename:
+        filename_bytes = filename.encode("cp437")
+        if filename_bytes.decode("utf-8", "replace") != filename_bytes.decode(
+            errors="ignore"
+        ):
+            guessed_encoding = chardet.detect(filename_bytes)["encoding"] or "utf8"
+            filename = filename_bytes.decode(guessed_encoding, "replace")
+        else:
+            filename = filename_bytes.decode("utf-8", "replace")
+
+    return filename
+
+
+def _extract_member(zfile, member, disk_file_name):
+    """Write a zip archive member to disk in chunks, in constant memory
+
+    Args:
+        zfile (obj): Zip file object created with zipfile.ZipFile
+        member (zipfile.ZipInfo): the member to extract
+        disk_file_name (str): path of the extracted file
+
+    """
+    with zfile.open(member) as source, open(disk_file_name, "wb") as fd:
+        shutil.copyfileobj(source, fd, DOWNLOAD_CHUNK_SIZE)
+
+
+def extractall_unicode(zfile, out_dir, num_workers=1):
     """Extract all files inside a zip archive to a output directory.
 
-    In comparison to the zipfile, it checks for correct file name encoding
+    In comparison to the zipfile, it checks for correct file name encoding.
+    Members are copied to disk in chunks, so extracting large members doesn't
+    require holding them in memory.
 
     Args:
         zfile (obj): Zip file object created with zipfile.ZipFile
         out_dir (str): Output folder
+        num_workers (int): number of members extracted concurrently. Each worker
+            reads the archive through its own file handle.
 
     """
-    ZIP_FILENAME_UTF8_FLAG = 0x800
-
+    members = []
     for m in zfile.infolist():
-        data = zfile.read(m)  # extract zipped data into memory
-
-        filename = m.filename
-
-        # if block to deal with irmas and good-sounds archives
-        # check if the zip archive does not have the encoding info set
-        # encode-decode filename only if it's different than the original name
-        if (m.flag_bits & ZIP_FILENAME_UTF8_FLAG == 0) and filename.encode(
-            "cp437"
-        ).decode(errors="ignore") != filename:
-            filename_bytes = filename.encode("cp437")
-            if filename_bytes.decode("utf-8", "replace") != filename_bytes.decode(
-                errors="ignore"
-            ):
-                guessed_encoding = chardet.detect(filename_bytes)["encoding"] or "utf8"
-                filename = filename_bytes.decode(guessed_encoding, "replace")
-            else:
-                filename = filename_bytes.decode("utf-8", "replace")
-
-        disk_file_name = os.path.join(out_dir, filename)
+        disk_file_name = os.path.join(out_dir, _unicode_filename(m))
 
         dir_name = os.path.dirname(disk_file_name)
         if not os.path.exists(dir_name):
             os.makedirs(dir_name)
 
         if not os.path.isdir(disk_file_name):
-            with open(disk_file_name, "wb") as fd:
-                fd.write(data)
-
-
-def unzip(zip_path, cleanup):
+            members.append((m, disk_file_name))
+
+    if num_workers <= 1 or len(members) <= 1 or zfile.filename is None:
+        for m, disk_file_name in members:
+            _extract_member(zfile, m, disk_file_name)
+        return
+
+    handles = threading.local()
+    opened = []
+    lock = threading.Lock()
+
+    def extract(member_and_path):
+        if not hasattr(handles, "zfile"):
+            handles.zfile = zipfile.ZipFile(zfile.filename, "r")
+            with lock:
+                opened.append(handles.zfile)
+        _extract_member(handles.zfile, *member_and_path)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+            # consume the results to raise any error
+            list(pool.map(extract, members))
+    finally:
+        for handle in opened:
+            handle.close()
+
+
+def unzip(zip_path, cleanup, num_workers=1):
     """Unzip a zip file inside it's current directory.
 
     Args:
         zip_path (str): Path to zip file
         cleanup (bool): If True, remove zipfile after unzipping
+        num_workers (int): number of members extracted concurrently
 
     """
     zfile = zipfile.ZipFile(zip_path, "r")
-    extractall_unicode(zfile, os.path.dirname(zip_path))
+    extractall_unicode(zfile, os.path.dirname(zip_path), num_workers=num_workers)
     zfile.close()
     if cleanup:
         os.remove(zip_path)
 
 
+def extract_archives(archive_paths, cleanup, num_workers):
+    """Extract several zip or tar archives concurrently, each inside its directory
+
+    Workers left over when there are fewer archives than workers are used to
+    extract the members of zip archives concurrently.
+
+    Args:
+        archive_paths (dict): paths to the archives, by remote key
+        cleanup (bool): If True, remove the archives after extracting them
+        num_workers (int): number of archives extracted concurrently
+
+    """
+    member_workers = max(1, num_workers // max(1, len(archive_paths)))
+
+    def extract(archive_path):
+        if ".zip" in os.path.splitext(archive_path)[-1]:
+            unzip(archive_path, cleanup=cleanup, num_workers=member_workers)
+        else:
+            untar(archive_path, cleanup=cleanup)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+        # consume the results to raise any error
+        list(pool.map(extract, archive_paths.values()))
+
+
 def download_tar_file(
-    tar_remote, save_dir, force_overwrite, cleanup, allow_invalid_checksum
+    tar_remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    allow_invalid_checksum,
+    stream_extract=False,
 ):
     """Download and untar a tar file.
 
@@ -397,14 +773,193 @@ def download_tar_file(
         save_dir (str): Path to save downloaded file
         force_overwrite (bool): If True, overwrites existing files
         cleanup (bool): If True, remove tarfile after untarring
+        stream_extract (bool): If True, extract the archive while it is being
+            downloaded (see stream_untar). Falls back to downloading then
+            extracting if the archive, or part of it, was already downloaded.
 
     """
+    if stream_extract:
+        tar_download_path = _get_download_path(tar_remote, save_dir)
+        if force_overwrite or not (
+            os.path.exists(tar_download_path)
+            or os.path.exists(tar_download_path + PARTIAL_SUFFIX)
+        ):
+            stream_untar(
+                tar_remote, save_dir, cleanup, allow_invalid_checksum, force_overwrite
+            )
+            return
+
     tar_download_path = download_from_remote(
         tar_remote, save_dir, force_overwrite, allow_invalid_checksum
     )
     untar(tar_download_path, cleanup=cleanup)
 
 
+class _HashingReader(object):
+    """Read-only file-like wrapper which hashes the data read from a stream,
+    optionally copying it to a file
+
+    Args:
+        stream (file-like): the stream to read from
+        copy (file-like or None): if not None, the data read is written to it
+        progress (tqdm or None): if not None, updated with the number of bytes read
+
+    """
+
+    def __init__(self, stream, copy=None, progress=None):
+        self._stream = stream
+        self._copy = copy
+        self._progress = progress
+        self.hash_md5 = hashlib.md5()
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self.hash_md5.update(data)
+        if self._copy is not None:
+            self._copy.write(data)
+        if self._progress is not None:
+            self._progress.update(len(data))
+        return data
+
+    def drain(self, chunk_size=DOWNLOAD_CHUNK_SIZE):
+        """Read (and hash) the stream until its end"""
+        while self.read(chunk_size):
+            pass
+
+
+def _stream_untar_once(url, download_path, keep_archive, extract_dir):
+    """Download a tar archive and extract it on the fly
+
+    Args:
+        url (str): url of the archive
+        download_path (str): path of the archive
+        keep_archive (bool): if True, the archive is saved to download_path
+        extract_dir (str): directory the archive is extracted to
+
+    Returns:
+        str: md5 checksum of the archive
+
+    """
+    partial_path = download_path + PARTIAL_SUFFIX
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+        content_length = response.headers.get("Content-Length")
+        with DownloadProgressBar(
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            total=int(content_length) if content_length else None,
+            desc=os.path.basename(download_path),
+        ) as progress:
+            archive = open(partial_path, "wb") if keep_archive else None
+            try:
+                reader = _HashingReader(response, archive, progress)
+                with tarfile.open(fileobj=reader, mode="r|*") as tfile:
+                    tfile.extractall(extract_dir)
+                # hash any padding after the end of the archive
+                reader.drain()
+            finally:
+                if archive is not None:
+                    archive.close()
+
+    if keep_archive:
+        os.replace(partial_path, download_path)
+    return reader.hash_md5.hexdigest()
+
+
+def stream_untar(
+    tar_remote, save_dir, cleanup, allow_invalid_checksum, force_overwrite=False
+):
+    """Download a tar file and extract its members as they arrive
+
+    The archive is read from the network only once: its checksum is computed,
+    and members are extracted, while it is downloaded. If cleanup is True the
+    archive itself is never written to disk.
+
+    Members are extracted to a temporary directory next to their final
+    location, and only moved into place once the archive's checksum is known
+    to be valid (or if allow_invalid_checksum is True), so existing files are
+    never modified by an invalid or interrupted download. The temporary
+    directory is removed in every case.
+
+    A streamed extraction can't be resumed. If the download is interrupted,
+    the archive is downloaded with download_tar_file instead, resuming from
+    the bytes already saved if cleanup is False, then extracted.
+
+    Args:
+        tar_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save the extracted files
+        cleanup (bool): If False, the archive is also saved to disk
+        allow_invalid_checksum (bool): If True, warn instead of raising an
+            error if the archive's checksum is invalid
+        force_overwrite (bool): If True, remove an existing archive first
+
+    Raises:
+        IOError: if the archive's checksum is invalid
+
+    """
+    download_path = _get_download_path(tar_remote, save_dir)
+    if force_overwrite and os.path.exists(download_path):
+        os.remove(download_path)
+
+    target_dir = os.path.dirname(download_path)
+    extract_dir = tempfile.mkdtemp(prefix=".mirdata_extract_", dir=target_dir)
+    try:
+        try:
+            checksum = _stream_untar_once(
+                tar_remote.url, download_path, not cleanup, extract_dir
+            )
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            logging.warning(
+                "Download of {} interrupted ({}), resuming without streamed "
+                "extraction...".format(tar_remote.url, exc)
+            )
+            checksum = None
+
+        if checksum is not None and (
+            checksum == tar_remote.checksum or allow_invalid_checksum
+        ):
+            _move_tree(extract_dir, target_dir)
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+    if checksum is None:
+        download_tar_file(tar_remote, save_dir, False, cleanup, allow_invalid_checksum)
+        return
+
+    _check_checksum(
+        download_path, checksum, tar_remote.checksum, allow_invalid_checksum
+    )
+
+
+def _move_tree(source_dir, target_dir):
+    """Move the content of a directory into another one, merging subdirectories
+
+    Files which already exist in target_dir are replaced.
+
+    Args:
+        source_dir (str): directory whose content is moved
+        target_dir (str): directory the content is moved to
+
+    """
+    for name in os.listdir(source_dir):
+        source = os.path.join(source_dir, name)
+        target = os.path.join(target_dir, name)
+        if (
+            os.path.isdir(source)
+            and not os.path.islink(source)
+            and os.path.isdir(target)
+            and not os.path.islink(target)
+        ):
+            _move_tree(source, target)
+        else:
+            if os.path.isdir(target) and not os.path.islink(target):
+                shutil.rmtree(target)
+            os.replace(source, target)
+
+
 def untar(tar_path, cleanup):
     """Untar a tar file inside it's current directory.
 
@@ -1,12 +1,20 @@
 import functools
 import io
-from typing import Any, BinaryIO, Callable, List, Optional, TextIO, Union
+import os
+from typing import Any, BinaryIO, Callable, List, Optional, TextIO, Tuple, Union
 
 import numpy as np
-import pretty_midi
 from smart_open import open
 
 from mirdata import annotations
+from mirdata import cache
+from mirdata.lazy_import import lazy_import
+
+librosa = lazy_import("librosa")
+pretty_midi = lazy_import("pretty_midi")
+soundfile = lazy_import("soundfile")
+
+_AUDIO_CACHE = None
 
 
 def coerce_to_string_io(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -57,8 +65,151 @@ def coerce_to_bytes_io(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+def set_audio_cache(
+    cache_dir: Optional[str], max_size: Optional[int] = None, mmap: bool = False
+) -> None:
+    """Cache decoded audio on disk for every loader using ``load_audio``
+
+    Args:
+        cache_dir (str or None): directory where decoded audio is stored.
+            If None, disables the audio cache.
+        max_size (int or None): maximum size of the cache in bytes. Least
+            recently used entries are evicted beyond this size.
+            If None, the cache is unbounded.
+        mmap (bool): if True, cached audio is returned as read-only
+            memory-mapped arrays
+
+    """
+    global _AUDIO_CACHE
+    if cache_dir is None:
+        _AUDIO_CACHE = None
+    else:
+        _AUDIO_CACHE = cache.AudioCache(cache_dir, max_size=max_size, mmap=mmap)
+
+
+def get_audio_cache() -> Optional[cache.AudioCache]:
+    """Get the audio cache set with ``set_audio_cache``
+
+    Returns:
+        AudioCache or None: the audio cache, or None if audio is not cached
+
+    """
+    return _AUDIO_CACHE
+
+
+def _local_path(path_or_obj: Union[str, BinaryIO]) -> Optional[str]:
+    path = path_or_obj if isinstance(path_or_obj, str) else None
+    if path is None:
+        path = getattr(path_or_obj, "name", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        return path
+    return None
+
+
+def load_audio(
+    path_or_obj: Union[str, BinaryIO],
+    sr: Optional[float] = None,
+    mono: bool = True,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Tuple[np.ndarray, float]:
+    """Load audio with librosa, through the audio cache if one is set
+
+    Args:
+        path_or_obj (str or file-like): path or file-like object pointing to an audio file
+        sr (float or None): sample rate to resample to. If None, the native
+            sample rate is used
+        mono (bool): if True, audio is downmixed to mono
+        offset (float): start reading after this time, in seconds
+        duration (float or None): only load up to this much audio, in seconds
+
+    Returns:
+        * np.ndarray - the audio signal
+        * float - the sample rate of the audio
+
+    """
+
+    def _load():
+        return librosa.load(
+            path_or_obj, sr=sr, mono=mono, offset=offset, duration=duration
+        )
+
+    local_path = _local_path(path_or_obj) if _AUDIO_CACHE is not None else None
+    if local_path is None:
+        return _load()
+    return _AUDIO_CACHE.get(local_path, sr, mono, offset, duration, _load)
+
+
+def load_audio_segment(
+    path_or_obj: Union[str, BinaryIO],
+    start: float,
+    duration: float,
+    sr: Optional[float] = None,
+    mono: bool = True,
+) -> Tuple[np.ndarray, float]:
+    """Load a segment of an audio file, decoding only the requested samples
+
+    Formats supported by soundfile (e.g. wav, flac, ogg) are seeked to start,
+    so the cost of loading is proportional to duration rather than to the
+    length of the file. Other formats are decoded with librosa from the start
+    of the file up to the end of the segment, or sliced from the audio cache
+    if one is set (see ``set_audio_cache``).
+
+    Args:
+        path_or_obj (str or file-like): path or file-like object pointing to an audio file
+        start (float): start of the segment, in seconds
+        duration (float): duration of the segment, in seconds
+        sr (float or None): sample rate to resample to. If None, the native
+            sample rate is used
+        mono (bool): if True, audio is downmixed to mono
+
+    Returns:
+        * np.ndarray - the audio signal, of shape (n_samples,) if mono or if
+          the file has a single channel, or (n_channels, n_samples) otherwise
+        * float - the sample rate of the audio
+
+    """
+    if start < 0 or duration < 0:
+        raise ValueError("start and duration must be non-negative")
+
+    if isinstance(path_or_obj, str):
+        with open(path_or_obj, "rb") as fhandle:
+            return load_audio_segment(fhandle, start, duration, sr=sr, mono=mono)
+
+    try:
+        sfile = soundfile.SoundFile(path_or_obj)
+    except RuntimeError:
+        sfile = None
+    if sfile is None:
+        path_or_obj.seek(0)
+        local_path = _local_path(path_or_obj)
+        if _AUDIO_CACHE is not None and local_path is not None:
+            audio, sample_rate = load_audio(local_path, sr=sr, mono=mono)
+            first = int(round(start * sample_rate))
+            last = first + int(round(duration * sample_rate))
+            return audio[..., first:last], sample_rate
+        return load_audio(
+            path_or_obj, sr=sr, mono=mono, offset=start, duration=duration
+        )
+
+    with sfile:
+        native_sr = sfile.samplerate
+        first = min(int(round(start * native_sr)), sfile.frames)
+        sfile.seek(first)
+        audio = sfile.read(
+            frames=int(round(duration * native_sr)), dtype="float32", always_2d=True
+        ).T
+    if mono or audio.shape[0] == 1:
+        # single-channel audio has shape (n_samples,), as with librosa.load
+        audio = librosa.to_mono(audio)
+    if sr is not None and sr != native_sr:
+        audio = librosa.resample(audio, orig_sr=native_sr, target_sr=sr)
+        return audio, sr
+    return audio, native_sr
+
+
 @coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
+def load_midi(fhandle: BinaryIO) -> "pretty_midi.PrettyMIDI":
     """Load a midi file.
 
     Args:
@@ -73,7 +224,7 @@ def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
 
 def load_notes_from_midi(
     midi_path: Optional[Union[str, BinaryIO]] = None,
-    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    midi: Optional["pretty_midi.PrettyMIDI"] = None,
     skip_drums: bool = True,
 ) -> Optional[annotations.NoteData]:
     """Load note data from a midi file
@@ -123,7 +274,7 @@ def load_notes_from_midi(
 
 def load_multif0_from_midi(
     midi_path: Optional[Union[str, BinaryIO]] = None,
-    midi: Optional[pretty_midi.PrettyMIDI] = None,
+    midi: Optional["pretty_midi.PrettyMIDI"] = None,
     skip_drums: bool = True,
     pitch_bend: bool = False,
 ) -> Optional[annotations.MultiF0Data]:
@@ -142,7 +293,7 @@ def load_multif0_from_midi(
     """
 
     def _to_idx(time_in_sec, hop):
-        return int(np.round(time_in_sec / hop))
+        return np.round(np.asarray(time_in_sec, dtype=float) / hop).astype(int)
 
     if not midi and not midi_path:
         raise ValueError("At least one of midi_path or midi must be provided")
@@ -152,53 +303,71 @@ def load_multif0_from_midi(
     times_raw = midi._PrettyMIDI__tick_to_time  # type: ignore
     time_hop = np.min(np.diff(times_raw))
     times = np.arange(0, np.max(times_raw) + time_hop, time_hop)
-    freqs_list: List[list] = [[] for _ in times]
-    confidence: List[list] = [[] for _ in times]
-    has_data = False
+
+    time_idx: List[np.ndarray] = []
+    pitch_val: List[np.ndarray] = []
+    conf_val: List[np.ndarray] = []
     for instrument in midi.instruments:  # type: ignore
         if instrument.is_drum and skip_drums:
             continue
 
         # remove notes which have start_time >= end_time
         instrument.remove_invalid_notes()
+        if len(instrument.notes) == 0:
+            continue
 
-        time_idx: List[int] = []
-        pitch_val: List[float] = []
-        conf_val: List[float] = []
-        for note in instrument.notes:
-            has_data = True
-            # index into times
-            this_idx = range(
-                _to_idx(note.start, time_hop), _to_idx(note.end, time_hop) + 1
-            )
-            time_idx.extend(this_idx)
-            pitch_val.extend([float(note.pitch) for _ in this_idx])
-            conf_val.extend([float(note.velocity) for _ in this_idx])
-
-        # look up any pitch bend information
-        do_pb = pitch_bend and len(instrument.pitch_bends) > 0
-        pb_idx = (
-            [_to_idx(p.time, time_hop) for p in instrument.pitch_bends] if do_pb else []
-        )
-        pb_shifts = (
-            [
-                pretty_midi.utilities.pitch_bend_to_semitones(p.pitch)
-                for p in instrument.pitch_bends
-            ]
-            if do_pb
-            else []
+        # index into times of every frame of every note, in note order
+        start_idx = _to_idx([note.start for note in instrument.notes], time_hop)
+        end_idx = _to_idx([note.end for note in instrument.notes], time_hop)
+        n_frames = end_idx - start_idx + 1
+        note_idx = np.repeat(np.arange(len(instrument.notes)), n_frames)
+        this_idx = (
+            np.arange(len(note_idx))
+            - np.repeat(np.cumsum(n_frames) - n_frames, n_frames)
+            + start_idx[note_idx]
         )
-
-        # add notes with optional pitch bend to the array
-        for t_idx, pv, cv in zip(time_idx, pitch_val, conf_val):
-            if t_idx in pb_idx:
-                pv += pb_shifts[pb_idx.index(t_idx)]
-            freqs_list[t_idx].append(pv)
-            confidence[t_idx].append(cv)
-
-    if not has_data:
+        this_pitch = np.array([note.pitch for note in instrument.notes], dtype=float)[
+            note_idx
+        ]
+        this_conf = np.array([note.velocity for note in instrument.notes], dtype=float)[
+            note_idx
+        ]
+
+        # shift the frames where a pitch bend occurs, using the first bend
+        # of each frame
+        if pitch_bend and len(instrument.pitch_bends) > 0:
+            pb_idx, pb_first = np.unique(
+                _to_idx([p.time for p in instrument.pitch_bends], time_hop),
+                return_index=True,
+            )
+            pb_shifts = pretty_midi.utilities.pitch_bend_to_semitones(
+                np.array([p.pitch for p in instrument.pitch_bends])
+            )[pb_first]
+            pos = np.minimum(np.searchsorted(pb_idx, this_idx), len(pb_idx) - 1)
+            is_bent = pb_idx[pos] == this_idx
+            this_pitch[is_bent] += pb_shifts[pos[is_bent]]
+
+        time_idx.append(this_idx)
+        pitch_val.append(this_pitch)
+        conf_val.append(this_conf)
+
+    if len(time_idx) == 0:
         return None
 
-    return annotations.MultiF0Data(
-        times, "s", freqs_list, "midi", confidence, "velocity"
+    # group the values by frame, keeping instrument and note order within frames
+    all_idx = np.concatenate(time_idx)
+    if np.any(all_idx >= len(times)):
+        raise IndexError("Note frames exceed the midi's duration")
+    order = np.argsort(all_idx, kind="stable")
+    offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(all_idx, minlength=len(times)))]
+    )
+    return annotations.MultiF0Data.from_arrays(
+        times,
+        "s",
+        np.concatenate(pitch_val)[order],
+        offsets,
+        "midi",
+        np.concatenate(conf_val)[order],
+        "velocity",
     )
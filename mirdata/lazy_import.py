@@ -0,0 +1,44 @@
+"""Deferred imports of heavy dependencies
+
+Modules imported with ``lazy_import`` are only executed when one of their
+attributes is first accessed, so that e.g. ``mirdata.initialize`` does not pay
+for importing pandas or music21 unless a dataset actually uses them.
+
+Note that type annotations are evaluated at import time: annotations using a
+lazily imported module must be written as strings, e.g.
+``-> "pretty_midi.PrettyMIDI"``.
+
+"""
+
+import importlib.util
+import sys
+import threading
+
+_LOCK = threading.Lock()
+
+
+def lazy_import(name):
+    """Import a module, deferring its execution until it is first used
+
+    Args:
+        name (str): the module's name, e.g. "pandas"
+
+    Raises:
+        ImportError: If the module is not installed
+
+    Returns:
+        module: the module, which is executed on first attribute access
+
+    """
+    with _LOCK:
+        if name in sys.modules:
+            return sys.modules[name]
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ImportError("No module named '{}'".format(name), name=name)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+        return module
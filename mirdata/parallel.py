@@ -0,0 +1,48 @@
+"""Helpers to run functions over many items in a pool of workers"""
+
+import concurrent.futures
+
+import tqdm
+
+
+def map_items(function, items, verbose, num_workers, executor):
+    """Apply function to every item, optionally in a pool of workers
+
+    Args:
+        function (function): function of one item. With executor="process", it
+            must be picklable
+        items (list): the items
+        verbose (bool): if True, shows a progress bar
+        num_workers (int or None): number of parallel workers. If None or 1,
+            items are processed sequentially in the calling thread
+        executor (str): "thread" or "process", the pool used if num_workers > 1
+
+    Raises:
+        ValueError: if executor is not one of "thread" or "process"
+
+    Returns:
+        list: the output of function for every item, in the same order as items
+
+    """
+    if num_workers is None or num_workers <= 1:
+        return [function(item) for item in tqdm.tqdm(items, disable=not verbose)]
+
+    if executor == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+        chunksize = 1
+    elif executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+        chunksize = max(1, len(items) // (4 * num_workers))
+    else:
+        raise ValueError(
+            "executor must be one of 'thread' or 'process', but got {}".format(executor)
+        )
+
+    with pool:
+        return list(
+            tqdm.tqdm(
+                pool.map(function, items, chunksize=chunksize),
+                total=len(items),
+                disable=not verbose,
+            )
+        )
@@ -1,18 +1,29 @@
 """Utility functions for mirdata"""
 
 import hashlib
+import json
 import logging
+import math
 import os
-import tqdm
+import random
 
-from smart_open import open
+from smart_open import open, parse_uri
 
+from mirdata import parallel
 
-def md5(file_path):
+# size of the chunks read from disk when computing checksums
+MD5_CHUNK_SIZE = 1024 * 1024
+
+# name of the checksum cache file, stored in the cache directory given to validate
+CHECKSUM_CACHE_FILENAME = ".mirdata_checksums.json"
+
+
+def md5(file_path, chunk_size=MD5_CHUNK_SIZE):
     """Get md5 hash of a file.
 
     Args:
         file_path (str): File path
+        chunk_size (int): number of bytes read from the file at a time
 
     Returns:
         str: md5 hash of data in file_path
@@ -20,7 +31,7 @@ def md5(file_path):
     """
     hash_md5 = hashlib.md5()
     with open(file_path, "rb", compression="disable") as fhandle:
-        for chunk in iter(lambda: fhandle.read(4096), b""):
+        for chunk in iter(lambda: fhandle.read(chunk_size), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
@@ -37,6 +48,123 @@ def log_message(message, verbose=True):
         logging.warning(message)
 
 
+class ChecksumCache(object):
+    """Persistent cache of verified checksums, stored as a sidecar file
+
+    Each entry records the md5 checksum of a file which was found valid,
+    together with the file's size and modification time (and optionally its
+    inode) at the time it was hashed. A file whose size, modification time or
+    inode changed since is hashed again.
+
+    Attributes:
+        cache_path (str or None): path to the cache file, or None if data_home
+            is not on the local filesystem, in which case nothing is cached
+        use_inode (bool): if True, the file's inode is part of its signature
+
+    """
+
+    def __init__(self, data_home, use_inode=False, load=True, cache_dir=None):
+        """ChecksumCache init method
+
+        Args:
+            data_home (str): path where the dataset lives
+            use_inode (bool): if True, the file's inode is part of its signature
+            load (bool): if False, ignore any existing cache file, so every file
+                is hashed again. The cache file is overwritten on save.
+            cache_dir (str or None): directory where the cache file is stored.
+                If None, it is stored in data_home
+
+        """
+        self.use_inode = use_inode
+        self._entries = {}
+        self._modified = False
+
+        if parse_uri(data_home).scheme != "file":
+            self.cache_path = None
+            return
+
+        self.cache_path = os.path.join(
+            data_home if cache_dir is None else cache_dir, CHECKSUM_CACHE_FILENAME
+        )
+        if load and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, encoding="utf-8") as fhandle:
+                    self._entries = json.load(fhandle)
+            except (IOError, ValueError):
+                logging.warning(
+                    "Ignoring unreadable checksum cache {}".format(self.cache_path)
+                )
+
+    def signature(self, local_path):
+        """Get the signature of a file on disk
+
+        Args:
+            local_path (str): file path
+
+        Returns:
+            list or None: [size, mtime_ns] or [size, mtime_ns, inode], or None if
+            the file can't be stat-ed
+
+        """
+        if self.cache_path is None:
+            return None
+        try:
+            stat = os.stat(local_path)
+        except OSError:
+            return None
+        if self.use_inode:
+            return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_valid(self, local_path, checksum):
+        """Check if a file was verified against checksum and didn't change since
+
+        Args:
+            local_path (str): file path
+            checksum (str): expected md5 checksum
+
+        Returns:
+            bool: True if the file doesn't need to be hashed again
+
+        """
+        entry = self._entries.get(os.path.abspath(local_path))
+        if entry is None or entry["md5"] != checksum:
+            return False
+        return entry["signature"] == self.signature(local_path)
+
+    def add(self, local_path, checksum, signature):
+        """Record that a file was verified
+
+        Args:
+            local_path (str): file path
+            checksum (str): the file's md5 checksum
+            signature (list): the file's signature before it was hashed
+
+        """
+        self._entries[os.path.abspath(local_path)] = {
+            "md5": checksum,
+            "signature": signature,
+        }
+        self._modified = True
+
+    def save(self):
+        """Write the cache file, if any entry was added since it was loaded"""
+        if self.cache_path is None or not self._modified:
+            return
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fhandle:
+                json.dump(self._entries, fhandle)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as exc:
+            logging.warning(
+                "Could not write checksum cache {}: {}".format(self.cache_path, exc)
+            )
+            return
+        self._modified = False
+
+
 def validate(local_path, checksum):
     """Validate that a file exists and has the correct checksum
 
@@ -65,22 +193,40 @@ def validate(local_path, checksum):
     return True, valid
 
 
-def validate_files(file_dict, data_home, verbose):
-    """Validate files
+def exists(local_path):
+    """Check that a file exists, without reading it
+
+    Args:
+        local_path (str): file path
+
+    Returns:
+        bool: True if file exists
+
+    """
+    if parse_uri(local_path).scheme == "file":
+        return os.path.isfile(local_path)
+    try:
+        with open(local_path):
+            pass
+    except IOError:
+        return False
+    return True
+
+
+def _file_checks(file_dict, data_home):
+    """List the (file_id, local_path, checksum) of every file in a tracks or
+    multitracks index
 
     Args:
         file_dict (dict): dictionary of file information
         data_home (str): path where the data lives
-        verbose (bool): if True, show progress
 
     Returns:
-        * dict - missing files
-        * dict - files with invalid checksums
+        list: tuples of (file_id, local_path, checksum)
 
     """
-    missing = {}
-    invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
+    checks = []
+    for file_id, file in file_dict.items():
         for tracks in file.keys():
             # multitrack case
             if tracks == "tracks":
@@ -91,103 +237,300 @@ def validate_files(file_dict, data_home, verbose):
                 checksum = file[tracks][1]
                 if filepath is not None:
                     local_path = os.path.join(data_home, filepath)
-                    exists, valid = validate(local_path, checksum)
-                    if not exists:
-                        if file_id not in missing.keys():
-                            missing[file_id] = []
-                        missing[file_id].append(local_path)
-                    elif not valid:
-                        if file_id not in invalid.keys():
-                            invalid[file_id] = []
-                        invalid[file_id].append(local_path)
+                    checks.append((file_id, local_path, checksum))
+    return checks
+
+
+def _metadata_checks(file_dict, data_home):
+    """List the (file_id, local_path, checksum) of every file in a metadata index
+
+    Args:
+        file_dict (dict): dictionary of file information
+        data_home (str): path where the data lives
+
+    Returns:
+        list: tuples of (file_id, local_path, checksum)
+
+    """
+    checks = []
+    for file_id, file in file_dict.items():
+        filepath = file[0]
+        checksum = file[1]
+        if filepath is not None:
+            local_path = os.path.join(data_home, filepath)
+            checks.append((file_id, local_path, checksum))
+    return checks
+
+
+def _validate_check(check):
+    """Run validate on a (file_id, local_path, checksum) tuple"""
+    return validate(check[1], check[2])
+
+
+def _exists_check(check):
+    """Check the existence of a (file_id, local_path, checksum) tuple's file,
+    without verifying its checksum"""
+    return exists(check[1]), True
+
 
+def _run_checks(checks, verbose, num_workers=1, executor="thread", checksum_cache=None):
+    """Validate a list of files, optionally in parallel
+
+    Args:
+        checks (list): tuples of (file_id, local_path, checksum)
+        verbose (bool): if True, show progress
+        num_workers (int): number of files validated in parallel. If 1, files
+            are validated one after another in the calling thread.
+        executor (str): either "thread" or "process", the kind of pool used
+            when num_workers > 1
+        checksum_cache (ChecksumCache or None): if given, files verified in the
+            cache are not hashed, and newly verified files are added to it
+
+    Returns:
+        list: (exists, valid) tuples, in the same order as checks
+
+    """
+    if checksum_cache is None:
+        return parallel.map_items(
+            _validate_check, checks, verbose, num_workers, executor
+        )
+
+    results = [(True, True)] * len(checks)
+    pending = [
+        i
+        for i, (_, local_path, checksum) in enumerate(checks)
+        if not checksum_cache.is_valid(local_path, checksum)
+    ]
+    # files are stat-ed before hashing so changes made while hashing are caught
+    signatures = [checksum_cache.signature(checks[i][1]) for i in pending]
+    pending_results = parallel.map_items(
+        _validate_check, [checks[i] for i in pending], verbose, num_workers, executor
+    )
+    for i, signature, result in zip(pending, signatures, pending_results):
+        results[i] = result
+        if result == (True, True) and signature is not None:
+            checksum_cache.add(checks[i][1], checks[i][2], signature)
+    return results
+
+
+def _summarize_checks(checks, results):
+    """Group the results of validated files by file_id
+
+    Args:
+        checks (list): tuples of (file_id, local_path, checksum)
+        results (list): (exists, valid) tuples, in the same order as checks
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    missing = {}
+    invalid = {}
+    for (file_id, local_path, _), (exists, valid) in zip(checks, results):
+        if not exists:
+            if file_id not in missing.keys():
+                missing[file_id] = []
+            missing[file_id].append(local_path)
+        elif not valid:
+            if file_id not in invalid.keys():
+                invalid[file_id] = []
+            invalid[file_id].append(local_path)
     return missing, invalid
 
 
-def validate_metadata(file_dict, data_home, verbose):
+def validate_files(file_dict, data_home, verbose, num_workers=1, executor="thread"):
     """Validate files
 
     Args:
         file_dict (dict): dictionary of file information
         data_home (str): path where the data lives
         verbose (bool): if True, show progress
+        num_workers (int): number of files validated in parallel
+        executor (str): "thread" or "process", the pool used if num_workers > 1
 
     Returns:
         * dict - missing files
         * dict - files with invalid checksums
 
     """
-    missing = {}
-    invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
-        filepath = file[0]
-        checksum = file[1]
-        if filepath is not None:
-            local_path = os.path.join(data_home, filepath)
-            exists, valid = validate(local_path, checksum)
-            if not exists:
-                if file_id not in missing.keys():
-                    missing[file_id] = []
-                missing[file_id].append(local_path)
-            elif not valid:
-                if file_id not in invalid.keys():
-                    invalid[file_id] = []
-                invalid[file_id].append(local_path)
+    checks = _file_checks(file_dict, data_home)
+    return _summarize_checks(
+        checks, _run_checks(checks, verbose, num_workers, executor)
+    )
 
-    return missing, invalid
 
+def validate_metadata(file_dict, data_home, verbose, num_workers=1, executor="thread"):
+    """Validate files
 
-def validate_index(dataset_index, data_home, verbose=True):
+    Args:
+        file_dict (dict): dictionary of file information
+        data_home (str): path where the data lives
+        verbose (bool): if True, show progress
+        num_workers (int): number of files validated in parallel
+        executor (str): "thread" or "process", the pool used if num_workers > 1
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums
+
+    """
+    checks = _metadata_checks(file_dict, data_home)
+    return _summarize_checks(
+        checks, _run_checks(checks, verbose, num_workers, executor)
+    )
+
+
+def validate_index(
+    dataset_index,
+    data_home,
+    verbose=True,
+    num_workers=1,
+    executor="thread",
+    checksum_cache=None,
+    mode="full",
+    sample_fraction=0.1,
+):
     """Validate files in a dataset's index
 
+    The files of all sections of the index (metadata, tracks and multitracks)
+    are validated together, sharing a single progress bar and, if
+    num_workers > 1, a single pool of workers.
+
+    Depending on mode, every file is hashed ("full"), only a random subset of
+    files is hashed and the existence of the rest is checked ("sample"), or
+    only the existence of files is checked ("exists"). Files which are not
+    hashed are never reported as having an invalid checksum.
+
     Args:
         dataset_index (list): dataset indices
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if true, prints validation status while running
+        num_workers (int): number of files validated in parallel. Hashing is
+            I/O bound and releases the GIL, so threads usually suffice.
+        executor (str): either "thread" (default) or "process", the kind of
+            pool used when num_workers > 1
+        checksum_cache (ChecksumCache or None): if given, files which were
+            verified before and did not change since are not hashed again, and
+            the cache is updated with the newly verified files
+        mode (str): one of "full" (default), "sample" or "exists"
+        sample_fraction (float): fraction of files hashed when mode="sample",
+            between 0 and 1
 
     Returns:
         * dict - file paths that are in the index but missing locally
         * dict - file paths with differing checksums
 
+    Raises:
+        ValueError: if mode or sample_fraction are invalid
+
     """
-    missing_files = {}
-    invalid_checksums = {}
+    if mode not in ["full", "sample", "exists"]:
+        raise ValueError(
+            "mode must be one of 'full', 'sample' or 'exists', but got {}".format(mode)
+        )
+    if mode == "sample" and not 0 < sample_fraction <= 1:
+        raise ValueError(
+            "sample_fraction must be in (0, 1], but got {}".format(sample_fraction)
+        )
+
+    sections = {}
 
     # check index
     if "metadata" in dataset_index and dataset_index["metadata"] is not None:
-        missing_metadata, invalid_metadata = validate_metadata(
-            dataset_index["metadata"], data_home, verbose
-        )
-        missing_files["metadata"] = missing_metadata
-        invalid_checksums["metadata"] = invalid_metadata
+        sections["metadata"] = _metadata_checks(dataset_index["metadata"], data_home)
 
     if "tracks" in dataset_index and dataset_index["tracks"] is not None:
-        missing_tracks, invalid_tracks = validate_files(
-            dataset_index["tracks"], data_home, verbose
-        )
-        missing_files["tracks"] = missing_tracks
-        invalid_checksums["tracks"] = invalid_tracks
+        sections["tracks"] = _file_checks(dataset_index["tracks"], data_home)
 
     if "multitracks" in dataset_index and dataset_index["multitracks"] is not None:
-        missing_multitracks, invalid_multitracks = validate_files(
-            dataset_index["multitracks"], data_home, verbose
+        sections["multitracks"] = _file_checks(dataset_index["multitracks"], data_home)
+
+    all_checks = [check for checks in sections.values() for check in checks]
+    if mode == "full":
+        hashed = range(len(all_checks))
+    elif mode == "sample":
+        n_hashed = math.ceil(sample_fraction * len(all_checks))
+        hashed = sorted(random.sample(range(len(all_checks)), n_hashed))
+    else:
+        hashed = []
+
+    hashed_set = set(hashed)
+    unhashed = [i for i in range(len(all_checks)) if i not in hashed_set]
+
+    all_results = [None] * len(all_checks)
+    hashed_results = _run_checks(
+        [all_checks[i] for i in hashed],
+        verbose,
+        num_workers,
+        executor,
+        checksum_cache,
+    )
+    for i, result in zip(hashed, hashed_results):
+        all_results[i] = result
+    unhashed_results = parallel.map_items(
+        _exists_check,
+        [all_checks[i] for i in unhashed],
+        verbose,
+        num_workers,
+        executor,
+    )
+    for i, result in zip(unhashed, unhashed_results):
+        all_results[i] = result
+
+    if checksum_cache is not None:
+        checksum_cache.save()
+
+    missing_files = {}
+    invalid_checksums = {}
+    start = 0
+    for section, checks in sections.items():
+        results = all_results[start : start + len(checks)]
+        start += len(checks)
+        missing_files[section], invalid_checksums[section] = _summarize_checks(
+            checks, results
         )
-        missing_files["multitracks"] = missing_multitracks
-        invalid_checksums["multitracks"] = invalid_multitracks
 
     return missing_files, invalid_checksums
 
 
-def validator(dataset_index, data_home, verbose=True):
+def validator(
+    dataset_index,
+    data_home,
+    verbose=True,
+    num_workers=1,
+    executor="thread",
+    full=False,
+    mode="full",
+    sample_fraction=0.1,
+    checksum_cache=None,
+    use_inode=False,
+):
     """Checks the existence and validity of files stored locally with
     respect to the paths and file checksums stored in the reference index.
     Logs invalid checksums and missing files.
 
+    If checksum_cache is given, checksums of valid files are cached in it (see
+    ChecksumCache), so only files which changed since the last validation are
+    hashed again.
+
     Args:
         dataset_index (list): dataset indices
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if True (default), prints missing and invalid files
             to stdout. Otherwise, this function is equivalent to validate_index.
+        num_workers (int): number of files validated in parallel
+        executor (str): "thread" or "process", the pool used if num_workers > 1
+        full (bool): if True, ignore the checksum cache and hash every file
+            which is validated
+        mode (str): "full" (default) to hash every file, "sample" to hash a
+            random subset of files, or "exists" to only check that files exist
+        sample_fraction (float): fraction of files hashed when mode="sample"
+        checksum_cache (str or None): directory where the checksums of valid
+            files are cached between validations. If None (default), nothing is
+            cached and every validated file is hashed
+        use_inode (bool): if True, a cached checksum is also invalidated when
+            the file's inode changes, e.g. when it is replaced by another file
 
     Returns:
         missing_files (list): List of file paths that are in the dataset index
@@ -197,7 +540,22 @@ def validator(dataset_index, data_home, verbose=True):
             checksum.
 
     """
-    missing_files, invalid_checksums = validate_index(dataset_index, data_home, verbose)
+    missing_files, invalid_checksums = validate_index(
+        dataset_index,
+        data_home,
+        verbose,
+        num_workers=num_workers,
+        executor=executor,
+        checksum_cache=(
+            None
+            if checksum_cache is None
+            else ChecksumCache(
+                data_home, use_inode=use_inode, load=not full, cache_dir=checksum_cache
+            )
+        ),
+        mode=mode,
+        sample_fraction=sample_fraction,
+    )
 
     # print path of any missing files
     has_any_missing_file = False
@@ -51,6 +51,12 @@ def test_load_score():
     assert isinstance(score, music21.stream.Score)
     assert len(score.parts) == 4
 
+    # each call returns its own copy of the cached score
+    score.remove(score.parts[0])
+    assert len(score.parts) == 3
+    assert len(haydn_op20.load_score(path).parts) == 4
+    assert haydn_op20.load_key(path).keys == ["Eb:major", "Bb:major"]
+
 
 def test_load_key():
     path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
@@ -125,3 +131,40 @@ def test_load_midi_path():
     midi_path = haydn_op20.convert_and_save_to_midi(path)
     assert isinstance(midi_path, str)
     assert midi_path == "tests/resources/mir_datasets/haydn_op20/op20n1-01.midi"
+
+
+def test_single_parse(mocker):
+    data_home = os.path.normpath("tests/resources/mir_datasets/haydn_op20")
+    track = haydn_op20.Dataset(data_home, version="test").track("0")
+    haydn_op20._load_parsed_score.cache_clear()
+    spy = mocker.spy(haydn_op20, "_parse_score")
+
+    track.score
+    track.keys
+    track.keys_music21
+    track.roman_numerals
+    track.chords
+    track.chords_music21
+    assert spy.call_count == 1
+
+
+def test_score_cache(tmpdir, mocker):
+    path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
+    cache_dir = os.path.join(str(tmpdir), "scores")
+    expected = haydn_op20.load_chords_music21(path)
+    try:
+        haydn_op20.set_score_cache(cache_dir)
+        haydn_op20._load_parsed_score.cache_clear()
+        haydn_op20.load_key(path)
+        assert len(os.listdir(cache_dir)) == 1
+
+        # a new process would read the parsed score from the cache
+        haydn_op20._load_parsed_score.cache_clear()
+        spy = mocker.spy(haydn_op20, "_parse_score")
+        chords = haydn_op20.load_chords_music21(path)
+        spy.assert_not_called()
+        assert [c["time"] for c in chords] == [c["time"] for c in expected]
+        assert [c["chord"] for c in chords] == [c["chord"] for c in expected]
+    finally:
+        haydn_op20.set_score_cache(None)
+        haydn_op20._load_parsed_score.cache_clear()
@@ -1,5 +1,8 @@
 import os
+
+import numpy as np
 import pretty_midi
+import pytest
 
 from mirdata import annotations
 from mirdata.datasets import slakh
@@ -238,3 +241,31 @@ def test_multitrack():
         "Track00001-S09",
         "Track00001-S10",
     ]
+
+
+def test_iter_submix_by_group(mocker):
+    data_home = os.path.normpath("tests/resources/mir_datasets/slakh")
+    dataset = slakh.Dataset(data_home, version="test")
+    mtrack = dataset.multitrack("Track00001")
+    submixes, groups = mtrack.get_submix_by_group(["guitar", "drums", "asdf"])
+
+    spy = mocker.spy(slakh.Track, "load_audio_segment")
+    blocks = list(mtrack.iter_submix_by_group(["guitar", "drums", "asdf"], 0.3))
+    # 2 seconds of audio, in blocks of 0.3 seconds, each stem read once per block
+    assert len(blocks) == 7
+    assert spy.call_count == 7 * len(mtrack.track_ids)
+    for block in blocks:
+        assert list(block.keys()) == ["guitar", "drums", "asdf", "other"]
+        assert block["asdf"] is None
+    assert [block["drums"].shape for block in blocks] == [(1, 4800)] * 6 + [(1, 3200)]
+    for group in ["guitar", "drums", "other"]:
+        streamed = np.concatenate([block[group] for block in blocks], axis=-1)
+        assert np.allclose(streamed, submixes[group], atol=1e-6)
+
+    assert list(mtrack.iter_submix_by_group(["asdf"], 10.0))[0]["asdf"] is None
+
+    # a duration multiple of the block duration ends without an empty block
+    blocks = list(mtrack.iter_submix_by_group(["guitar"], 0.5))
+    assert [block["guitar"].shape for block in blocks] == [(1, 8000)] * 4
+    with pytest.raises(ValueError):
+        next(mtrack.iter_submix_by_group(["guitar"], 0))
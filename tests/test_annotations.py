@@ -2,6 +2,7 @@ import sys
 import pytest
 import mir_eval
 import numpy as np
+import scipy.sparse
 
 import mirdata
 from mirdata import annotations
@@ -274,6 +275,38 @@ def test_note_data():
     )
     assert np.allclose(matrix, expected)
 
+    matrix = note_data2.to_matrix(
+        time_scale, "s", frequency_scale, "hz", "likelihood", sparse=True
+    )
+    assert isinstance(matrix, scipy.sparse.csr_matrix)
+    expected = np.array(
+        [[0, 0, 0], [0, 0, 0], [0, 0.1, 0], [0, 0.1, 0], [0, 0.1, 0.2], [0, 0, 0.2]]
+    )
+    assert np.allclose(matrix.toarray(), expected)
+
+    # overlapping notes: as in the dense matrix, the last note wins
+    note_data3 = annotations.NoteData(
+        np.array([[0.0, 1.0], [0.5, 2.0]]),
+        "s",
+        np.array([90.0, 90.0]),
+        "hz",
+        np.array([0.3, 0.6]),
+        "likelihood",
+    )
+    dense = note_data3.to_matrix(time_scale, "s", frequency_scale, "hz", "likelihood")
+    matrix = note_data3.to_matrix(
+        time_scale, "s", frequency_scale, "hz", "likelihood", sparse=True
+    )
+    assert np.allclose(matrix.toarray(), dense)
+    assert np.allclose(dense[:, 1], [0.3, 0.6, 0.6, 0.6, 0.6, 0])
+
+    # notes outside of the time scale are dropped
+    sparse_index, conf = note_data3.to_sparse_index(
+        np.array([5.0, 6.0]), "s", frequency_scale, "hz"
+    )
+    assert sparse_index.shape == (0, 2)
+    assert conf.shape == (0,)
+
     # test to_multif0
     mf0_data = note_data2.to_multif0(0.5, "s")
     assert mf0_data.time_unit == "s"
@@ -322,6 +355,32 @@ def test_note_data():
     with pytest.raises(ValueError):
         mf0_data = note_data.to_multif0(0.5, "s", max_time=2.5)
 
+    # notes are sorted by start time, and repeated pitches in a frame are kept once
+    overlapping_notes = annotations.NoteData(
+        np.array([[1.0, 2.0], [0.0, 1.5], [0.5, 1.0]]),
+        "s",
+        np.array([100.0, 150.0, 100.0]),
+        "hz",
+        np.array([0.1, 0.4, 0.2]),
+        "likelihood",
+    )
+    mf0_data = overlapping_notes.to_multif0(0.5, "s")
+    assert mf0_data.frequency_list == [
+        [150.0],
+        [150.0, 100.0],
+        [150.0, 100.0],
+        [150.0, 100.0],
+        [100.0],
+    ]
+    assert mf0_data.confidence_list == [
+        [0.4],
+        [0.4, 0.2],
+        [0.4, 0.2],
+        [0.4, 0.1],
+        [0.1],
+    ]
+    assert np.array_equal(mf0_data.offsets, [0, 1, 3, 5, 7, 8])
+
     # test to mireval
     note_data = annotations.NoteData(
         intervals, "s", notes, "hz", np.array([0.0, 1.0, 1.0]), "binary"
@@ -687,6 +746,68 @@ def test_multif0_data():
     )
 
 
+def test_multif0_data_arrays():
+    times = np.array([1.0, 2.0, 3.0])
+    frequencies = [[100.0], [150.0, 120.0], []]
+    confidence = [[0.1], [0.4, 0.2], []]
+    f0_data = annotations.MultiF0Data(
+        times, "s", frequencies, "hz", confidence, "likelihood"
+    )
+    assert np.allclose(f0_data.frequency_values, [100.0, 150.0, 120.0])
+    assert np.allclose(f0_data.confidence_values, [0.1, 0.4, 0.2])
+    assert np.array_equal(f0_data.offsets, [0, 1, 3, 3])
+    # list views are built once, and rebuilt when the arrays are reassigned
+    assert f0_data.frequency_list is f0_data.frequency_list
+    assert f0_data.confidence_list is f0_data.confidence_list
+    assert type(f0_data.frequency_list[0]) is list
+    f0_data.frequency_values = np.array([200.0, 300.0, 240.0])
+    assert f0_data.frequency_list == [[200.0], [300.0, 240.0], []]
+    f0_data.offsets = np.array([0, 0, 1, 3])
+    assert f0_data.frequency_list == [[], [200.0], [300.0, 240.0]]
+    assert f0_data.confidence_list == [[], [0.1], [0.4, 0.2]]
+    f0_data.confidence_values = np.array([0.5, 0.6, 0.7])
+    assert f0_data.confidence_list == [[], [0.5], [0.6, 0.7]]
+
+    f0_data2 = annotations.MultiF0Data.from_arrays(
+        times,
+        "s",
+        np.array([100.0, 150.0, 120.0, 150.0]),
+        np.array([0, 1, 4, 4]),
+        "hz",
+        np.array([0.1, 0.4, 0.2, 0.3]),
+        "likelihood",
+    )
+    assert f0_data2.frequency_list == frequencies
+    assert f0_data2.confidence_list == confidence
+    assert np.array_equal(f0_data2.offsets, [0, 1, 3, 3])
+
+    f0_data3 = annotations.MultiF0Data.from_arrays(
+        times, "s", np.array([100.0]), np.array([0, 0, 0, 1]), "hz"
+    )
+    assert f0_data3.frequency_list == [[], [], [100.0]]
+    assert f0_data3.confidence_list is None
+
+    with pytest.raises(ValueError):
+        annotations.MultiF0Data.from_arrays(
+            times, "s", np.array([100.0]), np.array([0, 1, 1]), "hz"
+        )
+
+    with pytest.raises(ValueError):
+        annotations.MultiF0Data.from_arrays(
+            times, "s", np.array([100.0, 120.0]), np.array([0, 2, 1, 2]), "hz"
+        )
+
+    with pytest.raises(ValueError):
+        annotations.MultiF0Data.from_arrays(
+            times, "s", np.array([-100.0]), np.array([0, 1, 1, 1]), "hz"
+        )
+
+    with pytest.raises(ValueError):
+        annotations.MultiF0Data(
+            times, "s", frequencies, "hz", [[0.1], [0.4], []], "likelihood"
+        )
+
+
 def test_key_data():
     intervals = np.array([[1.0, 2.0], [1.5, 3.0], [2.0, 3.0]])
     keys = ["E:minor", "A", "G"]
@@ -880,6 +1001,17 @@ def test_closest_index():
     expected = np.array([-1, 1, -1, 0])
     assert np.array_equal(actual, expected)
 
+    # ties go to the lower index, repeated and unsorted targets are supported
+    input_array = np.array([4.0, 1.0, 3.0, 0.5, 9.0])[:, np.newaxis]
+    target_array = np.array([5.0, 3.0, 1.0, 3.0])[:, np.newaxis]
+    actual = annotations.closest_index(input_array, target_array)
+    expected = np.array([0, 2, 1, -1, -1])
+    assert np.array_equal(actual, expected)
+
+    target_array = np.array([2.0])[:, np.newaxis]
+    actual = annotations.closest_index(np.array([[2.0], [3.0]]), target_array)
+    assert np.array_equal(actual, np.array([0, -1]))
+
 
 def test_validate_array_like():
     with pytest.raises(ValueError):
@@ -0,0 +1,142 @@
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+
+from mirdata import binary_index, core
+
+INDEX_NAME = "acousticbrainz_genre_index_1.0_sample.json"
+
+
+@pytest.fixture
+def json_index_path(tmpdir):
+    json_path = os.path.join(str(tmpdir), INDEX_NAME)
+    shutil.copy(os.path.join("tests", "indexes", INDEX_NAME), json_path)
+    return json_path
+
+
+def _load_json(json_path):
+    with open(json_path, encoding="utf-8") as fhandle:
+        return json.load(fhandle)
+
+
+def test_write_and_load_binary_index(json_index_path, tmpdir):
+    binary_path = os.path.join(str(tmpdir), "index.bin")
+    assert binary_index.write_binary_index(json_index_path, binary_path) == binary_path
+
+    expected = _load_json(json_index_path)
+    index = binary_index.load_binary_index(binary_path)
+
+    assert set(index.keys()) == set(expected.keys())
+    assert index["version"] == expected["version"]
+    tracks = index["tracks"]
+    assert isinstance(tracks, binary_index.BinaryIndexSection)
+    assert len(tracks) == len(expected["tracks"])
+    assert list(tracks.keys()) == list(expected["tracks"].keys())
+    assert dict(tracks) == expected["tracks"]
+    for track_id, value in expected["tracks"].items():
+        assert track_id in tracks
+        assert tracks[track_id] == value
+
+    assert "not_a_track" not in tracks
+    assert 1 not in tracks
+    with pytest.raises(KeyError):
+        tracks["not_a_track"]
+
+
+def test_binary_index_multitracks(tmpdir):
+    json_path = os.path.join(str(tmpdir), "index.json")
+    expected = {
+        "version": "1.0",
+        "tracks": {},
+        "multitracks": {
+            "mt1": {"tracks": ["a", "b"], "mix": ["mix/mt1.wav", "abc"]},
+            "mt2": {"tracks": ["c"], "mix": [None, None]},
+        },
+        "metadata": {"meta": ["meta.csv", "def"]},
+    }
+    with open(json_path, "w", encoding="utf-8") as fhandle:
+        json.dump(expected, fhandle)
+
+    binary_path = os.path.join(str(tmpdir), "index.bin")
+    binary_index.write_binary_index(json_path, binary_path)
+    index = binary_index.load_binary_index(binary_path)
+
+    assert index["metadata"] == expected["metadata"]
+    assert len(index["tracks"]) == 0
+    assert list(index["tracks"]) == []
+    assert "a" not in index["tracks"]
+    assert dict(index["multitracks"]) == expected["multitracks"]
+
+
+def test_binary_index_invalid_key(tmpdir):
+    json_path = os.path.join(str(tmpdir), "index.json")
+    with open(json_path, "w", encoding="utf-8") as fhandle:
+        json.dump({"tracks": {"a\x00b": {}}}, fhandle)
+    with pytest.raises(ValueError):
+        binary_index.write_binary_index(json_path, json_path + ".bin")
+
+
+def test_binary_index_pickle(json_index_path, tmpdir):
+    binary_path = os.path.join(str(tmpdir), "index.bin")
+    binary_index.write_binary_index(json_index_path, binary_path)
+    tracks = binary_index.load_binary_index(binary_path)["tracks"]
+    unpickled = pickle.loads(pickle.dumps(tracks))
+    assert dict(unpickled) == dict(tracks)
+
+
+def test_is_binary_index_current(json_index_path, tmpdir):
+    binary_path = os.path.join(str(tmpdir), "index.bin")
+    assert not binary_index.is_binary_index_current(binary_path, json_index_path)
+
+    binary_index.write_binary_index(json_index_path, binary_path)
+    assert binary_index.is_binary_index_current(binary_path, json_index_path)
+
+    # modifying the json index makes the binary index stale
+    with open(json_index_path, "a", encoding="utf-8") as fhandle:
+        fhandle.write("\n")
+    assert not binary_index.is_binary_index_current(binary_path, json_index_path)
+
+    # a binary index without its json index is used as is
+    os.remove(json_index_path)
+    assert binary_index.is_binary_index_current(binary_path, json_index_path)
+
+    with open(binary_path, "wb") as fhandle:
+        fhandle.write(b"not an index")
+    assert not binary_index.is_binary_index_current(binary_path, json_index_path)
+
+
+def test_dataset_binary_index(json_index_path, tmpdir):
+    index = core.Index(filename=INDEX_NAME)
+    index.indexes_dir = str(tmpdir)
+    assert index.get_binary_path() == os.path.join(
+        str(tmpdir), "acousticbrainz_genre_index_1.0_sample.bin"
+    )
+
+    dataset = core.Dataset(
+        data_home="tests/resources/mir_datasets/acousticbrainz_genre",
+        name="test",
+        track_class=core.Track,
+        indexes={"default": "1.0", "1.0": index},
+    )
+    expected_track_ids = dataset.track_ids
+    assert isinstance(dataset._index["tracks"], dict)
+
+    assert dataset.build_binary_index() == index.get_binary_path()
+    assert isinstance(dataset._index["tracks"], binary_index.BinaryIndexSection)
+
+    track_id = expected_track_ids[0]
+    track = dataset.track(track_id)
+    assert track._track_paths == _load_json(json_index_path)["tracks"][track_id]
+    with pytest.raises(ValueError):
+        dataset.track("not_a_track")
+
+    dataset = core.Dataset(
+        data_home="tests/resources/mir_datasets/acousticbrainz_genre",
+        name="test",
+        track_class=core.Track,
+        indexes={"default": "1.0", "1.0": index},
+    )
+    assert dataset.track_ids == expected_track_ids
@@ -0,0 +1,155 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import mirdata
+from mirdata import annotations, cache
+from mirdata.datasets import beatles
+
+TRACK_ID = "0111"
+
+
+@pytest.fixture
+def data_home(tmpdir):
+    data_home = os.path.join(str(tmpdir), "beatles")
+    shutil.copytree(
+        os.path.join("tests", "resources", "mir_datasets", "beatles"), data_home
+    )
+    return data_home
+
+
+def _dataset(data_home, cache_dir):
+    dataset = beatles.Dataset(data_home, version="test")
+    dataset.set_annotation_cache(cache_dir)
+    return dataset
+
+
+def test_annotation_cache_roundtrip(data_home, tmpdir, mocker):
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    expected = beatles.Dataset(data_home, version="test").track(TRACK_ID).beats
+
+    beats = _dataset(data_home, cache_dir).track(TRACK_ID).beats
+    assert isinstance(beats, annotations.BeatData)
+    assert len(os.listdir(os.path.join(cache_dir, "beatles"))) == 1
+
+    # a new dataset object (e.g. in another process) reads from the cache
+    spy = mocker.spy(beatles, "load_beats")
+    cached_beats = _dataset(data_home, cache_dir).track(TRACK_ID).beats
+    spy.assert_not_called()
+    assert np.allclose(cached_beats.times, expected.times)
+    assert np.array_equal(cached_beats.positions, expected.positions)
+
+
+def test_annotation_cache_invalidation(data_home, tmpdir, mocker):
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    track = _dataset(data_home, cache_dir).track(TRACK_ID)
+    n_beats = len(track.beats.times)
+
+    # drop the last beat: the file's size changes, invalidating the entry
+    with open(track.beats_path) as fhandle:
+        lines = fhandle.read().splitlines()
+    with open(track.beats_path, "w") as fhandle:
+        fhandle.write("\n".join(lines[:-1]))
+
+    spy = mocker.spy(beatles, "load_beats")
+    beats = _dataset(data_home, cache_dir).track(TRACK_ID).beats
+    spy.assert_called_once()
+    assert len(beats.times) == n_beats - 1
+
+
+def test_annotation_cache_signature_once(data_home, tmpdir, mocker):
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    spy = mocker.spy(cache.AnnotationCache, "_signature")
+    track = _dataset(data_home, cache_dir).track(TRACK_ID)
+    track.beats
+    track.chords
+    track.key
+    # the track's files are stat-ed once, not once per annotation
+    assert spy.call_count == 1
+
+
+def test_annotation_cache_disabled(data_home, tmpdir):
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    dataset = _dataset(data_home, cache_dir)
+    dataset.set_annotation_cache(None)
+    dataset.track(TRACK_ID).beats
+    assert not os.path.exists(cache_dir)
+
+    dataset = mirdata.initialize(
+        "beatles", data_home=data_home, version="test", cache_dir=cache_dir
+    )
+    dataset.track(TRACK_ID).beats
+    assert os.path.exists(cache_dir)
+
+
+def test_annotation_cache_skips_non_annotations(data_home, tmpdir):
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    track = _dataset(data_home, cache_dir).track(TRACK_ID)
+    track.audio
+    assert not os.path.exists(cache_dir)
+
+
+def test_is_annotation():
+    beats = annotations.BeatData(
+        np.array([1.0, 2.0]), "s", np.array([1, 2]), "bar_index"
+    )
+    assert cache._is_annotation(beats)
+    assert cache._is_annotation({"a": beats, "b": None})
+    assert cache._is_annotation([beats])
+    assert not cache._is_annotation(None)
+    assert not cache._is_annotation({"a": None})
+    assert not cache._is_annotation([])
+    assert not cache._is_annotation("beats")
+    assert not cache._is_annotation({"a": beats, "b": 1})
+
+
+def test_audio_cache_eviction(tmpdir):
+    audio_cache = cache.AudioCache(str(tmpdir))
+    audio_paths = []
+    for i in range(3):
+        audio_path = os.path.join(str(tmpdir), "audio_{}.wav".format(i))
+        with open(audio_path, "w") as fhandle:
+            fhandle.write(str(i))
+        audio_paths.append(audio_path)
+
+    def _load(i):
+        return lambda: (np.full((1000,), i, dtype=np.float32), 44100)
+
+    for i, audio_path in enumerate(audio_paths):
+        audio, sr = audio_cache.get(audio_path, None, True, 0.0, None, _load(i))
+        assert sr == 44100
+    entry_size = audio_cache.size() // 3
+
+    # entry 0 becomes the most recently used one
+    os.utime(
+        audio_cache._entry_path(audio_paths[1], None, True, 0.0, None) + ".npy",
+        ns=(1, 1),
+    )
+    os.utime(
+        audio_cache._entry_path(audio_paths[2], None, True, 0.0, None) + ".npy",
+        ns=(2, 2),
+    )
+    audio, _ = audio_cache.get(audio_paths[0], None, True, 0.0, None, None)
+    assert np.all(audio == 0)
+
+    audio_cache.evict(2 * entry_size)
+    assert audio_cache.size() == 2 * entry_size
+    audio, _ = audio_cache.get(audio_paths[0], None, True, 0.0, None, None)
+    assert np.all(audio == 0)
+    audio, _ = audio_cache.get(audio_paths[1], None, True, 0.0, None, _load(5))
+    assert np.all(audio == 5)
+
+    # entries are invalidated when their source file changes
+    with open(audio_paths[0], "w") as fhandle:
+        fhandle.write("changed")
+    audio, _ = audio_cache.get(audio_paths[0], None, True, 0.0, None, _load(7))
+    assert np.all(audio == 7)
+
+    capped_cache = cache.AudioCache(str(tmpdir), max_size=entry_size)
+    capped_cache.get(audio_paths[2], 8000, True, 0.0, None, _load(2))
+    assert capped_cache.size() == entry_size
+
+    capped_cache.clear()
+    assert capped_cache.size() == 0
@@ -4,6 +4,7 @@ import numpy as np
 
 import mirdata
 from mirdata import core
+from mirdata.datasets import beatles
 from tests.test_utils import DEFAULT_DATA_HOME
 
 
@@ -64,6 +65,24 @@ def test_track():
         track_metadata_none._track_metadata
 
 
+def test_track_load_audio_segment():
+    dataset = beatles.Dataset("tests/resources/mir_datasets/beatles", version="test")
+    track = dataset.track("0111")
+    full_audio, full_sr = track.audio
+    audio, sr = track.load_audio_segment(1.0, 0.5)
+    assert sr == full_sr
+    first = int(1.0 * sr)
+    assert np.allclose(audio, full_audio[first : first + int(0.5 * sr)])
+
+    track.audio_path = None
+    assert track.load_audio_segment(1.0, 0.5) is None
+
+    index = {"tracks": {"a": {"annotation": ("asdf/asdd", "asdfasdfasdfasdf")}}}
+    track = core.Track("a", "tests/resources/mir_datasets", "test", index, None)
+    with pytest.raises(AttributeError):
+        track.load_audio_segment(1.0, 0.5)
+
+
 def test_track_repr():
     class TestTrack(core.Track):
         def __init__(self):
@@ -289,6 +308,63 @@ def test_dataset_errors():
         d._multitrack("a")
 
 
+def test_load_tracks_lazy(mocker):
+    dataset = beatles.Dataset("tests/resources/mir_datasets/beatles", version="test")
+    spy = mocker.spy(dataset, "_track")
+    tracks = dataset.load_tracks(lazy=True)
+    assert isinstance(tracks, core.LazyTracks)
+    assert spy.call_count == 0
+    assert len(tracks) == len(dataset.track_ids)
+    assert list(tracks) == dataset.track_ids
+    assert "0111" in tracks
+    assert "not_a_track" not in tracks
+    with pytest.raises(KeyError):
+        tracks["not_a_track"]
+
+    track = tracks["0111"]
+    assert isinstance(track, beatles.Track)
+    assert tracks["0111"] is track
+    assert spy.call_count == 1
+
+    # prefetched annotations are kept on the track objects
+    tracks.prefetch(keys=["0111"], num_workers=2)
+    for attribute in ["beats", "chords", "key", "sections"]:
+        assert attribute in track.__dict__
+    tracks.prefetch(keys=["0111"], attributes=["audio"])
+    with pytest.raises(KeyError):
+        tracks.prefetch(keys=["not_a_track"])
+
+    # in thread mode, every track is created once and stored
+    tracks = dataset.load_tracks(lazy=True)
+    spy.reset_mock()
+    tracks.prefetch(attributes=["beats"], num_workers=4)
+    assert spy.call_count == len(dataset.track_ids)
+    assert repr(tracks).endswith(
+        "{} of {} loaded)".format(len(dataset.track_ids), len(dataset.track_ids))
+    )
+    tracks.prefetch(attributes=["beats"], num_workers=4)
+    assert spy.call_count == len(dataset.track_ids)
+
+    tracks = dataset.load_tracks(lazy=True)
+    tracks.prefetch(
+        keys=["0111"], attributes=["beats"], num_workers=2, executor="process"
+    )
+    beats = tracks["0111"].__dict__["beats"]
+    assert np.allclose(beats.times, track.beats.times)
+    assert "chords" not in tracks["0111"].__dict__
+
+    with pytest.raises(ValueError):
+        tracks.prefetch(keys=["0111"], num_workers=2, executor="not_an_executor")
+
+    dataset = mirdata.initialize("phenicx_anechoic", version="test")
+    mtracks = dataset.load_multitracks(lazy=True)
+    assert list(mtracks) == dataset.mtrack_ids
+    mtrack = mtracks[dataset.mtrack_ids[0]]
+    assert isinstance(mtrack, core.MultiTrack)
+    mtracks.prefetch(num_workers=2, executor="process")
+    assert mtracks[dataset.mtrack_ids[0]] is mtrack
+
+
 def test_multitrack():
     index_tracks = {
         "tracks": {
@@ -492,6 +568,72 @@ def test_multitrack_mixing():
     assert mix.shape == (2, 100)
 
 
+def test_multitrack_mixing_engine(mocker):
+    signals = {
+        "a": np.random.uniform(-1, 1, (2, 100)),
+        "b": np.random.uniform(-1, 1, (2, 80)),
+        "c": np.random.uniform(-1, 1, (1, 100)),
+    }
+    loaded = []
+
+    class TestTrack(core.Track):
+        def __init__(
+            self, key, data_home="foo", dataset_name="foo", index=None, metadata=None
+        ):
+            self.key = key
+
+        @property
+        def f(self):
+            loaded.append(self.key)
+            return signals[self.key], 1000
+
+    class TestMultiTrack1(core.MultiTrack):
+        @property
+        def track_audio_property(self):
+            return "f"
+
+    index = {"multitracks": {"ab": {"tracks": ["a", "b", "c"]}}}
+    init_spy = mocker.spy(TestTrack, "__init__")
+    mtrack = TestMultiTrack1("ab", "foo", "test", index, TestTrack, lambda: None)
+
+    # track objects are created once, each stem is loaded once per mix
+    assert mtrack.tracks is mtrack.tracks
+    target = mtrack.get_target(
+        ["a", "b", "a"], weights=[0.5, 1.0, 0.25], enforce_length=False
+    )
+    assert init_spy.call_count == 3
+    assert loaded == ["a", "b"]
+    padded_b = np.pad(signals["b"], ((0, 0), (0, 20)))
+    expected = np.average(
+        [signals["a"], padded_b, signals["a"]], axis=0, weights=[0.5, 1.0, 0.25]
+    )
+    assert np.allclose(target, expected)
+
+    targets = mtrack._mix(
+        {"x": (["a", "b"], None), "y": (["b"], [2.0])},
+        average=False,
+        enforce_length=False,
+    )
+    assert loaded == ["a", "b", "a", "b"]
+    assert np.allclose(targets["x"], signals["a"] + padded_b)
+    assert np.allclose(targets["y"], 2 * signals["b"])
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "c"])
+
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"], weights=[1.0])
+
+    with pytest.raises(ValueError):
+        mtrack.get_target([])
+
+    # shorter tracks first: the mixture and scaling buffers grow
+    target = mtrack.get_target(
+        ["b", "a", "b"], weights=[0.5, 0.25, 2.0], average=False, enforce_length=False
+    )
+    assert np.allclose(target, 2.5 * padded_b + 0.25 * signals["a"])
+
+
 def test_multitrack_unequal_len():
     class TestTrack(core.Track):
         def __init__(
@@ -658,7 +800,7 @@ def test_multitrack_mono():
     assert np.max(np.abs(target1)) <= 2
 
 
-def test_dataset_splits():
+def test_dataset_splits(mocker):
     empty_dataset = core.Dataset(
         name="test", indexes={"default": core.Index("asdf.json")}
     )
@@ -767,3 +909,121 @@ def test_dataset_splits():
 
     splits = test_dataset.get_mtrack_splits()
     assert set(splits.keys()) == set(["train", "validation", "test", "omitted"])
+
+    # splits read from the metadata don't create tracks
+    test_dataset = mirdata.initialize(
+        "tinysol", data_home="tests/resources/mir_datasets/tinysol", version="test"
+    )
+    spy = mocker.spy(test_dataset, "_track")
+    splits = test_dataset.get_track_splits()
+    spy.assert_not_called()
+    expected_splits = {}
+    for track_id in test_dataset.track_ids:
+        fold = test_dataset.track(track_id).split
+        expected_splits.setdefault(fold, []).append(track_id)
+    assert splits == expected_splits
+
+
+def test_get_metadata_column():
+    dataset = mirdata.initialize(
+        "tinysol", data_home="tests/resources/mir_datasets/tinysol", version="test"
+    )
+    column = dataset.get_metadata_column("Fold")
+    assert isinstance(column, np.ndarray)
+    assert len(column) == len(dataset.track_ids)
+    for track_id, fold in zip(dataset.track_ids, column):
+        assert dataset.track(track_id).split == fold
+
+    column = dataset.get_metadata_column("not_a_field", ids=dataset.track_ids[:2])
+    assert column.dtype == object
+    assert column.tolist() == [None, None]
+
+    # values of different types are not converted
+    track_ids = dataset.track_ids[:2]
+    dataset._metadata = {track_ids[0]: {"label": "a"}, track_ids[1]: {"label": 1}}
+    column = dataset.get_metadata_column("label", ids=track_ids)
+    assert column.dtype == object
+    assert column.tolist() == ["a", 1]
+    column = dataset.get_metadata_column("label", ids=[track_ids[1], track_ids[1]])
+    assert column.dtype == int
+    assert column.tolist() == [1, 1]
+
+    dataset = mirdata.initialize("beatles", version="test")
+    with pytest.raises(AttributeError):
+        dataset.get_metadata_column("split")
+
+
+def test_metadata_table():
+    dataset = mirdata.initialize(
+        "tinysol", data_home="tests/resources/mir_datasets/tinysol", version="test"
+    )
+    table = dataset.metadata_table()
+    assert table is dataset.metadata_table()
+    assert set(table.index) == set(dataset.track_ids)
+    for track_id in dataset.track_ids:
+        track = dataset.track(track_id)
+        assert table.loc[track_id, "Fold"] == track.split
+        assert table.loc[track_id, "Family"] == track.family
+
+    selected = dataset.select_ids("Fold == 4 and Family == 'Strings'")
+    assert isinstance(selected, np.ndarray)
+    assert selected.tolist() == ["Cb-ord-A2-mf-2c-N"]
+    selected = dataset.select_ids(lambda table: table["Fold"] < 4)
+    assert selected.tolist() == ["Fl-ord-C4-mf-N-T14d"]
+    assert len(dataset.select_ids("Fold > 10")) == 0
+
+    dataset = mirdata.initialize("beatles", version="test")
+    with pytest.raises(AttributeError):
+        dataset.metadata_table()
+
+
+def test_delimited_id_index():
+    ids = [
+        "tagtraum#train#a1#b1#rock#rock---indie",
+        "tagtraum#validation#a2#b2#jazz#",
+        "allmusic#train#a3#b3#jazz#jazz---vocal",
+        "lastfm#train#a4#b4#",
+        "allmusic#validation#a5#b5#rock",
+        "benchmark#W_1#P_2",
+        "coveranalysis#W_1#P_3",
+    ]
+    id_index = core.DelimitedIdIndex(ids, delimiter="#")
+    search_keys = [
+        "#train#",
+        "#validation#",
+        "tagtraum#train#",
+        "allmusic#validation#",
+        "music#train#",
+        "#jazz#",
+        "#jazz",
+        "jazz#",
+        "rock---",
+        "a3#b3",
+        "benchmark#",
+        "#W_1#",
+        "nothing#here",
+        "#",
+        "",
+        "train",
+    ]
+    for search_key in search_keys:
+        expected = [i for i in ids if search_key in i]
+        assert id_index.search(search_key) == expected, search_key
+        # results are cached
+        assert id_index.search(search_key) == expected, search_key
+
+
+def test_track_memory():
+    # fields derived from the track id are not stored on the tracks
+    dataset = mirdata.initialize("acousticbrainz_genre", version="test")
+    track = dataset.track(dataset.track_ids[0])
+    for field in ["path", "genre", "mbid", "mbid_group", "split"]:
+        assert field not in track.__dict__
+    assert track.mbid == track.track_id.split("#")[2]
+
+    # tracks of a dataset share one metadata function
+    dataset = mirdata.initialize("tinysol", version="test")
+    track_ids = dataset.track_ids
+    assert (
+        dataset.track(track_ids[0])._metadata is dataset.track(track_ids[1])._metadata
+    )
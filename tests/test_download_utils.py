@@ -592,3 +592,404 @@ def test_zipped_index_exception_handling(mocker, tmpdir):
 
     # Should not raise exception, just log warning
     download_utils.downloader(str(tmpdir), index=index, remotes={"index": index_remote})
+
+
+@pytest.fixture
+def range_server():
+    """A local http server serving files from tests/resources which supports
+    Range requests, and records the Range header of every request"""
+    from pytest_localserver.http import WSGIServer
+
+    requests = []
+
+    def app(environ, start_response):
+        path = os.path.join("tests", "resources", environ["PATH_INFO"].lstrip("/"))
+        with open(path, "rb") as fhandle:
+            content = fhandle.read()
+        range_header = environ.get("HTTP_RANGE")
+        requests.append(range_header)
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(content):
+                start_response("416 Range Not Satisfiable", [])
+                return [b""]
+            start_response(
+                "206 Partial Content",
+                [
+                    ("Content-Length", str(len(content) - start)),
+                    (
+                        "Content-Range",
+                        "bytes {}-{}/{}".format(start, len(content) - 1, len(content)),
+                    ),
+                ],
+            )
+            return [content[start:]]
+        start_response("200 OK", [("Content-Length", str(len(content)))])
+        return [content]
+
+    server = WSGIServer(application=app)
+    server.start()
+    server.requests = requests
+    yield server
+    server.stop()
+
+
+def test_download_from_remote_resume(range_server, tmpdir, mocker):
+    remote = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=range_server.url + "/remote.wav",
+        checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+    )
+    with open("tests/resources/remote.wav", "rb") as fhandle:
+        content = fhandle.read()
+
+    # leave a partial download behind
+    partial_path = os.path.join(str(tmpdir), "remote.wav.part")
+    with open(partial_path, "wb") as fhandle:
+        fhandle.write(content[:40])
+
+    md5_spy = mocker.spy(download_utils, "md5")
+    download_path = download_utils.download_from_remote(
+        remote, str(tmpdir), False, False
+    )
+    assert range_server.requests == ["bytes=40-"]
+    assert not os.path.exists(partial_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+    # the checksum is computed while downloading
+    assert md5_spy.call_count == 0
+
+    # a complete partial file is not downloaded again
+    os.remove(download_path)
+    with open(partial_path, "wb") as fhandle:
+        fhandle.write(content)
+    download_utils.download_from_remote(remote, str(tmpdir), False, False)
+    assert range_server.requests[1:] == ["bytes={}-".format(len(content))]
+    assert not os.path.exists(partial_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+    # an invalid partial file as long as the file is downloaded from scratch
+    os.remove(download_path)
+    with open(partial_path, "wb") as fhandle:
+        fhandle.write(b"0" * len(content))
+    download_utils.download_from_remote(remote, str(tmpdir), False, False)
+    assert range_server.requests[2:] == ["bytes={}-".format(len(content)), None]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+    # force_overwrite discards partial downloads
+    with open(partial_path, "wb") as fhandle:
+        fhandle.write(b"garbage")
+    download_utils.download_from_remote(remote, str(tmpdir), True, False)
+    assert range_server.requests[4:] == [None]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == content
+
+
+def test_download_from_remote_no_range_support(httpserver, tmpdir):
+    httpserver.serve_content(open("tests/resources/remote.wav", "rb").read())
+    remote = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=httpserver.url,
+        checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+    )
+    # the server ignores the Range header and sends the whole file
+    with open(os.path.join(str(tmpdir), "remote.wav.part"), "wb") as fhandle:
+        fhandle.write(b"RIFF")
+    download_path = download_utils.download_from_remote(
+        remote, str(tmpdir), False, False
+    )
+    assert download_utils.md5(download_path) == remote.checksum
+
+
+def test_download_from_remote_retries(range_server, tmpdir, mocker):
+    remote = download_utils.RemoteFileMetadata(
+        filename="remote.wav",
+        url=range_server.url + "/remote.wav",
+        checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+    )
+    mocker.patch.object(download_utils.time, "sleep")
+    stream_to_file = download_utils._stream_to_file
+    calls = []
+
+    def flaky_stream_to_file(url, download_path, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            raise ConnectionResetError("connection dropped")
+        return stream_to_file(url, download_path, **kwargs)
+
+    mocker.patch.object(download_utils, "_stream_to_file", new=flaky_stream_to_file)
+    download_utils.download_from_remote(remote, str(tmpdir), False, False)
+    assert len(calls) == 2
+
+    mocker.patch.object(
+        download_utils,
+        "_stream_to_file",
+        side_effect=ConnectionResetError("connection dropped"),
+    )
+    with pytest.raises(ConnectionResetError):
+        download_utils.download_from_remote(remote, str(tmpdir), True, False)
+    assert download_utils._stream_to_file.call_count == (
+        download_utils.DOWNLOAD_RETRIES + 1
+    )
+
+
+def test_downloader_concurrent(range_server, tmpdir, mocker):
+    index = core.Index("asdf.json")
+    remotes = {
+        "wav": download_utils.RemoteFileMetadata(
+            filename="remote.wav",
+            url=range_server.url + "/remote.wav",
+            checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+        ),
+        "zip": download_utils.RemoteFileMetadata(
+            filename="remote.zip",
+            url=range_server.url + "/remote.zip",
+            checksum="7a31ccfa28bfa3fb112d16c96e9d9a89",
+        ),
+        "tar": download_utils.RemoteFileMetadata(
+            filename="remote.tar.gz",
+            url=range_server.url + "/remote.tar.gz",
+            checksum="9042f5eebdcd0b94aa7a3c9bf12dc51d",
+        ),
+    }
+    mock_zip = mocker.patch.object(download_utils, "download_zip_file")
+    mock_unzip = mocker.spy(download_utils, "unzip")
+    mock_untar = mocker.spy(download_utils, "untar")
+
+    save_dir = str(tmpdir)
+    download_utils.downloader(save_dir, index=index, remotes=remotes, num_workers=3)
+
+    mock_zip.assert_not_called()
+    mock_unzip.assert_called_once_with(
+        os.path.join(save_dir, "remote.zip"), cleanup=False, num_workers=1
+    )
+    mock_untar.assert_called_once_with(
+        os.path.join(save_dir, "remote.tar.gz"), cleanup=False
+    )
+    assert os.path.exists(os.path.join(save_dir, "remote.wav"))
+    assert not any(
+        f.endswith(download_utils.PARTIAL_SUFFIX) for f in os.listdir(save_dir)
+    )
+
+    wrong_remotes = {
+        "a": download_utils.RemoteFileMetadata(
+            filename="a.wav", url=range_server.url + "/remote.wav", checksum="1234"
+        ),
+        "b": download_utils.RemoteFileMetadata(
+            filename="b.wav",
+            url=range_server.url + "/remote.wav",
+            checksum="3f77d0d69dc41b3696f074ad6bf2852f",
+        ),
+    }
+    with pytest.raises(IOError):
+        download_utils.downloader(
+            save_dir, index=index, remotes=wrong_remotes, num_workers=2
+        )
+    # the other downloads complete before the error is raised
+    assert os.path.exists(os.path.join(save_dir, "b.wav"))
+
+
+def test_stream_untar(range_server, tmpdir, mocker):
+    remote = download_utils.RemoteFileMetadata(
+        filename="remote.tar.gz",
+        url=range_server.url + "/remote.tar.gz",
+        checksum="9042f5eebdcd0b94aa7a3c9bf12dc51d",
+    )
+    md5_spy = mocker.spy(download_utils, "md5")
+    untar_spy = mocker.spy(download_utils, "untar")
+    save_dir = str(tmpdir)
+
+    # the archive is not written to disk
+    download_utils.download_tar_file(
+        remote, save_dir, False, True, False, stream_extract=True
+    )
+    assert os.listdir(save_dir) == ["remote.wav"]
+    assert download_utils.md5(os.path.join(save_dir, "remote.wav")) == (
+        "3f77d0d69dc41b3696f074ad6bf2852f"
+    )
+    assert md5_spy.call_count == 1
+    untar_spy.assert_not_called()
+
+    # the archive is kept
+    _clean(save_dir)
+    download_utils.download_tar_file(
+        remote, save_dir, False, False, False, stream_extract=True
+    )
+    assert sorted(os.listdir(save_dir)) == ["remote.tar.gz", "remote.wav"]
+    assert download_utils.md5(os.path.join(save_dir, "remote.tar.gz")) == (
+        remote.checksum
+    )
+    untar_spy.assert_not_called()
+
+    # an existing archive is not downloaded again
+    download_utils.download_tar_file(
+        remote, save_dir, False, False, False, stream_extract=True
+    )
+    untar_spy.assert_called_once()
+
+    # invalid checksums are detected, and nothing is extracted. Existing files
+    # are kept
+    _clean(save_dir)
+    os.makedirs(save_dir)
+    existing_file = os.path.join(save_dir, "remote.wav")
+    with open(existing_file, "w") as fhandle:
+        fhandle.write("existing")
+    checksum = remote.checksum
+    remote.checksum = "1234"
+    with pytest.raises(IOError):
+        download_utils.stream_untar(remote, save_dir, True, False)
+    assert os.listdir(save_dir) == ["remote.wav"]
+    with open(existing_file) as fhandle:
+        assert fhandle.read() == "existing"
+    with pytest.warns(UserWarning):
+        download_utils.stream_untar(remote, save_dir, True, True)
+    assert os.listdir(save_dir) == ["remote.wav"]
+    assert download_utils.md5(existing_file) == "3f77d0d69dc41b3696f074ad6bf2852f"
+
+    # an interrupted streamed extraction falls back to a resumable download
+    _clean(save_dir)
+    remote.checksum = checksum
+
+    def interrupted_stream_untar(url, download_path, keep_archive, extract_dir):
+        with open(os.path.join(extract_dir, "partial.wav"), "wb") as fhandle:
+            fhandle.write(b"RIFF")
+        raise ConnectionResetError("connection dropped")
+
+    mocker.patch.object(
+        download_utils, "_stream_untar_once", side_effect=interrupted_stream_untar
+    )
+    download_utils.stream_untar(remote, save_dir, True, False)
+    assert os.listdir(save_dir) == ["remote.wav"]
+    assert untar_spy.call_count == 2
+
+    # other errors are raised, and the partial extraction is removed
+    _clean(save_dir)
+    download_utils._stream_untar_once.side_effect = ValueError("not retryable")
+    with pytest.raises(ValueError):
+        download_utils.stream_untar(remote, save_dir, True, False)
+    assert os.listdir(save_dir) == []
+
+
+def test_move_tree(tmpdir):
+    source_dir = os.path.join(str(tmpdir), "source")
+    target_dir = os.path.join(str(tmpdir), "target")
+    for root, paths in [
+        (source_dir, ["a/b/c.txt", "a/d.txt", "e.txt"]),
+        (target_dir, ["a/d.txt", "a/f.txt", "e/g.txt"]),
+    ]:
+        for path in paths:
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), "w") as fhandle:
+                fhandle.write(root)
+
+    download_utils._move_tree(source_dir, target_dir)
+    assert sorted(os.listdir(target_dir)) == ["a", "e", "e.txt"]
+    assert sorted(os.listdir(os.path.join(target_dir, "a"))) == [
+        "b",
+        "d.txt",
+        "f.txt",
+    ]
+    # existing files are replaced, other files are kept
+    with open(os.path.join(target_dir, "a", "d.txt")) as fhandle:
+        assert fhandle.read() == source_dir
+    with open(os.path.join(target_dir, "a", "f.txt")) as fhandle:
+        assert fhandle.read() == target_dir
+
+
+def test_downloader_stream_extract(mocker):
+    mock_tar = mocker.patch.object(download_utils, "download_tar_file")
+    mocker.patch.object(download_utils, "download_remotes", return_value={})
+    tar_remote = download_utils.RemoteFileMetadata(
+        filename="remote.tar.bz2", url="a", checksum="1234"
+    )
+    index = core.Index("asdf.json")
+    download_utils.downloader(
+        "a", index=index, remotes={"b": tar_remote}, stream_extract=True
+    )
+    mock_tar.assert_called_once_with(
+        tar_remote, "a", False, False, False, stream_extract=True
+    )
+    _clean("a")
+
+
+def test_extractall_chunked_and_parallel(tmpdir, mocker):
+    zip_path = os.path.join(str(tmpdir), "archive.zip")
+    contents = {
+        "a.txt": b"a" * 100000,
+        "sub/b.txt": b"b" * 10,
+        "sub/deeper/c.txt": b"",
+    }
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zfile:
+        zfile.writestr("sub/", b"")
+        for name, data in contents.items():
+            zfile.writestr(name, data)
+
+    # members are never read into memory as a whole
+    read_spy = mocker.spy(zipfile.ZipFile, "read")
+    for num_workers, out_name in [(1, "serial"), (3, "parallel")]:
+        out_dir = os.path.join(str(tmpdir), out_name)
+        with zipfile.ZipFile(zip_path, "r") as zfile:
+            download_utils.extractall_unicode(zfile, out_dir, num_workers=num_workers)
+        for name, data in contents.items():
+            with open(os.path.join(out_dir, name), "rb") as fhandle:
+                assert fhandle.read() == data
+    read_spy.assert_not_called()
+
+    download_utils.unzip(zip_path, cleanup=True, num_workers=2)
+    with open(os.path.join(str(tmpdir), "sub", "b.txt"), "rb") as fhandle:
+        assert fhandle.read() == contents["sub/b.txt"]
+    assert not os.path.exists(zip_path)
+
+
+def test_extract_archives(tmpdir, mocker):
+    mock_unzip = mocker.patch.object(download_utils, "unzip")
+    mock_untar = mocker.patch.object(download_utils, "untar")
+    download_utils.extract_archives(
+        {"a": "a.zip", "b": "b.tar.bz2", "c": "c.tar.bz2"}, True, 6
+    )
+    mock_unzip.assert_called_once_with("a.zip", cleanup=True, num_workers=2)
+    assert sorted(c.args[0] for c in mock_untar.call_args_list) == [
+        "b.tar.bz2",
+        "c.tar.bz2",
+    ]
+
+    mocker.resetall()
+    download_utils.extract_archives({"a": "a.zip"}, False, 4)
+    mock_unzip.assert_called_once_with("a.zip", cleanup=False, num_workers=4)
+
+
+def test_downloader_concurrent_unpack_directories(mocker):
+    mock_download_remotes = mocker.patch.object(download_utils, "download_remotes")
+    mock_extract = mocker.patch.object(download_utils, "extract_archives")
+    mock_move = mocker.patch.object(download_utils, "move_directory_contents")
+    mocker.patch.object(download_utils.os.path, "exists", return_value=True)
+    remotes = {
+        k: download_utils.RemoteFileMetadata(
+            filename="{}.tar.bz2".format(k),
+            url="a",
+            checksum="1234",
+            destination_dir="train",
+            unpack_directories=["train"],
+        )
+        for k in ["part1", "part2"]
+    }
+    mock_download_remotes.return_value = {
+        k: os.path.join("a", "train", "{}.tar.bz2".format(k)) for k in remotes
+    }
+    download_utils.downloader(
+        "a", index=core.Index("asdf.json"), remotes=remotes, num_workers=2
+    )
+    mock_extract.assert_called_once_with(mock_download_remotes.return_value, False, 2)
+    # the shared directory is unpacked once, after all archives are extracted
+    mock_move.assert_called_once_with(
+        os.path.join("a", "train", "train"), os.path.join("a", "train")
+    )
+
+
+def test_content_range_size():
+    assert download_utils._content_range_size({"Content-Range": "bytes */1234"}) == 1234
+    assert download_utils._content_range_size({"Content-Range": "bytes */*"}) is None
+    assert download_utils._content_range_size({}) is None
+    assert download_utils._content_range_size(None) is None
@@ -1,5 +1,12 @@
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
 import pytest
 
+import mirdata
 from mirdata import core
 from mirdata import initialize, list_datasets
 
@@ -19,3 +26,65 @@ def test_initialize():
 
     with pytest.raises(ValueError):
         initialize("asdfasdfasdfa")
+
+
+def test_dataset_registry():
+    # the static registry must list every module in mirdata/datasets
+    datasets_dir = os.path.join(os.path.dirname(mirdata.__file__), "datasets")
+    modules = sorted(m.name for m in pkgutil.iter_modules([datasets_dir]))
+    assert mirdata.DATASETS == modules
+
+
+# modules which must not be imported until a loader actually uses them
+HEAVY_MODULES = [
+    "h5py",
+    "librosa",
+    "music21",
+    "pandas",
+    "pretty_midi",
+    "scipy",
+    "soundfile",
+]
+
+IMPORTED_MODULES = """
+import json, sys, types
+{}
+print(json.dumps([
+    m for m in {} if isinstance(sys.modules.get(m), types.ModuleType)
+    and type(sys.modules[m]).__name__ != "_LazyModule"
+]))
+"""
+
+
+def _imported_modules(code, modules):
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORTED_MODULES.format(code, modules)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_lazy_imports():
+    # import time itself is measured by the asv benchmarks in benchmarks/
+    assert _imported_modules("import mirdata", HEAVY_MODULES) == []
+    assert _imported_modules("import mirdata.io", HEAVY_MODULES) == []
+
+    for dataset_name in [
+        "beatles",
+        "cipi",
+        "da_tacos",
+        "dagstuhl_choirset",
+        "haydn_op20",
+        "ikala",
+        "maestro",
+        "phenicx_anechoic",
+    ]:
+        imported = _imported_modules(
+            "import mirdata; mirdata.initialize({!r}, version='test')".format(
+                dataset_name
+            ),
+            HEAVY_MODULES,
+        )
+        assert imported == [], dataset_name
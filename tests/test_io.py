@@ -1,7 +1,9 @@
+import os
 import tempfile
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 
 import numpy as np
+import pretty_midi
 import pytest
 
 from mirdata import io
@@ -38,6 +40,49 @@ def test_load_notes_from_midi():
         io.load_notes_from_midi(None, None)
 
 
+def test_load_multif0_from_midi_pitch_bend(tmpdir):
+    midi = pretty_midi.PrettyMIDI()
+    piano = pretty_midi.Instrument(program=0)
+    piano.notes.append(pretty_midi.Note(80, 60, 0.0, 0.01))
+    piano.notes.append(pretty_midi.Note(90, 62, 0.005, 0.01))
+    piano.pitch_bends.append(pretty_midi.PitchBend(4096, 0.0))
+    # two bends in the same frame, only the first one is applied
+    piano.pitch_bends.append(pretty_midi.PitchBend(-8192, 0.005))
+    piano.pitch_bends.append(pretty_midi.PitchBend(4096, 0.005))
+    drums = pretty_midi.Instrument(program=0, is_drum=True)
+    drums.notes.append(pretty_midi.Note(100, 36, 0.0, 0.01))
+    bass = pretty_midi.Instrument(program=33)
+    bass.notes.append(pretty_midi.Note(70, 40, 0.002, 0.006))
+    midi.instruments.extend([piano, drums, bass])
+    midi_file = os.path.join(str(tmpdir), "pitch_bend.mid")
+    midi.write(midi_file)
+
+    multif0 = io.load_multif0_from_midi(midi_file)
+    assert len(multif0.times) == 8
+    assert multif0.frequency_list[:5] == [
+        [60.0],
+        [60.0, 40.0],
+        [60.0, 62.0, 40.0],
+        [60.0, 62.0, 40.0],
+        [60.0, 62.0],
+    ]
+    assert multif0.confidence_list[2] == [80.0, 90.0, 70.0]
+    assert multif0.frequency_list[5:] == [[], [], []]
+
+    multif0 = io.load_multif0_from_midi(midi_file, pitch_bend=True)
+    assert multif0.frequency_list[:3] == [[61.0], [60.0, 40.0], [58.0, 60.0, 40.0]]
+
+    multif0 = io.load_multif0_from_midi(midi_file, pitch_bend=True, skip_drums=False)
+    assert multif0.frequency_list[2] == [58.0, 60.0, 36.0, 40.0]
+    assert multif0.confidence_list[2] == [80.0, 90.0, 100.0, 70.0]
+
+    drums_only = pretty_midi.PrettyMIDI()
+    drums_only.instruments.append(drums)
+    drums_file = os.path.join(str(tmpdir), "drums.mid")
+    drums_only.write(drums_file)
+    assert io.load_multif0_from_midi(drums_file) is None
+
+
 def test_load_multif0_from_midi():
     midi_file = (
         "tests/resources/mir_datasets/slakh/babyslakh_16k/Track00001/MIDI/S08.mid"
@@ -129,3 +174,110 @@ def test_invalid_coerce_to_bytes_io():
 
     with pytest.raises(ValueError):
         func(123)
+
+
+AUDIO_FILE = (
+    "tests/resources/mir_datasets/beatles/audio/01_-_Please_Please_Me/"
+    + "11_-_Do_You_Want_To_Know_A_Secret.wav"
+)
+
+
+def test_load_audio_cache(tmpdir, mocker):
+    expected_audio, expected_sr = io.load_audio(AUDIO_FILE, sr=None, mono=True)
+    assert io.get_audio_cache() is None
+
+    io.set_audio_cache(str(tmpdir))
+    try:
+        assert io.get_audio_cache().cache_dir == str(tmpdir)
+        spy = mocker.spy(io.librosa, "load")
+        audio, sr = io.load_audio(AUDIO_FILE, sr=None, mono=True)
+        assert spy.call_count == 1
+        assert sr == expected_sr
+        assert np.allclose(audio, expected_audio)
+
+        # file handles are cached by their path
+        with open(AUDIO_FILE, "rb") as fhandle:
+            audio, sr = io.load_audio(fhandle, sr=None, mono=True)
+        assert spy.call_count == 1
+        assert sr == expected_sr
+        assert audio.dtype == np.float32
+        assert np.allclose(audio, expected_audio)
+
+        # different decoding parameters are different entries
+        audio, sr = io.load_audio(AUDIO_FILE, sr=8000, mono=True)
+        assert spy.call_count == 2
+        assert sr == 8000
+        audio, sr = io.load_audio(AUDIO_FILE, sr=None, mono=True, duration=0.5)
+        assert spy.call_count == 3
+        assert len(audio) == int(0.5 * expected_sr)
+
+        # file-like objects without a local path are never cached
+        with open(AUDIO_FILE, "rb") as fhandle:
+            io.load_audio(BytesIO(fhandle.read()), sr=None, mono=True)
+        assert spy.call_count == 4
+    finally:
+        io.set_audio_cache(None)
+    assert io.get_audio_cache() is None
+
+
+def test_load_audio_cache_mmap(tmpdir):
+    io.set_audio_cache(str(tmpdir), mmap=True)
+    try:
+        io.load_audio(AUDIO_FILE, sr=None, mono=True)
+        audio, _ = io.load_audio(AUDIO_FILE, sr=None, mono=True)
+        assert isinstance(audio, np.memmap)
+    finally:
+        io.set_audio_cache(None)
+
+
+def test_load_audio_segment():
+    full_audio, full_sr = io.load_audio(AUDIO_FILE, sr=None, mono=True)
+    audio, sr = io.load_audio_segment(AUDIO_FILE, 0.5, 0.25)
+    assert sr == full_sr
+    first = int(0.5 * sr)
+    assert np.allclose(audio, full_audio[first : first + int(0.25 * sr)])
+
+    audio, sr = io.load_audio_segment(AUDIO_FILE, 0.5, 0.25, sr=8000)
+    assert sr == 8000
+    assert len(audio) == 2000
+
+    # single-channel files have the same shape as with load_audio
+    full_audio, sr = io.load_audio(AUDIO_FILE, sr=None, mono=False)
+    audio, _ = io.load_audio_segment(AUDIO_FILE, 0.5, 0.25, mono=False)
+    assert full_audio.ndim == 1
+    assert audio.shape == (int(0.25 * sr),)
+    assert np.allclose(audio, full_audio[int(0.5 * sr) : int(0.75 * sr)])
+
+    stereo_file = (
+        "tests/resources/mir_datasets/brid/BRID_1.0/Data/Acoustic Mixtures/"
+        + "4 Instruments/[0001] M4-01-SA.wav"
+    )
+    audio, sr = io.load_audio_segment(stereo_file, 0.5, 0.25, mono=False)
+    assert audio.shape == (2, int(0.25 * sr))
+
+    # segments past the end of the file are truncated
+    audio, _ = io.load_audio_segment(AUDIO_FILE, 1000.0, 1.0)
+    assert len(audio) == 0
+
+    with pytest.raises(ValueError):
+        io.load_audio_segment(AUDIO_FILE, -1.0, 1.0)
+
+
+def test_load_audio_segment_compressed(tmpdir, mocker):
+    mp3_file = "tests/resources/mir_datasets/mtg_jamendo_autotagging_moodtheme/audios/48/948.mp3"
+    # decode as if libsndfile could not read mp3
+    mocker.patch.object(
+        io, "soundfile", mocker.Mock(SoundFile=mocker.Mock(side_effect=RuntimeError))
+    )
+    full_audio, full_sr = io.load_audio(mp3_file, sr=None, mono=True)
+    audio, sr = io.load_audio_segment(mp3_file, 0.5, 0.25)
+    assert sr == full_sr
+    assert len(audio) == int(0.25 * sr)
+
+    io.set_audio_cache(str(tmpdir))
+    try:
+        cached_audio, sr = io.load_audio_segment(mp3_file, 0.5, 0.25)
+    finally:
+        io.set_audio_cache(None)
+    first = int(0.5 * sr)
+    assert np.allclose(cached_audio, full_audio[first : first + int(0.25 * sr)])
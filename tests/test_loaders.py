@@ -314,6 +314,12 @@ def test_track():
             dataset.track("~faketrackid~?!")
 
 
+# properties computed from the track id, which do not need any data file
+TRACK_ID_PROPERTIES = {
+    "acousticbrainz_genre": ["genre", "mbid", "mbid_group", "path", "split"],
+}
+
+
 # This tests the case where there is no data in data_home.
 # It makes sure that the track can be initialized and the
 # attributes accessed, but that anything requiring data
@@ -345,6 +351,9 @@ def test_track_placeholder_case():
             ret = getattr(track_test, attr)
 
         for prop in track_data["properties"]:
+            if prop in TRACK_ID_PROPERTIES.get(dataset_name, []):
+                ret = getattr(track_test, prop)
+                continue
             with pytest.raises(Exception):
                 ret = getattr(track_test, prop)
 
@@ -0,0 +1,22 @@
+import pytest
+
+from mirdata import parallel
+
+
+def _square(value):
+    return value * value
+
+
+@pytest.mark.parametrize(
+    "num_workers,executor",
+    [(1, "thread"), (None, "thread"), (3, "thread"), (2, "process")],
+)
+def test_map_items(num_workers, executor):
+    items = list(range(20))
+    results = parallel.map_items(_square, items, False, num_workers, executor)
+    assert results == [item * item for item in items]
+
+
+def test_map_items_invalid_executor():
+    with pytest.raises(ValueError):
+        parallel.map_items(_square, [1, 2], False, 2, "not_an_executor")
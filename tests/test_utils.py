@@ -141,6 +141,55 @@ def test_validate_index(test_index, expected_missing, expected_inv_checksum):
     assert expected_missing == missing_files
     assert expected_inv_checksum == invalid_checksums
 
+    for executor in ["thread", "process"]:
+        missing_files, invalid_checksums = validate.validate_index(
+            test_index,
+            os.path.normpath("tests/resources/"),
+            verbose=False,
+            num_workers=2,
+            executor=executor,
+        )
+
+        assert expected_missing == missing_files
+        assert expected_inv_checksum == invalid_checksums
+
+
+def test_validate_parallel():
+    data_home = os.path.normpath("tests/resources/")
+    file_dict = {
+        "a": {
+            "audio": ["10161_chorus.wav", "3f77d0d69dc41b3696f074ad6bf2852f"],
+            "other": ["10161_verse.wav", "wrong_checksum"],
+        },
+        "b": {"audio": ["missing.wav", "3f77d0d69dc41b3696f074ad6bf2852f"]},
+        "mtrack": {"tracks": ["a", "b"], "mix": ["not_there.wav", "abc"]},
+    }
+    metadata_dict = {
+        "meta1": ["10161_verse.wav", "wrong_checksum"],
+        "meta2": [None, None],
+    }
+
+    expected = validate.validate_files(file_dict, data_home, False)
+    assert expected == (
+        {
+            "b": [os.path.join(data_home, "missing.wav")],
+            "mtrack": [os.path.join(data_home, "not_there.wav")],
+        },
+        {"a": [os.path.join(data_home, "10161_verse.wav")]},
+    )
+    assert expected == validate.validate_files(
+        file_dict, data_home, False, num_workers=3
+    )
+
+    expected = validate.validate_metadata(metadata_dict, data_home, False)
+    assert expected == ({}, {"meta1": [os.path.join(data_home, "10161_verse.wav")]})
+    assert expected == validate.validate_metadata(
+        metadata_dict, data_home, False, num_workers=2, executor="process"
+    )
+
+    with pytest.raises(ValueError):
+        validate.validate_files(file_dict, data_home, False, 2, executor="fork")
+
 
 @pytest.mark.parametrize(
     "missing_files,invalid_checksums",
@@ -174,4 +223,165 @@ def test_validator(mocker, mock_validate_index, missing_files, invalid_checksums
     m, c = validate.validator("foo", "bar", False)
     assert m == missing_files
     assert c == invalid_checksums
-    mock_validate_index.assert_called_once_with("foo", "bar", False)
+    mock_validate_index.assert_called_once_with(
+        "foo",
+        "bar",
+        False,
+        num_workers=1,
+        executor="thread",
+        checksum_cache=None,
+        mode="full",
+        sample_fraction=0.1,
+    )
+
+    validate.validator("foo", "bar", False, checksum_cache="baz", use_inode=True)
+    checksum_cache = mock_validate_index.call_args[1]["checksum_cache"]
+    assert isinstance(checksum_cache, validate.ChecksumCache)
+    assert checksum_cache.cache_path == os.path.join(
+        "baz", validate.CHECKSUM_CACHE_FILENAME
+    )
+    assert checksum_cache.use_inode
+
+
+def test_validate_index_modes(mocker):
+    data_home = os.path.normpath("tests/resources/")
+    index = {
+        "tracks": {
+            "a": {"audio": ["10161_chorus.wav", "wrong_checksum"]},
+            "b": {"audio": ["missing.wav", "3f77d0d69dc41b3696f074ad6bf2852f"]},
+            "c": {"audio": ["10161_verse.wav", "3f77d0d69dc41b3696f074ad6bf2852f"]},
+        }
+    }
+    missing = {"tracks": {"b": [os.path.join(data_home, "missing.wav")]}}
+    invalid = {"tracks": {"a": [os.path.join(data_home, "10161_chorus.wav")]}}
+    md5_spy = mocker.spy(validate, "md5")
+
+    assert validate.validate_index(index, data_home, False) == (missing, invalid)
+    assert md5_spy.call_count == 2
+
+    # exists mode never hashes files
+    assert validate.validate_index(index, data_home, False, mode="exists") == (
+        missing,
+        {"tracks": {}},
+    )
+    assert md5_spy.call_count == 2
+
+    # sampling every file is equivalent to a full validation
+    assert validate.validate_index(
+        index, data_home, False, mode="sample", sample_fraction=1.0
+    ) == (missing, invalid)
+    assert md5_spy.call_count == 4
+
+    # sampled mode hashes a subset of the files, but checks all of them exist
+    missing_files, invalid_checksums = validate.validate_index(
+        index, data_home, False, num_workers=2, mode="sample", sample_fraction=0.3
+    )
+    assert missing_files == missing
+    assert md5_spy.call_count in [4, 5]
+    assert invalid_checksums in [invalid, {"tracks": {}}]
+
+    with pytest.raises(ValueError):
+        validate.validate_index(index, data_home, False, mode="fast")
+    with pytest.raises(ValueError):
+        validate.validate_index(
+            index, data_home, False, mode="sample", sample_fraction=0
+        )
+
+
+def test_exists(mocker):
+    assert validate.exists(os.path.normpath("tests/resources/10161_chorus.wav"))
+    assert not validate.exists(os.path.normpath("tests/resources/missing.wav"))
+    assert not validate.exists(os.path.normpath("tests/resources"))
+
+    mocker.patch("mirdata.validate.open", new=mocker.mock_open(read_data=b""))
+    assert validate.exists("s3://bucket/file.wav")
+    mocker.patch("mirdata.validate.open", side_effect=IOError)
+    assert not validate.exists("s3://bucket/file.wav")
+
+
+def test_checksum_cache(mocker, tmpdir):
+    data_home = str(tmpdir.mkdir("data"))
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    with open(os.path.join(data_home, "a.wav"), "wb") as fhandle:
+        fhandle.write(b"audio1234")
+    index = {
+        "tracks": {
+            "a": {"audio": ["a.wav", "6dc00d1bac757abe4ea83308dde68aab"]},
+            "b": {"audio": ["b.wav", "6dc00d1bac757abe4ea83308dde68aab"]},
+        }
+    }
+    expected = ({"tracks": {"b": [os.path.join(data_home, "b.wav")]}}, {"tracks": {}})
+    md5_spy = mocker.spy(validate, "md5")
+
+    # nothing is cached by default
+    assert validate.validator(index, data_home, verbose=False) == expected
+    assert validate.validator(index, data_home, verbose=False) == expected
+    assert md5_spy.call_count == 2
+    assert os.listdir(data_home) == ["a.wav"]
+    assert not os.path.exists(cache_dir)
+
+    validate_kwargs = {"verbose": False, "checksum_cache": cache_dir}
+    assert validate.validator(index, data_home, **validate_kwargs) == expected
+    assert md5_spy.call_count == 3
+    cache_path = os.path.join(cache_dir, validate.CHECKSUM_CACHE_FILENAME)
+    assert os.path.exists(cache_path)
+    assert os.listdir(data_home) == ["a.wav"]
+
+    # unchanged files are not hashed again
+    assert validate.validator(index, data_home, **validate_kwargs) == expected
+    assert md5_spy.call_count == 3
+
+    # full validation hashes every file
+    assert (
+        validate.validator(index, data_home, full=True, **validate_kwargs) == expected
+    )
+    assert md5_spy.call_count == 4
+
+    # a modified file is hashed again
+    with open(os.path.join(data_home, "a.wav"), "wb") as fhandle:
+        fhandle.write(b"audio12345")
+    missing, invalid = validate.validator(index, data_home, **validate_kwargs)
+    assert invalid == {"tracks": {"a": [os.path.join(data_home, "a.wav")]}}
+    assert md5_spy.call_count == 5
+
+    # invalid files are not cached
+    validate.validator(index, data_home, **validate_kwargs)
+    assert md5_spy.call_count == 6
+
+
+def test_checksum_cache_signature(tmpdir):
+    data_home = str(tmpdir)
+    local_path = os.path.join(data_home, "a.wav")
+    with open(local_path, "wb") as fhandle:
+        fhandle.write(b"audio1234")
+
+    cache = validate.ChecksumCache(data_home)
+    assert cache.signature(os.path.join(data_home, "missing.wav")) is None
+    signature = cache.signature(local_path)
+    assert len(signature) == 2
+    assert signature[0] == 9
+    assert (
+        len(validate.ChecksumCache(data_home, use_inode=True).signature(local_path))
+        == 3
+    )
+
+    assert not cache.is_valid(local_path, "abc")
+    cache.add(local_path, "abc", signature)
+    assert cache.is_valid(local_path, "abc")
+    assert not cache.is_valid(local_path, "def")
+    cache.save()
+
+    assert validate.ChecksumCache(data_home).is_valid(local_path, "abc")
+    assert not validate.ChecksumCache(data_home, load=False).is_valid(local_path, "abc")
+
+    # corrupted cache files are ignored
+    with open(cache.cache_path, "w") as fhandle:
+        fhandle.write("{not json")
+    assert not validate.ChecksumCache(data_home).is_valid(local_path, "abc")
+
+    # remote data homes are not cached
+    remote_cache = validate.ChecksumCache("s3://bucket/data")
+    assert remote_cache.cache_path is None
+    assert remote_cache.signature(local_path) is None
+    remote_cache.add(local_path, "abc", [1, 2])
+    remote_cache.save()